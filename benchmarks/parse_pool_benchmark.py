@@ -0,0 +1,64 @@
+import os
+import time
+
+from helpers.html_parser_handler import HtmlParserHandler
+from helpers.parse_pool_handler import ParsePoolHandler
+
+# Run from the repository root: python -m benchmarks.parse_pool_benchmark
+#
+# The fixtures are synthetic webpages shaped like ESPN's ones (refer to parser_benchmark.py), the timings are indicative
+# only.
+
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'fixtures')
+REPEAT = 100
+WORKERS = [None, 1, 2, 4]
+
+SQUAD_PAGES = {
+    'synthetic_squad_barcelona_2020.html': (2020, 'Spanish LaLiga', 'Barcelona'),
+    'synthetic_squad_arsenal_2019.html': (2019, 'English Premier League', 'Arsenal'),
+}
+FIXTURES_PAGES = {
+    'synthetic_fixtures_20191026.html': '20191026',
+    'synthetic_fixtures_20200308.html': '20200308',
+    'synthetic_fixtures_error.html': '20200309',
+}
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIRECTORY, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def run(function, arguments):
+    start = time.perf_counter()
+    rows = list(ParsePoolHandler.parse_all(function, arguments))
+    return rows, time.perf_counter() - start
+
+
+# The recorded webpages stand in for a crawl, as if they had been fetched REPEAT times
+squad_arguments = [(read_fixture(name), *args) for name, args in SQUAD_PAGES.items()] * REPEAT
+fixtures_arguments = [(read_fixture(name), day) for name, day in FIXTURES_PAGES.items()] * REPEAT
+
+print(f'CPUs: {os.cpu_count()}, pages: {len(squad_arguments)} squads + {len(fixtures_arguments)} fixtures')
+print(f'{"Parser processes":<20}{"Squads/s":>12}{"Fixtures/s":>12}{"Speedup":>10}')
+
+expected_squads = expected_fixtures = baseline = None
+try:
+    for workers in WORKERS:
+        ParsePoolHandler.configure(workers)
+
+        squads, squads_elapsed = run(HtmlParserHandler.parse_squad_page, squad_arguments)
+        fixtures, fixtures_elapsed = run(HtmlParserHandler.parse_fixtures_page, fixtures_arguments)
+
+        # np.nan != np.nan, hence, the rows are compared through their representation
+        if workers is None:
+            expected_squads, expected_fixtures = repr(squads), fixtures
+            baseline = squads_elapsed + fixtures_elapsed
+        assert repr(squads) == expected_squads and fixtures == expected_fixtures, workers
+
+        name = 'in-process' if workers is None else str(workers)
+        speedup = baseline / (squads_elapsed + fixtures_elapsed)
+        print(f'{name:<20}{len(squads) / squads_elapsed:>12.1f}{len(fixtures) / fixtures_elapsed:>12.1f}'
+              f'{speedup:>9.2f}x')
+finally:
+    ParsePoolHandler.shutdown()
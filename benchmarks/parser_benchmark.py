@@ -0,0 +1,123 @@
+import datetime
+import os
+import re
+import timeit
+
+import bs4
+import numpy as np
+
+from helpers.date_time_handler import DateTimeHandler
+from helpers.html_parser_handler import HtmlParserHandler
+
+# Run from the repository root: python -m benchmarks.parser_benchmark
+#
+# The fixtures are synthetic webpages (5-17 KB) shaped like ESPN's squad and fixtures webpages, not recorded ones,
+# hence, the speedups printed here are indicative only, the gain on real ESPN webpages has not been measured.
+
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'fixtures')
+REPEAT = 200
+
+SQUAD_PAGES = {
+    'synthetic_squad_barcelona_2020.html': (2020, 'Spanish LaLiga', 'Barcelona'),
+    'synthetic_squad_arsenal_2019.html': (2019, 'English Premier League', 'Arsenal'),
+}
+FIXTURES_PAGES = {
+    'synthetic_fixtures_20191026.html': '20191026',
+    'synthetic_fixtures_20200308.html': '20200308',
+    'synthetic_fixtures_error.html': '20200309',
+}
+
+
+def parse_squad_page_with_soup(html, season_year, league_name, club_name):
+    # The extraction used before HtmlParserHandler, a BeautifulSoup tree of the whole webpage
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+    tables = soup.find_all('table', attrs={'class': 'Table'})
+
+    if not tables or len(tables) != 2:
+        return [[], []]
+
+    result = []
+    for x in np.arange(0, 2):
+        data = []
+        for row in tables[x].find_all('tr'):
+            cols = [ele.text.strip() for ele in row.find_all('td')]
+            if cols:
+                buff = [str(season_year), league_name, club_name] + [ele for ele in cols if ele]
+                number_list = re.findall(r'\d+$', buff[3])
+                if number_list:
+                    buff.insert(4, number_list[0])
+                    buff[3] = re.findall(r'^([^0-9]*)', buff[3])[0]
+                else:
+                    buff.insert(4, np.nan)
+                data.append(buff)
+        result.append(data)
+
+    return result
+
+
+def parse_fixtures_page_with_soup(html, day):
+    # The extraction used before HtmlParserHandler, a BeautifulSoup tree of the whole webpage
+    soup = bs4.BeautifulSoup(html, 'html.parser')
+
+    if soup.find('h1', {'class': 'Error404__Title'}) is not None:
+        return None
+
+    data = []
+    for table in soup.find_all('tbody'):
+        for row in table.find_all('tr'):
+            cols = row.find_all('td')
+            if cols:
+                arr = [DateTimeHandler.year_month_day_to_date(day)]
+                for col in np.arange(0, len(cols)):
+                    if cols[col].find('small'):
+                        continue
+                    if col == 0:
+                        arr.append(cols[col].find('span').text)
+                        arr.append(cols[col].find_all('a')[-1].text)
+                    elif col == 1:
+                        arr.append(cols[col].find_all('span')[-1].text)
+                    elif col == 2:
+                        if cols[col].get('data-date'):
+                            date = datetime.datetime.strptime(cols[col].get('data-date'), '%Y-%m-%dT%H:%MZ')
+                            arr.append('{:d}:{:02d}'.format(date.hour, date.minute))
+                        else:
+                            arr.append(cols[col].find('a').text)
+                    else:
+                        arr.append(cols[col].text)
+                data.append(arr)
+
+    return list(filter(lambda x: len(x) != 1, data))
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIRECTORY, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def per_page_milliseconds(function, *args):
+    return min(timeit.repeat(lambda: function(*args), number=REPEAT, repeat=3)) / REPEAT * 1000
+
+
+def equal_rows(first, second):
+    # np.nan != np.nan, hence, the rows are compared through their representation
+    return repr(first) == repr(second)
+
+
+print(f'{"Page":<38}{"Soup (ms)":>12}{"lxml (ms)":>12}{"Speedup":>10}')
+
+for name, (season_year, league_name, club_name) in SQUAD_PAGES.items():
+    html = read_fixture(name)
+    args = (html, season_year, league_name, club_name)
+    assert equal_rows(parse_squad_page_with_soup(*args), HtmlParserHandler.parse_squad_page(*args)), name
+
+    before = per_page_milliseconds(parse_squad_page_with_soup, *args)
+    after = per_page_milliseconds(HtmlParserHandler.parse_squad_page, *args)
+    print(f'{name:<38}{before:>12.3f}{after:>12.3f}{before / after:>9.1f}x')
+
+for name, day in FIXTURES_PAGES.items():
+    html = read_fixture(name)
+    assert parse_fixtures_page_with_soup(html, day) == HtmlParserHandler.parse_fixtures_page(html, day), name
+
+    before = per_page_milliseconds(parse_fixtures_page_with_soup, html, day)
+    after = per_page_milliseconds(HtmlParserHandler.parse_fixtures_page, html, day)
+    print(f'{name:<38}{before:>12.3f}{after:>12.3f}{before / after:>9.1f}x')
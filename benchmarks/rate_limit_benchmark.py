@@ -0,0 +1,58 @@
+import contextlib
+import datetime
+import io
+import time
+
+import pandas as pd
+
+from benchmarks.stand_in_server import StandInServer
+from helpers.rate_limit_handler import RateLimitHandler
+from providers.sports_scraper import SportsScraper
+
+# Run from the repository root: python -m benchmarks.rate_limit_benchmark
+
+START_DATE = datetime.date(2020, 1, 1)
+END_DATE = datetime.date(2020, 8, 31)
+WORKERS = 8
+CAPACITY = 20
+
+
+def run(server):
+    SportsScraper.FIXTURES_URL = server.url('/football/fixtures/_/date/{day}')
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = SportsScraper.scrap_matches(start_date=START_DATE, end_date=END_DATE, workers=WORKERS)
+    return df, time.perf_counter() - start
+
+
+# Reference result, served without any capacity
+server = StandInServer(latency=0.02).start()
+try:
+    expected_df, _ = run(server)
+finally:
+    server.stop()
+
+print(f'Days: {(END_DATE - START_DATE).days + 1}, workers: {WORKERS}, server capacity: {CAPACITY} requests/s')
+print(f'{"Scheduling":<24}{"Time (s)":>10}{"Pages/s":>10}{"429s":>8}{"Final rate":>12}')
+
+for name, enable in [('Backoff only', False), ('Adaptive token bucket', True)]:
+    if enable:
+        RateLimitHandler.enable()
+    else:
+        RateLimitHandler.disable()
+
+    server = StandInServer(latency=0.02, capacity=CAPACITY).start()
+    try:
+        df, elapsed = run(server)
+    finally:
+        server.stop()
+
+    # No day may be lost to throttling
+    pd.testing.assert_frame_equal(expected_df, df)
+
+    rates = RateLimitHandler.get_rates()
+    final_rate = f'{max(rates.values()):.1f}' if rates else '-'
+    print(f'{name:<24}{elapsed:>10.2f}{server.served / elapsed:>10.1f}{server.throttled:>8}{final_rate:>12}')
+
+RateLimitHandler.disable()
@@ -0,0 +1,79 @@
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.stand_in_server import StandInServer
+from helpers.http_handler import HttpHandler
+from helpers.replay_archive_handler import ReplayArchiveHandler
+from providers.sports_scraper import SportsScraper
+
+# Run from the repository root: python -m benchmarks.replay_benchmark
+
+LEAGUES = ['Spanish LaLiga', 'English Premier League']
+SEASON_YEARS = [2019, 2020]
+START_DATE = datetime.date(2020, 1, 1)
+END_DATE = datetime.date(2020, 3, 31)
+CONCURRENCY = 8
+WORKERS = 4
+LATENCIES = [0.0, 0.02]
+
+
+def crawl():
+    SportsScraper.clear_cache()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        leagues = [(x.url, x.name) for x in SportsScraper.scrap_leagues()]
+        clubs = [(x.club_id, x.name, x.league.url) for x in SportsScraper.get_clubs()]
+        players = SportsScraper.scrap_players(season_years=SEASON_YEARS, leagues=LEAGUES, concurrency=CONCURRENCY)
+        matches = SportsScraper.scrap_matches(start_date=START_DATE, end_date=END_DATE, workers=WORKERS)
+    return (leagues, clubs, players, matches), time.perf_counter() - start
+
+
+def requests_sent():
+    return HttpHandler.get_statistics()['requests']
+
+
+with tempfile.TemporaryDirectory() as directory:
+    archive = os.path.join(directory, 'crawl.zip')
+
+    # The crawl is recorded once against the stand-in server, then replayed without it
+    server = StandInServer(latency=0.02).start()
+    SportsScraper.LEAGUES_URL = server.url('/soccer/teams')
+    SportsScraper.CLUBS_URL = server.url('/apis/site/v2/sports/soccer/{league_url}/teams')
+    SportsScraper.SQUAD_URL = server.url('/soccer/team/squad/_/id/{club_id}/league/{league_url}/season/{season_year}')
+    SportsScraper.FIXTURES_URL = server.url('/football/fixtures/_/date/{day}')
+
+    ReplayArchiveHandler.record(archive)
+    try:
+        (expected_leagues, expected_clubs, expected_players, expected_matches), recorded_time = crawl()
+        pages = len(ReplayArchiveHandler.get_urls())
+    finally:
+        ReplayArchiveHandler.stop()
+        server.stop()
+
+    print(f'Pages: {pages}, players: {len(expected_players)}, matches: {len(expected_matches)}, '
+          f'archive: {os.path.getsize(archive) / 1024 ** 2:.1f} MB')
+    print(f'{"Crawl":<24}{"Time (s)":>10}{"Pages/s":>10}{"Network requests":>18}')
+    print(f'{"Recorded (0.02s server)":<24}{recorded_time:>10.2f}{pages / recorded_time:>10.1f}{pages:>18}')
+
+    for latency in LATENCIES:
+        ReplayArchiveHandler.replay(archive, latency=latency)
+        sent = requests_sent()
+        try:
+            (leagues, clubs, players, matches), elapsed = crawl()
+        finally:
+            ReplayArchiveHandler.stop()
+
+        # The replayed crawl must be identical and must not reach the network
+        assert leagues == expected_leagues and clubs == expected_clubs
+        pd.testing.assert_frame_equal(expected_players, players)
+        pd.testing.assert_frame_equal(expected_matches, matches)
+
+        name = f'Replayed ({latency}s)'
+        print(f'{name:<24}{elapsed:>10.2f}{pages / elapsed:>10.1f}{requests_sent() - sent:>18}')
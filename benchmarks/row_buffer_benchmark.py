@@ -0,0 +1,52 @@
+import os
+import time
+
+import pandas as pd
+
+from helpers.html_parser_handler import HtmlParserHandler
+from models.row_buffer import RowBuffer
+
+# Run from the repository root: python -m benchmarks.row_buffer_benchmark
+
+PAGE_COUNTS = [250, 500, 1000, 2000]
+COLUMNS = ['YEAR', 'LEAGUE', 'CLUB', 'NAME', 'NUM', 'POS', 'AGE', 'HT', 'WT', 'NAT', 'APP', 'SUB',
+           'G', 'A', 'SH', 'ST', 'FC', 'FA', 'YC', 'RC']
+
+with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'squad_barcelona_2020.html'), 'r',
+          encoding='utf-8') as f:
+    _, page_rows = HtmlParserHandler.parse_squad_page(f.read(), 2020, 'Spanish LaLiga', 'Barcelona')
+
+
+def build_by_appending(pages):
+    # Equivalent of the former DataFrame.append accumulation, the whole frame is copied on each page
+    df = pd.DataFrame()
+    for _ in range(pages):
+        df = pd.concat([df, pd.DataFrame(page_rows)])
+    df.columns = COLUMNS
+    return df
+
+
+def build_with_row_buffer(pages):
+    buffer = RowBuffer(COLUMNS)
+    for _ in range(pages):
+        buffer.extend(page_rows)
+    return buffer.to_frame()
+
+
+def measure(function, pages):
+    start = time.perf_counter()
+    df = function(pages)
+    return df, time.perf_counter() - start
+
+
+print(f'Rows per page: {len(page_rows)}')
+print(f'{"Pages":>8}{"Rows":>10}{"Append (s)":>14}{"RowBuffer (s)":>16}{"Speedup":>10}')
+
+for pages in PAGE_COUNTS:
+    appended_df, append_time = measure(build_by_appending, pages)
+    buffered_df, buffer_time = measure(build_with_row_buffer, pages)
+
+    pd.testing.assert_frame_equal(appended_df.reset_index(drop=True), buffered_df)
+
+    print(f'{pages:>8}{len(buffered_df):>10}{append_time:>14.3f}{buffer_time:>16.3f}'
+          f'{append_time / buffer_time:>9.1f}x')
@@ -0,0 +1,44 @@
+import contextlib
+import io
+import time
+
+import pandas as pd
+
+from benchmarks.stand_in_server import StandInServer
+from providers.sports_scraper import SportsScraper
+
+# Run from the repository root: python -m benchmarks.scrap_players_benchmark
+
+LEAGUES = ['Spanish LaLiga', 'English Premier League']
+SEASON_YEARS = [2018, 2019, 2020]
+CONCURRENCY = 16
+
+server = StandInServer(latency=0.05).start()
+SportsScraper.LEAGUES_URL = server.url('/soccer/teams')
+SportsScraper.SQUAD_URL = server.url('/soccer/team/squad/_/id/{club_id}/league/{league_url}/season/{season_year}')
+
+clubs = pd.read_csv('cached_clubs.csv', skiprows=1)
+clubs = clubs[clubs['league_name'].isin(LEAGUES)]['club_name'].unique().tolist()
+
+
+def run(concurrency):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = SportsScraper.scrap_players(season_years=SEASON_YEARS, leagues=LEAGUES, clubs=clubs,
+                                         fast_fetch_clubs=True, concurrency=concurrency)
+    return df, time.perf_counter() - start
+
+
+try:
+    sequential_df, sequential_time = run(None)
+    concurrent_df, concurrent_time = run(CONCURRENCY)
+finally:
+    server.stop()
+
+pd.testing.assert_frame_equal(sequential_df, concurrent_df)
+
+print(f'Squad pages:     {len(clubs) * len(SEASON_YEARS)}')
+print(f'Rows:            {len(sequential_df)}')
+print(f'Sequential:      {sequential_time:.2f} second(s)')
+print(f'Concurrent ({CONCURRENCY}): {concurrent_time:.2f} second(s)')
+print(f'Speedup:         {sequential_time / concurrent_time:.1f}x')
@@ -0,0 +1,248 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from models.token_bucket import TokenBucket
+
+
+class StandInServer:
+    """
+    A local HTTP server which mimics the ESPN webpages consumed by the scraper.
+
+    Attributes
+    ----------
+        latency     Seconds waited before answering each request, emulates the network round trip
+        capacity    Number of requests per second answered, further requests are answered with 429 (unlimited if None)
+        bucket      Token bucket which enforces the capacity
+        served      Number of answered requests
+        throttled   Number of requests answered with 429
+        lock        Guards the counters
+        clubs       A dataframe of club id/name and league url/name served in the clubs API endpoint
+        leagues     A dataframe of league url/name served in the leagues webpage
+        server      The underlying HTTP server
+        thread      The thread which serves the requests
+
+    Methods
+    -------
+        __init__(self, latency=0.05, capacity=None):
+            Initializes the attributes.
+        start(self):
+            Starts serving the requests on a random local port.
+        stop(self):
+            Stops serving the requests.
+        url(self, path=''):
+            Builds the url of a path hosted by the server.
+        squad_page(club_id, league_url, season_year):
+            Generates a deterministic squad webpage for a club in a season.
+        fixtures_page(day):
+            Generates a deterministic fixtures webpage for a day.
+        leagues_page(leagues):
+            Generates the leagues webpage.
+        clubs_page(clubs, league_url):
+            Generates the clubs API response of a league.
+    """
+
+    def __init__(self, latency=0.05, capacity=None):
+        """
+        Initializes the attributes.
+
+        :param float latency: Specify the seconds waited before answering each request
+        :param float capacity: Specify the number of requests per second answered, further requests are answered with
+                               429 along with a Retry-After of one second (unlimited if None)
+        :return: The object itself
+        """
+
+        self.latency = latency
+        self.capacity = capacity
+        self.bucket = TokenBucket(capacity, max(int(capacity), 1)) if capacity is not None else None
+        self.served = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.clubs = pd.read_csv('cached_clubs.csv', skiprows=1)
+        self.leagues = self.clubs[['league_url', 'league_name']].drop_duplicates()
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """
+        Starts serving the requests on a random local port.
+
+        :return: The object itself
+        """
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(stand_in.latency)
+
+                if stand_in.bucket is not None and not stand_in.bucket.try_take():
+                    with stand_in.lock:
+                        stand_in.throttled += 1
+                    self.send_response(429)
+                    self.send_header('Retry-After', '1')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                with stand_in.lock:
+                    stand_in.served += 1
+
+                squad = re.match(r'^/soccer/team/squad/_/id/([^/]+)/league/([^/]+)/season/(\d+)$', self.path)
+                fixtures = re.match(r'^/football/fixtures/_/date/(\d{8})$', self.path)
+                clubs = re.match(r'^/apis/site/v2/sports/soccer/([^/]+)/teams$', self.path)
+                content_type = 'text/html; charset=utf-8'
+                if self.path == '/soccer/teams':
+                    body = StandInServer.leagues_page(stand_in.leagues)
+                elif clubs:
+                    body = StandInServer.clubs_page(stand_in.clubs, clubs.group(1))
+                    content_type = 'application/json; charset=utf-8'
+                elif squad:
+                    body = StandInServer.squad_page(squad.group(1), squad.group(2), int(squad.group(3)))
+                elif fixtures:
+                    body = StandInServer.fixtures_page(fixtures.group(1))
+                else:
+                    self.send_error(404)
+                    return
+
+                content = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops serving the requests.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def url(self, path=''):
+        """
+        Builds the url of a path hosted by the server.
+
+        :param str path: Specify the path of the url
+        :return: The url as str
+        """
+
+        return f'http://127.0.0.1:{self.server.server_port}{path}'
+
+    @staticmethod
+    def squad_page(club_id, league_url, season_year):
+        """
+        Generates a deterministic squad webpage for a club in a season.
+
+        :param str club_id: Specify the id of the club
+        :param str league_url: Specify the league url of the club
+        :param int season_year: Specify the season of the squad
+        :return: The webpage as str
+        """
+
+        rng = random.Random(f'{club_id}/{league_url}/{season_year}')
+        nationalities = ['Spain', 'England', 'France', 'Germany', 'Brazil', 'Argentina', 'Italy', 'Portugal']
+
+        def player(position, stats):
+            cells = [f'Player {rng.randint(1, 10 ** 6)}{rng.randint(1, 99)}',
+                     position,
+                     str(rng.randint(17, 38)),
+                     f'{rng.randint(5, 6)}\' {rng.randint(0, 11)}"',
+                     f'{rng.randint(130, 210)} lbs',
+                     rng.choice(nationalities)] + \
+                    [str(rng.randint(0, 40)) if rng.random() > 0.1 else '--' for _ in range(stats)]
+            return '<tr>' + ''.join(f'<td><span>{cell}</span></td>' for cell in cells) + '</tr>'
+
+        goalkeepers = ''.join(player('G', 9) for _ in range(rng.randint(2, 4)))
+        players = ''.join(player(rng.choice(['D', 'M', 'F']), 10) for _ in range(rng.randint(18, 26)))
+
+        return '<html><head><title>Squad</title></head><body>' \
+               '<nav>' + '<a href="#">Link</a>' * 200 + '</nav>' \
+               f'<table class="Table"><thead><tr><th>Name</th></tr></thead><tbody>{goalkeepers}</tbody></table>' \
+               f'<table class="Table"><thead><tr><th>Name</th></tr></thead><tbody>{players}</tbody></table>' \
+               '<footer>' + '<p>Footer</p>' * 100 + '</footer>' \
+               '</body></html>'
+
+    @staticmethod
+    def fixtures_page(day):
+        """
+        Generates a deterministic fixtures webpage for a day.
+
+        :param str day: Specify the day in %Y%m%d format
+        :return: The webpage as str
+        """
+
+        rng = random.Random(day)
+        clubs = ['Barcelona', 'Real Madrid', 'Arsenal', 'Chelsea', 'Bayern Munich', 'Juventus', 'Ajax Amsterdam',
+                 'Porto', 'Celtic', 'Valencia', 'Sevilla', 'Liverpool', 'Everton', 'Napoli', 'Lyon', 'Benfica']
+        cities = ['Barcelona, Spain', 'Madrid, Spain', 'London, England', 'Munich, Germany', 'Turin, Italy',
+                  'Amsterdam, Netherlands', 'Porto, Portugal', 'Glasgow, Scotland']
+
+        def match(elapsed):
+            club1, club2 = rng.sample(clubs, 2)
+            teams = f'<td><a><span>{club1}</span></a><a>{rng.randint(0, 4)} - {rng.randint(0, 4)}</a></td>' \
+                    f'<td><a><span>{club2}</span></a></td>' if elapsed else \
+                f'<td><a><span>{club1}</span></a><a>v</a></td><td><a><span>{club2}</span></a></td>'
+            if elapsed:
+                attendance = f'{rng.randint(1000, 99000):,}' if rng.random() > 0.2 else ''
+                details = f'<td><a>FT</a></td><td>{rng.choice(cities)}</td><td>{attendance}</td>'
+            else:
+                kick_off = f'{day[:4]}-{day[4:6]}-{day[6:]}T{rng.randint(10, 21)}:{rng.choice([0, 30]):02d}Z'
+                details = f'<td data-date="{kick_off}"><a>TBD</a></td><td>{rng.choice(["ESPN", "beIN", ""])}</td>'
+            return f'<tr>{teams}{details}</tr>'
+
+        tables = ''.join(
+            '<table><thead><tr><th>Match</th></tr></thead><tbody>' +
+            ''.join(match(rng.random() > 0.3) for _ in range(rng.randint(2, 10))) +
+            '</tbody></table>'
+            for _ in range(rng.randint(1, 6)))
+
+        return '<html><head><title>Fixtures</title></head><body>' \
+               '<nav>' + '<a href="#">Link</a>' * 200 + '</nav>' + tables + \
+               '<footer>' + '<p>Footer</p>' * 100 + '</footer>' \
+               '</body></html>'
+
+    @staticmethod
+    def leagues_page(leagues):
+        """
+        Generates the leagues webpage.
+
+        :param pd.DataFrame leagues: Specify the league url/name to be listed
+        :return: The webpage as str
+        """
+
+        options = ''.join(f'<option value="{row.league_url}">{row.league_name}</option>'
+                          for row in leagues.itertuples())
+
+        return f'<html><body><select class="dropdown__select">{options}</select></body></html>'
+
+    @staticmethod
+    def clubs_page(clubs, league_url):
+        """
+        Generates the clubs API response of a league.
+
+        :param pd.DataFrame clubs: Specify the club id/name and league url/name
+        :param str league_url: Specify the league url whose clubs are listed
+        :return: The JSON response as str
+        """
+
+        teams = [{'team': {'id': str(row.club_id), 'name': row.club_name}}
+                 for row in clubs[clubs['league_url'] == league_url].itertuples()]
+
+        return json.dumps({'sports': [{'leagues': [{'teams': teams}]}]})
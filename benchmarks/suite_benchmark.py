@@ -0,0 +1,234 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Run from the repository root: python -m benchmarks.suite_benchmark [--archive crawl.zip] [--output results.json]
+#                                                                    [--compare previous.json] [--latency 0.0]
+# The archive is recorded against the stand-in server if it does not exist, then every case is replayed from it in a
+# process of its own, hence, the peak RSS of a case is not inflated by the previous ones.
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LEAGUES = ['UEFA Champions League', 'English Premier League', 'German Bundesliga', 'Spanish LaLiga', 'French Ligue 1']
+SEASON_YEARS = [2019, 2020]
+START_DATE = datetime.date(2017, 1, 1)
+END_DATE = datetime.date(2020, 12, 31)
+CONCURRENCY = 8
+WORKERS = 4
+
+URL_ATTRIBUTES = ['LEAGUES_URL', 'CLUBS_URL', 'SQUAD_URL', 'FIXTURES_URL']
+
+
+def scrap_players():
+    from providers.sports_scraper import SportsScraper
+    return len(SportsScraper.scrap_players(season_years=SEASON_YEARS, leagues=LEAGUES, concurrency=CONCURRENCY))
+
+
+def scrap_matches():
+    from providers.sports_scraper import SportsScraper
+    return len(SportsScraper.scrap_matches(start_date=START_DATE, end_date=END_DATE, workers=WORKERS))
+
+
+def cache_players():
+    from providers.sports_scraper import SportsScraper
+    SportsScraper.cache_players(season_years=SEASON_YEARS, leagues=LEAGUES, concurrency=CONCURRENCY)
+
+
+def cache_matches():
+    from providers.sports_scraper import SportsScraper
+    SportsScraper.cache_matches(start_date=START_DATE, end_date=END_DATE, workers=WORKERS)
+
+
+def load_players():
+    from providers.sports_scraper import SportsScraper
+    return len(SportsScraper.scrap_players(fast_fetch=True))
+
+
+def load_matches():
+    from providers.sports_scraper import SportsScraper
+    return len(SportsScraper.scrap_matches(fast_fetch=True))
+
+
+def plot(name):
+    def run():
+        import matplotlib.pyplot as plt
+        from providers.plots_provider import PlotsProvider
+
+        getattr(PlotsProvider, name)()
+        plt.close('all')
+
+    return run
+
+
+# Each case returns the number of rows it produced (None if it does not produce any), the cache cases store the
+# snapshots which the load and plot cases read
+CASES = {
+    'scrap_players': scrap_players,
+    'scrap_matches': scrap_matches,
+    'cache_players': cache_players,
+    'cache_matches': cache_matches,
+    'load_players': load_players,
+    'load_matches': load_matches,
+    'plot_matches_result_between_barcelona_real_madrid': plot('matches_result_between_barcelona_real_madrid'),
+    'plot_matches_occurrences_from_2017_to_2020': plot('plot_matches_occurrences_from_2017_to_2020'),
+    'plot_attendance_time_series': plot('plot_attendance_time_series'),
+    'plot_top_scorer_in_leagues_2020': plot('top_scorer_in_leagues_2020'),
+    'plot_players_columns_correlation': plot('plot_players_columns_correlation'),
+}
+
+
+def record_archive(archive):
+    from benchmarks.stand_in_server import StandInServer
+    from helpers.replay_archive_handler import ReplayArchiveHandler
+    from providers.sports_scraper import SportsScraper
+
+    server = StandInServer(latency=0).start()
+    urls = {
+        'LEAGUES_URL': server.url('/soccer/teams'),
+        'CLUBS_URL': server.url('/apis/site/v2/sports/soccer/{league_url}/teams'),
+        'SQUAD_URL': server.url('/soccer/team/squad/_/id/{club_id}/league/{league_url}/season/{season_year}'),
+        'FIXTURES_URL': server.url('/football/fixtures/_/date/{day}'),
+    }
+    for attribute, url in urls.items():
+        setattr(SportsScraper, attribute, url)
+
+    ReplayArchiveHandler.record(archive, metadata={'urls': urls})
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scrap_players()
+            scrap_matches()
+    finally:
+        ReplayArchiveHandler.stop()
+        server.stop()
+
+
+def run_case(name, archive, latency):
+    import resource
+
+    # The plotting libraries are imported before the measurement, for every case alike
+    import matplotlib
+    matplotlib.use('Agg')
+    import providers.plots_provider
+
+    from helpers.replay_archive_handler import ReplayArchiveHandler
+    from helpers.stage_timer_handler import StageTimerHandler
+    from providers.sports_scraper import SportsScraper
+
+    ReplayArchiveHandler.replay(archive, latency=latency)
+    for attribute, url in ReplayArchiveHandler.get_metadata().get('urls', {}).items():
+        if attribute in URL_ATTRIBUTES:
+            setattr(SportsScraper, attribute, url)
+
+    StageTimerHandler.reset()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = CASES[name]()
+    elapsed = time.perf_counter() - start
+    ReplayArchiveHandler.stop()
+
+    stages = StageTimerHandler.get_timings()
+    pages = stages.get('fetch', {}).get('calls', 0)
+
+    # ru_maxrss is reported in bytes on macOS, in kilobytes elsewhere
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / 1024 ** 2 if sys.platform == 'darwin' else peak_rss / 1024
+
+    return {
+        'seconds': elapsed,
+        'pages': pages,
+        'rows': rows,
+        'pages_per_second': pages / elapsed if pages else None,
+        'rows_per_second': rows / elapsed if rows else None,
+        'peak_rss_mb': peak_rss_mb,
+        'stages': stages,
+    }
+
+
+def run_suite(archive, latency, cases):
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        # cache_players reads the clubs from the snapshot of the working directory
+        shutil.copy(os.path.join(REPOSITORY_DIRECTORY, 'cached_clubs.csv'), directory)
+        environment = {**os.environ, 'PYTHONPATH': REPOSITORY_DIRECTORY}
+
+        for name in cases:
+            output = subprocess.run([sys.executable, '-m', 'benchmarks.suite_benchmark', '--case', name,
+                                     '--archive', os.path.abspath(archive), '--latency', str(latency), '--isolated'],
+                                    cwd=directory, env=environment, capture_output=True, text=True, check=True)
+            results[name] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    return results
+
+
+def print_results(results, previous=None):
+    print(f'{"Case":<52}{"Time (s)":>10}{"Pages/s":>10}{"Rows/s":>12}{"RSS (MB)":>10}  Stages (s)')
+
+    for name, result in results.items():
+        pages_per_second = f'{result["pages_per_second"]:.1f}' if result['pages_per_second'] else '-'
+        rows_per_second = f'{result["rows_per_second"]:.0f}' if result['rows_per_second'] else '-'
+        stages = ', '.join(f'{stage} {timing["seconds"]:.2f}' for stage, timing in result['stages'].items())
+        print(f'{name:<52}{result["seconds"]:>10.2f}{pages_per_second:>10}{rows_per_second:>12}'
+              f'{result["peak_rss_mb"]:>10.1f}  {stages}')
+
+        if previous is not None and name in previous:
+            before = previous[name]
+            print(f'{"  vs previous":<52}{result["seconds"] / before["seconds"]:>9.2f}x{"":>22}'
+                  f'{result["peak_rss_mb"] / before["peak_rss_mb"]:>9.2f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the scraper against a recorded crawl.')
+    parser.add_argument('--archive', default='benchmark_crawl.zip',
+                        help='Recorded crawl, recorded against the stand-in server if it does not exist')
+    parser.add_argument('--output', default='benchmark_results.json', help='File in which the results are saved')
+    parser.add_argument('--compare', help='Results of a previous run to be compared against')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds waited before serving each response')
+    parser.add_argument('--case', choices=list(CASES), action='append',
+                        help='Case to be measured, may be repeated (all if omitted)')
+    parser.add_argument('--isolated', action='store_true', help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    # A single case measured within a process of its own, its results are printed as JSON for the parent process
+    if arguments.isolated:
+        print(json.dumps(run_case(arguments.case[0], arguments.archive, arguments.latency)))
+        return
+
+    if not os.path.exists(arguments.archive):
+        print(f'Recording {arguments.archive}...')
+        record_archive(arguments.archive)
+
+    results = run_suite(arguments.archive, arguments.latency, arguments.case or list(CASES))
+
+    previous = None
+    if arguments.compare:
+        with open(arguments.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)['cases']
+
+    print_results(results, previous)
+
+    with open(arguments.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'timestamp': datetime.datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'archive': os.path.abspath(arguments.archive),
+            'latency': arguments.latency,
+            'cases': results,
+        }, f, indent=2)
+
+    print(f'Results saved in {arguments.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import collections
+import concurrent.futures
+import time
+
+from helpers.http_handler import HttpHandler
+
+
+class AsyncFetchHandler:
+    """
+    Set of static methods that aid fetching multiple webpages concurrently.
+
+    Requests are sent over HttpHandler by a pool of threads, hence, every try (retries included) is scheduled by
+    RateLimitHandler if it is enabled.
+
+    Attributes
+    ----------
+
+    Methods
+    -------
+        fetch_all(urls, concurrency=16, window=None, timed=False):
+            Fetches a list of webpages concurrently, the responses are yielded in the same order as the urls.
+        __fetch_all(urls, concurrency, window, timed):
+            Submits the requests to a pool of threads, a window of requests is sent ahead of the one being consumed.
+        __timed_get(url):
+            Sends a request (retrying it whenever it fails) and measures the time it took.
+    """
+
+    @staticmethod
+    def fetch_all(urls, concurrency=16, window=None, timed=False):
+        """
+        Fetches a list of webpages concurrently, the responses are yielded in the same order as the urls.
+
+        Only a window of responses is held at a time, hence, the consumer can parse the responses while the following
+        ones are being fetched without holding every webpage.
+
+        :param list[str] urls: Specify the webpages to be fetched
+        :param int concurrency: Specify the maximum number of requests in flight at the same time
+        :param int window: Specify the number of requests sent ahead of the response being consumed (four per thread
+                           if None)
+        :param bool timed: Yields (response, seconds taken to fetch, retries included) pairs rather than the responses
+        :return: A generator of responses
+        """
+
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError('concurrency must be a positive integer')
+
+        if window is not None and (not isinstance(window, int) or window < 1):
+            raise ValueError('window must be a positive integer')
+
+        return AsyncFetchHandler.__fetch_all(urls, concurrency, window or 4 * concurrency, timed)
+
+    @staticmethod
+    def __fetch_all(urls, concurrency, window, timed):
+        """
+        Submits the requests to a pool of threads, a window of requests is sent ahead of the one being consumed.
+
+        :param list[str] urls: Specify the webpages to be fetched
+        :param int concurrency: Specify the maximum number of requests in flight at the same time
+        :param int window: Specify the number of requests sent ahead of the response being consumed
+        :param bool timed: Yields (response, seconds taken to fetch) pairs rather than the responses
+        :return: A generator of responses
+        """
+
+        fetch = AsyncFetchHandler.__timed_get if timed else HttpHandler.get_with_retries
+
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                for processed in range(len(urls)):
+                    while len(pending) < window and processed + len(pending) < len(urls):
+                        pending.append(executor.submit(fetch, urls[processed + len(pending)]))
+
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def __timed_get(url):
+        """
+        Sends a request (retrying it whenever it fails) and measures the time it took.
+
+        :param str url: Specify the webpage to be fetched
+        :return: A tuple of the response and the seconds taken
+        """
+
+        start = time.perf_counter()
+        res = HttpHandler.get_with_retries(url)
+        return res, time.perf_counter() - start
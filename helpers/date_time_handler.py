@@ -15,6 +15,10 @@ class DateTimeHandler:
             Gets dates between two dates in YYYYmmDD format.
         year_month_day_to_date(date):
             Gets dates between two dates in YYYYmmDD format.
+        split_into_shards(dates, shard_size=30):
+            Splits a list of dates into consecutive shards.
+        get_current_season():
+            Gets the year in which the current season started.
     """
 
     @staticmethod
@@ -51,3 +55,30 @@ class DateTimeHandler:
         """
 
         return datetime.datetime.strptime(date, '%Y%m%d')
+
+    @staticmethod
+    def split_into_shards(dates, shard_size=30):
+        """
+        Splits a list of dates into consecutive shards.
+
+        :param list[str] dates: Specify the dates to be split
+        :param int shard_size: Specify the maximum number of dates in each shard
+        :return: A list of shards, each shard is a list of dates
+        """
+
+        if not isinstance(shard_size, int) or shard_size < 1:
+            raise ValueError('shard_size must be a positive integer')
+
+        return [dates[i:i + shard_size] for i in range(0, len(dates), shard_size)]
+
+    @staticmethod
+    def get_current_season():
+        """
+        Gets the year in which the current season started, seasons are assumed to start in July.
+
+        :return: The season's year as int
+        """
+
+        today = datetime.date.today()
+
+        return today.year if today.month >= 7 else today.year - 1
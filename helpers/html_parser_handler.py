@@ -0,0 +1,195 @@
+import re
+
+import lxml.etree
+import numpy as np
+
+from helpers.date_time_handler import DateTimeHandler
+
+
+class HtmlParserHandler:
+    """
+    Set of static methods that aid extracting rows from the ESPN webpages.
+
+    The webpages are parsed by lxml, and only the target elements are visited (through XPath) instead of building a
+    BeautifulSoup tree of the whole webpage. All arguments and results are plain values, hence, the methods can be
+    handed to other processes.
+
+    Attributes
+    ----------
+        __SQUAD_TABLES      XPath which selects the squad tables of a squad webpage
+        __FIXTURES_CELLS    XPath which selects the cells of the fixtures tables, in document order
+        __ERROR_TITLE       XPath which selects the title of the error webpage
+
+    Methods
+    -------
+        parse_squad_page(html, season_year, league_name, club_name):
+            Extracts the goalkeepers and the players rows from a squad webpage.
+        parse_fixtures_page(html, day):
+            Extracts the match rows from a fixtures webpage.
+        is_error_page(html):
+            Checks whether a webpage is ESPN's error webpage.
+        __parse(html):
+            Parses a webpage into an lxml tree.
+        __text(element):
+            Retrieves the text of an element along with its descendants.
+        __kick_off_time(kick_off):
+            Formats the kick-off time of a fixture.
+    """
+
+    __SQUAD_TABLES = '//table[contains(concat(" ", normalize-space(@class), " "), " Table ")]'
+    __FIXTURES_CELLS = '//tbody/tr/td'
+    __ERROR_TITLE = '//h1[contains(concat(" ", normalize-space(@class), " "), " Error404__Title ")]'
+
+    @staticmethod
+    def parse_squad_page(html, season_year, league_name, club_name):
+        """
+        Extracts the goalkeepers and the players rows from a squad webpage.
+
+        :param str html: Specify the content of the squad webpage
+        :param int season_year: Specify the season of the squad
+        :param str league_name: Specify the league which the club belongs to
+        :param str club_name: Specify the club which the squad belongs to
+        :return: A list of two lists containing the rows (0: Goalkeepers, 1: Players)
+        """
+
+        tree = HtmlParserHandler.__parse(html)
+        if tree is None:
+            return [[], []]
+
+        tables = tree.xpath(HtmlParserHandler.__SQUAD_TABLES)
+
+        if len(tables) != 2:
+            return [[], []]
+
+        result = []
+        for table in tables:
+            data = []
+            for row in table.iter('tr'):
+                cols = [HtmlParserHandler.__text(ele).strip() for ele in row.iter('td')]  # Strips elements
+                if cols:  # If column is not empty
+                    buff = [str(season_year), league_name, club_name] + \
+                           [ele for ele in cols if ele]  # If element is not empty
+                    number_list = re.findall(r'\d+$', buff[3])
+                    if number_list:  # Checks if there is a number for the player
+                        buff.insert(4, number_list[0])  # Extract player's number
+                        buff[3] = re.findall(r'^([^0-9]*)', buff[3])[0]  # Remove player's name number
+                    else:
+                        buff.insert(4, np.nan)
+                    data.append(buff)
+            result.append(data)
+
+        return result
+
+    @staticmethod
+    def parse_fixtures_page(html, day):
+        """
+        Extracts the match rows from a fixtures webpage.
+
+        :param str html: Specify the content of the fixtures webpage
+        :param str day: Specify the day of the webpage in %Y%m%d format
+        :return: A list of the day's match rows, None if the webpage is ESPN's error webpage
+        """
+
+        tree = HtmlParserHandler.__parse(html)
+        if tree is None:
+            return []
+
+        if tree.xpath(HtmlParserHandler.__ERROR_TITLE):
+            return None
+
+        date_text = DateTimeHandler.year_month_day_to_date(day)
+        data = []
+        row = None
+        arr = None
+        col = 0
+
+        # The cells of every table are retrieved in a single pass, a row starts whenever the parent of a cell changes
+        for cell in tree.xpath(HtmlParserHandler.__FIXTURES_CELLS):
+            parent = cell.getparent()
+            if parent is not row:
+                if arr is not None and len(arr) != 1:
+                    data.append(arr)
+                row = parent
+                arr = [date_text]
+                col = 0
+            else:
+                col += 1
+
+            if cell.find('.//small') is not None:
+                continue
+            if col == 0:
+                arr.append(HtmlParserHandler.__text(cell.find('.//span')))
+                arr.append(HtmlParserHandler.__text(cell.findall('.//a')[-1]))
+            elif col == 1:
+                arr.append(HtmlParserHandler.__text(cell.findall('.//span')[-1]))
+            elif col == 2:
+                kick_off = cell.get('data-date')
+                if kick_off:
+                    arr.append(HtmlParserHandler.__kick_off_time(kick_off))
+                else:
+                    arr.append(HtmlParserHandler.__text(cell.find('.//a')))
+            else:
+                arr.append(HtmlParserHandler.__text(cell))
+
+        if arr is not None and len(arr) != 1:
+            data.append(arr)
+
+        return data
+
+    @staticmethod
+    def is_error_page(html):
+        """
+        Checks whether a webpage is ESPN's error webpage.
+
+        :param str html: Specify the content of the webpage
+        :return: True if the webpage is the error webpage
+        """
+
+        # Most webpages are told apart without being parsed
+        if 'Error404__Title' not in html:
+            return False
+
+        tree = HtmlParserHandler.__parse(html)
+
+        return tree is not None and bool(tree.xpath(HtmlParserHandler.__ERROR_TITLE))
+
+    @staticmethod
+    def __parse(html):
+        """
+        Parses a webpage into an lxml tree.
+
+        The plain lxml elements are used rather than lxml.html ones, whose class lookup is paid for each visited
+        element.
+
+        :param str html: Specify the content of the webpage
+        :return: The root element of the webpage, None if the webpage is empty
+        """
+
+        return lxml.etree.HTML(html)
+
+    @staticmethod
+    def __text(element):
+        """
+        Retrieves the text of an element along with its descendants.
+
+        :param lxml.etree._Element element: Specify the element
+        :return: The text as str
+        """
+
+        # Most cells hold their text directly
+        if len(element) == 0:
+            return element.text or ''
+
+        return ''.join(element.itertext())
+
+    @staticmethod
+    def __kick_off_time(kick_off):
+        """
+        Formats the kick-off time of a fixture.
+
+        :param str kick_off: Specify the kick-off in %Y-%m-%dT%H:%MZ format
+        :return: The time in %-H:%M format (e.g. 9:05)
+        """
+
+        # Sliced rather than parsed by strptime, the format is fixed
+        return '{:d}:{}'.format(int(kick_off[11:13]), kick_off[14:16])
@@ -0,0 +1,278 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from helpers.metrics_handler import MetricsHandler
+from helpers.rate_limit_handler import RateLimitHandler
+from helpers.replay_archive_handler import ReplayArchiveHandler
+from helpers.response_cache_handler import ResponseCacheHandler
+from helpers.stage_timer_handler import StageTimerHandler
+
+
+class _ConnectionCounter:
+    """
+    Counts the connections opened and the requests sent by the connection pools of HttpHandler.
+
+    Attributes
+    ----------
+        lock        Guards the counters
+        opened      Number of opened connections
+        requests    Number of requests sent over pooled connections
+
+    Methods
+    -------
+        _new_conn(self):
+            Opens a new connection and counts it.
+        urlopen(self, *args, **kwargs):
+            Sends a request over a pooled connection and counts it.
+    """
+
+    lock = threading.Lock()
+    opened = 0
+    requests = 0
+
+    def _new_conn(self):
+        """
+        Opens a new connection and counts it.
+
+        :return: The new connection
+        """
+
+        with _ConnectionCounter.lock:
+            _ConnectionCounter.opened += 1
+
+        return super()._new_conn()
+
+    def urlopen(self, *args, **kwargs):
+        """
+        Sends a request over a pooled connection and counts it.
+
+        :return: The response of the request
+        """
+
+        with _ConnectionCounter.lock:
+            _ConnectionCounter.requests += 1
+
+        return super().urlopen(*args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(_ConnectionCounter, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_ConnectionCounter, HTTPSConnectionPool):
+    pass
+
+
+class HttpHandler:
+    """
+    Set of static methods that aid sending HTTP requests over a shared pool of keep-alive connections.
+
+    Attributes
+    ----------
+        HEADERS                Headers sent with every request
+        RETRY_STATUS_CODES     Status codes of the responses which are retried by get_with_retries
+        __pool_connections     Number of hosts whose connections are kept alive
+        __pool_maxsize         Number of connections kept alive for each host
+        __timeout              Connect and read timeouts in seconds
+        __session              Shared session which keeps the connections alive
+        __lock                 Guards the creation of the session
+
+    Methods
+    -------
+        configure(pool_connections=10, pool_maxsize=32, timeout=(10, 30)):
+            Sets the pool sizes and the timeouts, the shared session is rebuilt on the next request.
+        get(url, headers=None, timeout=None, is_complete=None):
+            Sends a GET request over the shared session, goes through ResponseCacheHandler if it is enabled, and through
+            ReplayArchiveHandler if it is recording or replaying.
+        get_with_retries(url, request_tries=8, backoff=0.5, is_complete=None):
+            Sends a GET request, retries it with a jittered exponential backoff whenever it fails.
+        get_statistics():
+            Retrieves the number of requests sent, connections opened and connections reused.
+        reset_statistics():
+            Nullifies the request and connection counters.
+        close():
+            Closes the shared session along with its connections.
+        __get_session():
+            Retrieves the shared session, creates it if it does not exist.
+    """
+
+    # Partially prevents scraping detection
+    HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    __pool_connections = 10
+    __pool_maxsize = 32
+    __timeout = (10, 30)
+    __session = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def configure(pool_connections=10, pool_maxsize=32, timeout=(10, 30)):
+        """
+        Sets the pool sizes and the timeouts, the shared session is rebuilt on the next request.
+
+        :param int pool_connections: Specify the number of hosts whose connections are kept alive
+        :param int pool_maxsize: Specify the number of connections kept alive for each host
+        :param tuple[float, float] timeout: Specify the connect and read timeouts in seconds
+        """
+
+        if not isinstance(pool_connections, int) or pool_connections < 1:
+            raise ValueError('pool_connections must be a positive integer')
+
+        if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+            raise ValueError('pool_maxsize must be a positive integer')
+
+        HttpHandler.close()
+
+        HttpHandler.__pool_connections = pool_connections
+        HttpHandler.__pool_maxsize = pool_maxsize
+        HttpHandler.__timeout = timeout
+
+    @staticmethod
+    def get(url, headers=None, timeout=None, is_complete=None):
+        """
+        Sends a GET request over the shared session, goes through ResponseCacheHandler if it is enabled, and through
+        ReplayArchiveHandler if it is recording or replaying.
+
+        Requests which reach the network (or the replayed archive) are scheduled by RateLimitHandler if it is enabled.
+        Replayed responses bypass ResponseCacheHandler. The time spent is added to the fetch stage of StageTimerHandler,
+        while the latency, size and status code are recorded by MetricsHandler.
+
+        :param str url: Specify the requested url
+        :param dict headers: Specify additional headers sent with the request
+        :param tuple[float, float] timeout: Specify the connect and read timeouts in seconds (configured one if None)
+        :param callable is_complete: Specify a function which checks whether a response is complete, rejected responses
+                                     are neither stored nor served by ResponseCacheHandler (all are complete if None)
+        :return: The response of the request
+        """
+
+        def send(validators):
+            RateLimitHandler.acquire(url)
+            if mode == ReplayArchiveHandler.REPLAY:
+                res = ReplayArchiveHandler.fetch(url)
+            else:
+                res = HttpHandler.__get_session().get(url,
+                                                      headers={**(headers or {}), **validators},
+                                                      timeout=HttpHandler.__timeout if timeout is None else timeout)
+            RateLimitHandler.report(url, res.status_code in RateLimitHandler.THROTTLE_STATUS_CODES,
+                                    RateLimitHandler.get_retry_after(res))
+            return res
+
+        mode = ReplayArchiveHandler.get_mode()
+
+        start = time.perf_counter()
+        with StageTimerHandler.measure('fetch'):
+            if ResponseCacheHandler.is_enabled() and mode != ReplayArchiveHandler.REPLAY:
+                res = ResponseCacheHandler.fetch(url, send, is_complete)
+            else:
+                res = send({})
+        MetricsHandler.record_request(time.perf_counter() - start, len(res.content), res.status_code)
+
+        if mode == ReplayArchiveHandler.RECORD:
+            ReplayArchiveHandler.store(url, res)
+
+        return res
+
+    @staticmethod
+    def get_with_retries(url, request_tries=8, backoff=0.5, is_complete=None):
+        """
+        Sends a GET request, retries it with a jittered exponential backoff whenever it fails.
+
+        A request fails if it is not answered, if it is answered with one of RETRY_STATUS_CODES, or if is_complete
+        rejects its response. The wait before a retry is at least the one asked by the Retry-After header.
+
+        :param str url: Specify the requested url
+        :param int request_tries: Specify the number of retries before giving up
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param callable is_complete: Specify a function which checks whether a response is complete, such as ESPN's
+                                     error webpage being served instead of the requested one (all are complete if None)
+        :return: The response of the last try, the error of the last try is raised if it is not answered
+        """
+
+        for tries in range(request_tries + 1):
+            try:
+                res = HttpHandler.get(url, is_complete=is_complete)
+            except (requests.ConnectionError, requests.Timeout):
+                MetricsHandler.record_error()
+                if tries == request_tries:
+                    raise
+                MetricsHandler.record_retry()
+                time.sleep(RateLimitHandler.get_retry_delay(tries, backoff=backoff))
+                continue
+
+            if res.status_code not in HttpHandler.RETRY_STATUS_CODES and (is_complete is None or is_complete(res)):
+                return res
+
+            if tries == request_tries:
+                return res
+
+            if res.status_code not in RateLimitHandler.THROTTLE_STATUS_CODES:
+                # Incomplete webpages and server errors are served under load as well, hence, they slow the host down
+                RateLimitHandler.report(url, throttled=True)
+
+            MetricsHandler.record_retry()
+            time.sleep(RateLimitHandler.get_retry_delay(tries, res, backoff))
+
+    @staticmethod
+    def get_statistics():
+        """
+        Retrieves the number of requests sent, connections opened and connections reused.
+
+        :return: A dictionary containing the counters
+        """
+
+        with _ConnectionCounter.lock:
+            return {
+                'requests': _ConnectionCounter.requests,
+                'opened': _ConnectionCounter.opened,
+                'reused': max(_ConnectionCounter.requests - _ConnectionCounter.opened, 0),
+            }
+
+    @staticmethod
+    def reset_statistics():
+        """
+        Nullifies the request and connection counters.
+        """
+
+        with _ConnectionCounter.lock:
+            _ConnectionCounter.requests = 0
+            _ConnectionCounter.opened = 0
+
+    @staticmethod
+    def close():
+        """
+        Closes the shared session along with its connections.
+        """
+
+        with HttpHandler.__lock:
+            if HttpHandler.__session is not None:
+                HttpHandler.__session.close()
+                HttpHandler.__session = None
+
+    @staticmethod
+    def __get_session():
+        """
+        Retrieves the shared session, creates it if it does not exist.
+
+        :return: The shared session
+        """
+
+        with HttpHandler.__lock:
+            if HttpHandler.__session is None:
+                session = requests.Session()
+                session.headers.update(HttpHandler.HEADERS)
+
+                for scheme in ['http://', 'https://']:
+                    adapter = HTTPAdapter(pool_connections=HttpHandler.__pool_connections,
+                                          pool_maxsize=HttpHandler.__pool_maxsize)
+                    adapter.poolmanager.pool_classes_by_scheme = {'http': _CountingHTTPConnectionPool,
+                                                                  'https': _CountingHTTPSConnectionPool}
+                    session.mount(scheme, adapter)
+
+                HttpHandler.__session = session
+
+            return HttpHandler.__session
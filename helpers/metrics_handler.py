@@ -0,0 +1,284 @@
+import collections
+import json
+import threading
+import time
+
+from models.latency_histogram import LatencyHistogram
+
+
+class MetricsHandler:
+    """
+    Set of static methods that aid tracking the progress and the metrics of a crawl from any thread.
+
+    A run tracks the work units (e.g. days or squads) of a crawl: its throughput is measured over a moving window of
+    recent completions, from which the ETA is estimated, and a progress line is printed at most once per interval.
+    The requests, retries, errors, downloaded bytes and latency histograms are accumulated across runs until reset.
+
+    Attributes
+    ----------
+        __interval      Minimum seconds between two printed progress lines (nothing is printed if None)
+        __window        Seconds of recent completions over which the throughput is measured
+        __run           Progress of the current run (no run if None)
+        __counters      Number of requests, retries, errors and downloaded bytes
+        __histograms    Latency histogram of the requests and of the work units
+        __lock          Guards the run, the counters and the histograms
+
+    Methods
+    -------
+        configure(interval=1.0, window=10.0):
+            Sets how often the progress is printed and the window over which the throughput is measured.
+        start(total, unit='pages'):
+            Starts a run of the given number of work units, replacing the current run (if any).
+        complete(units=1, seconds=None):
+            Marks work units of the current run as completed, prints the progress if the interval has elapsed.
+        finish():
+            Ends the current run, prints its final progress if it has not been printed yet.
+        record_request(seconds, size, status_code):
+            Records an answered request.
+        record_retry():
+            Records a retried request.
+        record_error():
+            Records a request which has not been answered.
+        get_metrics():
+            Retrieves the progress of the current run along with the accumulated metrics.
+        dump(path):
+            Writes the metrics into a JSON file.
+        reset():
+            Ends the current run and nullifies the accumulated metrics.
+        __get_progress(now):
+            Computes the progress of the current run.
+        __format_progress(progress):
+            Formats the progress of a run as a line.
+    """
+
+    __interval = 1.0
+    __window = 10.0
+    __run = None
+    __counters = {'requests': 0, 'retries': 0, 'errors': 0, 'bytes': 0}
+    __histograms = {'request': LatencyHistogram(), 'unit': LatencyHistogram()}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def configure(interval=1.0, window=10.0):
+        """
+        Sets how often the progress is printed and the window over which the throughput is measured.
+
+        :param float interval: Specify the minimum seconds between two printed progress lines (nothing is printed if
+                               None, every completion is printed if 0)
+        :param float window: Specify the seconds of recent completions over which the throughput is measured
+        """
+
+        if interval is not None and interval < 0:
+            raise ValueError('interval must not be negative')
+
+        if window <= 0:
+            raise ValueError('window must be a positive number')
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__interval = interval
+            MetricsHandler.__window = window
+
+    @staticmethod
+    def start(total, unit='pages'):
+        """
+        Starts a run of the given number of work units, replacing the current run (if any).
+
+        :param int total: Specify the number of work units
+        :param str unit: Specify the name of the work units, as printed
+        """
+
+        if not isinstance(total, int) or total < 0:
+            raise ValueError('total must be a non-negative integer')
+
+        now = time.monotonic()
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__run = {
+                'total': total,
+                'unit': unit,
+                'completed': 0,
+                'started': now,
+                'printed': None,
+                'printed_completed': 0,
+                'recent': collections.deque(),
+            }
+
+    @staticmethod
+    def complete(units=1, seconds=None):
+        """
+        Marks work units of the current run as completed, prints the progress if the interval has elapsed.
+
+        :param int units: Specify the number of completed work units
+        :param float seconds: Specify the seconds taken by the work unit, added to the work unit histogram (not added
+                              if None)
+        """
+
+        now = time.monotonic()
+        line = None
+
+        with MetricsHandler.__lock:
+            if seconds is not None:
+                MetricsHandler.__histograms['unit'].add(seconds)
+
+            run = MetricsHandler.__run
+            if run is None or units <= 0:
+                return
+
+            run['completed'] = min(run['completed'] + units, run['total'])
+            run['recent'].append((now, units))
+
+            interval = MetricsHandler.__interval
+            if interval is not None and (run['printed'] is None or now - run['printed'] >= interval or
+                                         run['completed'] == run['total']):
+                run['printed'] = now
+                run['printed_completed'] = run['completed']
+                line = MetricsHandler.__format_progress(MetricsHandler.__get_progress(now))
+
+        # Printed outside of the lock, so that a slow console does not hold back the other threads
+        if line is not None:
+            print(line)
+
+    @staticmethod
+    def finish():
+        """
+        Ends the current run, prints its final progress if it has not been printed yet.
+        """
+
+        now = time.monotonic()
+
+        with MetricsHandler.__lock:
+            run = MetricsHandler.__run
+            if run is None:
+                return
+
+            line = None
+            if MetricsHandler.__interval is not None and run['completed'] != run['printed_completed']:
+                line = MetricsHandler.__format_progress(MetricsHandler.__get_progress(now))
+
+            MetricsHandler.__run = None
+
+        if line is not None:
+            print(line)
+
+    @staticmethod
+    def record_request(seconds, size, status_code):
+        """
+        Records an answered request.
+
+        :param float seconds: Specify the seconds taken by the request
+        :param int size: Specify the size of the downloaded body in bytes
+        :param int status_code: Specify the status code of the response, 4xx and 5xx count as errors
+        """
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__counters['requests'] += 1
+            MetricsHandler.__counters['bytes'] += size
+            if status_code >= 400:
+                MetricsHandler.__counters['errors'] += 1
+            MetricsHandler.__histograms['request'].add(seconds)
+
+    @staticmethod
+    def record_retry():
+        """
+        Records a retried request.
+        """
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__counters['retries'] += 1
+
+    @staticmethod
+    def record_error():
+        """
+        Records a request which has not been answered.
+        """
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__counters['errors'] += 1
+
+    @staticmethod
+    def get_metrics():
+        """
+        Retrieves the progress of the current run along with the accumulated metrics.
+
+        :return: A JSON serializable dictionary, the progress is None if no run is in progress
+        """
+
+        now = time.monotonic()
+
+        with MetricsHandler.__lock:
+            return {
+                'progress': MetricsHandler.__get_progress(now) if MetricsHandler.__run is not None else None,
+                **MetricsHandler.__counters,
+                'latency': {name: histogram.to_dict() for name, histogram in MetricsHandler.__histograms.items()},
+            }
+
+    @staticmethod
+    def dump(path):
+        """
+        Writes the metrics into a JSON file.
+
+        :param str path: Specify the path of the file
+        """
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(MetricsHandler.get_metrics(), f, indent=2)
+
+    @staticmethod
+    def reset():
+        """
+        Ends the current run and nullifies the accumulated metrics.
+        """
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__run = None
+            MetricsHandler.__counters = {'requests': 0, 'retries': 0, 'errors': 0, 'bytes': 0}
+            MetricsHandler.__histograms = {'request': LatencyHistogram(), 'unit': LatencyHistogram()}
+
+    @staticmethod
+    def __get_progress(now):
+        """
+        Computes the progress of the current run.
+
+        Must be called while holding the lock.
+
+        :param float now: Specify the current time (time.monotonic)
+        :return: A dictionary of the completed and total work units, elapsed seconds, throughput and ETA
+        """
+
+        run = MetricsHandler.__run
+        recent = run['recent']
+
+        while recent and now - recent[0][0] > MetricsHandler.__window:
+            recent.popleft()
+
+        elapsed = now - run['started']
+        window = min(MetricsHandler.__window, elapsed)
+        throughput = sum(units for _, units in recent) / window if window > 0 else None
+        remaining = run['total'] - run['completed']
+
+        return {
+            'unit': run['unit'],
+            'completed': run['completed'],
+            'total': run['total'],
+            'elapsed': elapsed,
+            'throughput': throughput,
+            'eta': remaining / throughput if throughput else (0.0 if remaining == 0 else None),
+        }
+
+    @staticmethod
+    def __format_progress(progress):
+        """
+        Formats the progress of a run as a line.
+
+        :param dict progress: Specify the progress retrieved by __get_progress
+        :return: The line as str
+        """
+
+        percentage = progress['completed'] / progress['total'] * 100 if progress['total'] else 100.0
+        throughput = f'{progress["throughput"]:.2f}' if progress['throughput'] is not None else '-'
+        eta = f'{progress["eta"]:.2f}' if progress['eta'] is not None else '-'
+
+        return f'{progress["completed"]}/{progress["total"]}\t\t' \
+               f'{percentage:.2f}%\t\t' \
+               f'{throughput} {progress["unit"]}/s\t\t' \
+               f'ETA: {eta} second(s)'
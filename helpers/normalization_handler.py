@@ -0,0 +1,244 @@
+import numpy as np
+import pandas as pd
+
+
+class NormalizationHandler:
+    """
+    Set of static methods that aid turning scraped rows into typed dataframes through vectorized column operations.
+
+    Scraped columns hold few distinct values (ages, heights, goals, etc.), hence, each distinct value is converted once
+    and the results are spread back to the cells.
+
+    Attributes
+    ----------
+        PLAYERS_TEXT_COLUMNS    Player columns which are kept as text, the remaining ones are numeric
+        MATCHES_RESULT_COLUMNS  Match columns holding the goals of each club and the outcome, parsed out of the score
+        OUTCOMES                Outcomes of a match, which club won or whether it was a draw
+
+    Methods
+    -------
+        normalize_players(df):
+            Replaces blank and double dashed cells with nulls, converts weight to kg, height to cm and numeric columns.
+        normalize_matches(df):
+            Replaces blank and double dashed cells with nulls, drops empty rows, parses the result and the attendance.
+        replace_blanks_with_nulls(df):
+            Replaces cells which are blank or double dashed with nulls in a single pass over each text column.
+        pounds_to_kilograms(weights):
+            Converts weights such as '165 lbs' into kilograms.
+        feet_and_inches_to_centimeters(heights):
+            Converts heights such as '5\' 11"' into centimeters.
+        scores_to_goals(scores):
+            Splits scores such as '2 - 1' into the goals of each club.
+        goals_to_outcomes(club1_goals, club2_goals):
+            Determines the outcome of matches out of the goals of each club.
+        attendance_to_integers(attendance):
+            Converts attendances such as '66,714' into integers.
+        to_numeric(values):
+            Converts a column into numbers, same as pd.to_numeric.
+        __convert_distinct(values, convert):
+            Converts each distinct value of a column once, then spreads the results back to the cells.
+    """
+
+    PLAYERS_TEXT_COLUMNS = ['LEAGUE', 'CLUB', 'NAME', 'POS', 'NAT']
+    MATCHES_RESULT_COLUMNS = ['club1_score', 'club2_score', 'outcome']
+    OUTCOMES = ['club1', 'club2', 'draw']
+
+    @staticmethod
+    def normalize_players(df):
+        """
+        Replaces blank and double dashed cells with nulls, converts weight to kg, height to cm and numeric columns.
+
+        :param pd.DataFrame df: Specify the scraped player rows
+        :return: A new dataframe containing the normalized players
+        """
+
+        df = NormalizationHandler.replace_blanks_with_nulls(df).reset_index(drop=True)
+
+        # The columns are gathered and the dataframe is built once, assigning columns one by one copies the data
+        columns = {}
+        for col in df.columns:
+            if col == 'WT':
+                columns[col] = NormalizationHandler.pounds_to_kilograms(df[col])
+            elif col == 'HT':
+                columns[col] = NormalizationHandler.feet_and_inches_to_centimeters(df[col])
+            elif col in NormalizationHandler.PLAYERS_TEXT_COLUMNS:
+                columns[col] = df[col]
+            else:
+                columns[col] = NormalizationHandler.to_numeric(df[col])
+
+        return pd.DataFrame(columns, index=df.index)
+
+    @staticmethod
+    def normalize_matches(df):
+        """
+        Replaces blank and double dashed cells with nulls, drops empty rows, parses the result and the attendance.
+
+        Rows holding less than three values are dropped. The goals of each club are appended as nullable integer
+        columns along with the outcome as a categorical column (nulls for fixtures), the attendance is converted into
+        nullable integers.
+
+        :param pd.DataFrame df: Specify the scraped match rows
+        :return: A new dataframe containing the normalized matches
+        """
+
+        df = NormalizationHandler.replace_blanks_with_nulls(df).dropna(thresh=3).reset_index(drop=True)
+
+        # Any result previously held (e.g. by an imported CSV snapshot) is parsed again out of the score
+        df = df.drop(columns=NormalizationHandler.MATCHES_RESULT_COLUMNS, errors='ignore')
+        df['ATTENDANCE'] = NormalizationHandler.attendance_to_integers(df['ATTENDANCE'])
+        df['club1_score'], df['club2_score'] = NormalizationHandler.scores_to_goals(df['SCORE'])
+        df['outcome'] = NormalizationHandler.goals_to_outcomes(df['club1_score'], df['club2_score'])
+
+        return df
+
+    @staticmethod
+    def replace_blanks_with_nulls(df):
+        """
+        Replaces cells which are blank or double dashed with nulls in a single pass over each text column.
+
+        :param pd.DataFrame df: Specify the dataframe
+        :return: A new dataframe without blank or double dashed cells
+        """
+
+        columns = {}
+        for col in df.columns:
+            values = df[col]
+
+            # Numeric, datetime and categorical columns are kept as they are
+            if values.dtype == object:
+                values = values.to_numpy()
+
+                # Only the distinct values are inspected, the last entry stands for the null code (-1)
+                codes, uniques = pd.factorize(values)
+                blanks = np.array([isinstance(x, str) and (x == '--' or not x.strip()) for x in uniques] + [False])
+
+                mask = blanks[codes]
+                if mask.any():
+                    values = values.copy()
+                    values[mask] = np.nan
+
+            columns[col] = values
+
+        return pd.DataFrame(columns, index=df.index)
+
+    @staticmethod
+    def pounds_to_kilograms(weights):
+        """
+        Converts weights such as '165 lbs' into kilograms.
+
+        :param pd.Series weights: Specify the weights, nulls are kept
+        :return: A series of floats
+        """
+
+        if weights.dtype != object:
+            return weights.astype(float)
+
+        return NormalizationHandler.__convert_distinct(
+            weights, lambda x: pd.to_numeric(x.str.split(' ', n=1).str[0]) / 2.205).astype(float)
+
+    @staticmethod
+    def feet_and_inches_to_centimeters(heights):
+        """
+        Converts heights such as '5\' 11"' into centimeters.
+
+        :param pd.Series heights: Specify the heights, nulls are kept
+        :return: A series of floats
+        """
+
+        if heights.dtype != object:
+            return heights.astype(float)
+
+        def convert(x):
+            parts = x.str.extract(r'^([^\']*)\'([^\'"]*)')
+            return pd.to_numeric(parts[0].str.strip()) * 30.48 + pd.to_numeric(parts[1].str.strip()) * 2.54
+
+        return NormalizationHandler.__convert_distinct(heights, convert).astype(float)
+
+    @staticmethod
+    def scores_to_goals(scores):
+        """
+        Splits scores such as '2 - 1' into the goals of each club.
+
+        :param pd.Series scores: Specify the scores, nulls and scores of unplayed matches (e.g. 'v') are kept as nulls
+        :return: A list of two series of nullable integers (0: Goals of club1, 1: Goals of club2)
+        """
+
+        if scores.dtype != object:
+            return [pd.Series(pd.NA, index=scores.index, dtype='Int64') for _ in range(2)]
+
+        def convert(side):
+            return lambda x: pd.to_numeric(x.str.extract(r'^\s*(\d+)\s*-\s*(\d+)')[side])
+
+        return [NormalizationHandler.__convert_distinct(scores, convert(x)).astype('Int64').rename(None)
+                for x in range(2)]
+
+    @staticmethod
+    def goals_to_outcomes(club1_goals, club2_goals):
+        """
+        Determines the outcome of matches out of the goals of each club.
+
+        :param pd.Series club1_goals: Specify the goals of club1, nulls for unplayed matches
+        :param pd.Series club2_goals: Specify the goals of club2, nulls for unplayed matches
+        :return: A categorical series of the outcomes (club1, club2 or draw), nulls for unplayed matches
+        """
+
+        index = club1_goals.index
+        club1_goals = club1_goals.to_numpy(dtype=float, na_value=np.nan)
+        club2_goals = club2_goals.to_numpy(dtype=float, na_value=np.nan)
+
+        # Comparisons with nulls are false, hence, unplayed matches pick the null code (-1)
+        codes = np.select([club1_goals > club2_goals, club1_goals < club2_goals, club1_goals == club2_goals],
+                          [0, 1, 2], -1)
+
+        return pd.Series(pd.Categorical.from_codes(codes, NormalizationHandler.OUTCOMES), index=index)
+
+    @staticmethod
+    def attendance_to_integers(attendance):
+        """
+        Converts attendances such as '66,714' into integers.
+
+        :param pd.Series attendance: Specify the attendances, nulls as well as values which are not numbers are kept
+                                     as nulls
+        :return: A series of nullable integers
+        """
+
+        if attendance.dtype != object:
+            return attendance.astype('Int64')
+
+        def convert(x):
+            return pd.to_numeric(x.astype(str).str.replace(',', '', regex=False), errors='coerce')
+
+        return NormalizationHandler.__convert_distinct(attendance, convert).astype('Int64')
+
+    @staticmethod
+    def to_numeric(values):
+        """
+        Converts a column into numbers, same as pd.to_numeric.
+
+        :param pd.Series values: Specify the column
+        :return: A numeric series (floats if the column contains nulls)
+        """
+
+        if values.dtype != object:
+            return pd.to_numeric(values)
+
+        return NormalizationHandler.__convert_distinct(values, pd.to_numeric)
+
+    @staticmethod
+    def __convert_distinct(values, convert):
+        """
+        Converts each distinct value of a column once, then spreads the results back to the cells.
+
+        :param pd.Series values: Specify the column
+        :param callable convert: Specify a function which converts a series of distinct non-null values
+        :return: A series of the converted values, nulls are kept
+        """
+
+        codes, uniques = pd.factorize(values.to_numpy())
+        converted = pd.Series(convert(pd.Series(uniques, dtype=object))).to_numpy()
+
+        if not len(converted) or (codes == -1).any():
+            # The null code (-1) picks the appended null
+            converted = np.append(converted.astype(float), np.nan)
+
+        return pd.Series(converted[codes], index=values.index, name=values.name)
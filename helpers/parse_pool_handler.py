@@ -0,0 +1,166 @@
+import collections
+import concurrent.futures
+import threading
+import time
+
+from helpers.stage_timer_handler import StageTimerHandler
+
+
+def _timed_call(function, *args):
+    """
+    Calls a function and measures the time it took, in whichever process it runs.
+
+    :param callable function: Specify the function
+    :param args: Specify the arguments of the function
+    :return: A tuple of the result and the seconds taken
+    """
+
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+class ParsePoolHandler:
+    """
+    Set of static methods that aid parsing webpages in a pool of processes, apart from the threads which fetch them.
+
+    Fetchers hand the raw webpages to the pool and receive compact rows back, hence, parsing is spread across cores
+    instead of being capped to the one holding the GIL. Parsing happens in the calling thread unless the pool is
+    configured. The time spent parsing (within the processes) is added to the parse stage of StageTimerHandler.
+
+    Attributes
+    ----------
+        __workers       Number of parser processes (parsing in the calling thread if None)
+        __executor      Pool of parser processes
+        __lock          Guards the creation of the pool
+
+    Methods
+    -------
+        configure(workers=None):
+            Sets the number of parser processes, the pool is started right away.
+        get_workers():
+            Retrieves the number of parser processes.
+        parse(function, *args):
+            Runs a parsing function in the pool, only the calling thread waits for its result.
+        parse_all(function, arguments, window=None, timed=False):
+            Runs a parsing function over lazily produced arguments, the results are yielded in the same order.
+        shutdown():
+            Stops the parser processes, parsing happens in the calling thread afterwards.
+    """
+
+    __workers = None
+    __executor = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def configure(workers=None):
+        """
+        Sets the number of parser processes, the pool is started right away.
+
+        The pool should be configured before crawling, so that the processes are not forked while fetchers are running.
+
+        :param int workers: Specify the number of parser processes (parsing in the calling thread if None)
+        """
+
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError('workers must be a positive integer')
+
+        ParsePoolHandler.shutdown()
+
+        if workers is None:
+            return
+
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+
+        # Starts the processes now rather than on the first webpage
+        executor.submit(int).result()
+
+        with ParsePoolHandler.__lock:
+            ParsePoolHandler.__workers = workers
+            ParsePoolHandler.__executor = executor
+
+    @staticmethod
+    def get_workers():
+        """
+        Retrieves the number of parser processes.
+
+        :return: The number of processes, None if parsing happens in the calling thread
+        """
+
+        return ParsePoolHandler.__workers
+
+    @staticmethod
+    def parse(function, *args):
+        """
+        Runs a parsing function in the pool, only the calling thread waits for its result.
+
+        :param callable function: Specify a picklable function, such as a static method of HtmlParserHandler
+        :param args: Specify the arguments of the function, such as the webpage
+        :return: The result of the function
+        """
+
+        executor = ParsePoolHandler.__executor
+        if executor is None:
+            result, seconds = _timed_call(function, *args)
+        else:
+            result, seconds = executor.submit(_timed_call, function, *args).result()
+
+        StageTimerHandler.add('parse', seconds)
+        return result
+
+    @staticmethod
+    def parse_all(function, arguments, window=None, timed=False):
+        """
+        Runs a parsing function over lazily produced arguments, the results are yielded in the same order.
+
+        The arguments are drawn (e.g. fetched) while the pool parses the previous ones, at most window of them are
+        queued in the pool at once.
+
+        :param callable function: Specify a picklable function, such as a static method of HtmlParserHandler
+        :param iterable arguments: Specify the argument tuples of the function, such as (webpage, day) pairs
+        :param int window: Specify the number of arguments queued in the pool at once (four per process if None)
+        :param bool timed: Yields (result, seconds taken to parse) pairs rather than the results
+        :return: A generator of the results
+        """
+
+        executor = ParsePoolHandler.__executor
+        if executor is None:
+            for args in arguments:
+                result, seconds = _timed_call(function, *args)
+                StageTimerHandler.add('parse', seconds)
+                yield (result, seconds) if timed else result
+            return
+
+        window = window or 4 * ParsePoolHandler.__workers
+        pending = collections.deque()
+
+        def collect():
+            result, seconds = pending.popleft().result()
+            StageTimerHandler.add('parse', seconds)
+            return (result, seconds) if timed else result
+
+        try:
+            for args in arguments:
+                pending.append(executor.submit(_timed_call, function, *args))
+                if len(pending) >= window:
+                    yield collect()
+
+            while pending:
+                yield collect()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def shutdown():
+        """
+        Stops the parser processes, parsing happens in the calling thread afterwards.
+        """
+
+        with ParsePoolHandler.__lock:
+            executor = ParsePoolHandler.__executor
+            ParsePoolHandler.__executor = None
+            ParsePoolHandler.__workers = None
+
+        if executor is not None:
+            executor.shutdown()
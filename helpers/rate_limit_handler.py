@@ -0,0 +1,250 @@
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from models.token_bucket import TokenBucket
+
+
+class RateLimitHandler:
+    """
+    Set of static methods that aid scheduling the requests sent to each host through adaptive token buckets.
+
+    Every host has its own token bucket. The bucket's rate doubles every second until the host throttles for the first
+    time (slow start), then it grows additively while the host answers, and is cut multiplicatively whenever the host
+    throttles (additive increase, multiplicative decrease), hence, the rate settles slightly below the one the host
+    tolerates. Throttled requests which were in flight together only cut the rate once
+    per second. A Retry-After sent by the host holds back every request to that host.
+
+    Attributes
+    ----------
+        THROTTLE_STATUS_CODES   Status codes by which a host asks for fewer requests
+        __enabled               Whether the requests are scheduled
+        __rate                  Initial number of requests per second sent to a host
+        __burst                 Number of requests which can be sent to a host at once
+        __min_rate              Lower bound of the adapted rate
+        __max_rate              Upper bound of the adapted rate
+        __increase              Requests per second added to the rate after each second of answered requests
+        __decrease              Factor applied to the rate whenever a host throttles
+        __buckets               Token bucket of each host
+        __decreased_at          Time in which the rate of each host was last cut (time.monotonic)
+        __lock                  Guards the creation of the buckets
+
+    Methods
+    -------
+        enable(rate=4.0, burst=4, min_rate=0.5, max_rate=64.0, increase=1.0, decrease=0.5):
+            Enables the scheduling, the buckets are created again with the given settings.
+        disable():
+            Disables the scheduling.
+        is_enabled():
+            Checks whether the scheduling is enabled.
+        acquire(url):
+            Waits until a request can be sent to the url's host.
+        report(url, throttled=False, retry_after=None):
+            Adapts the rate of the url's host to the outcome of a request.
+        get_rates():
+            Retrieves the current rate of each host.
+        get_retry_after(response):
+            Retrieves the seconds asked by the Retry-After header of a response.
+        get_retry_delay(tries, response=None, backoff=0.5, max_backoff=60):
+            Retrieves the seconds to be waited before retrying a request, jittered exponential backoff or Retry-After.
+        __get_bucket(url):
+            Retrieves the token bucket of the url's host, creates it if it does not exist.
+    """
+
+    THROTTLE_STATUS_CODES = {429, 503}
+
+    __enabled = False
+    __rate = 4.0
+    __burst = 4
+    __min_rate = 0.5
+    __max_rate = 64.0
+    __increase = 1.0
+    __decrease = 0.5
+    __buckets = {}
+    __decreased_at = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def enable(rate=4.0, burst=4, min_rate=0.5, max_rate=64.0, increase=1.0, decrease=0.5):
+        """
+        Enables the scheduling, the buckets are created again with the given settings.
+
+        :param float rate: Specify the initial number of requests per second sent to a host
+        :param int burst: Specify the number of requests which can be sent to a host at once
+        :param float min_rate: Specify the lower bound of the adapted rate
+        :param float max_rate: Specify the upper bound of the adapted rate
+        :param float increase: Specify the requests per second added to the rate after each second of answered
+                               requests
+        :param float decrease: Specify the factor applied to the rate whenever a host throttles
+        """
+
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError('rates must satisfy 0 < min_rate <= rate <= max_rate')
+
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError('burst must be a positive integer')
+
+        if increase < 0 or not 0 < decrease < 1:
+            raise ValueError('increase must not be negative and decrease must be between 0 and 1')
+
+        with RateLimitHandler.__lock:
+            RateLimitHandler.__rate = rate
+            RateLimitHandler.__burst = burst
+            RateLimitHandler.__min_rate = min_rate
+            RateLimitHandler.__max_rate = max_rate
+            RateLimitHandler.__increase = increase
+            RateLimitHandler.__decrease = decrease
+            RateLimitHandler.__buckets = {}
+            RateLimitHandler.__decreased_at = {}
+            RateLimitHandler.__enabled = True
+
+    @staticmethod
+    def disable():
+        """
+        Disables the scheduling.
+        """
+
+        with RateLimitHandler.__lock:
+            RateLimitHandler.__enabled = False
+            RateLimitHandler.__buckets = {}
+            RateLimitHandler.__decreased_at = {}
+
+    @staticmethod
+    def is_enabled():
+        """
+        Checks whether the scheduling is enabled.
+
+        :return: True if the scheduling is enabled
+        """
+
+        return RateLimitHandler.__enabled
+
+    @staticmethod
+    def acquire(url):
+        """
+        Waits until a request can be sent to the url's host.
+
+        :param str url: Specify the requested url
+        :return: The seconds waited
+        """
+
+        if not RateLimitHandler.__enabled:
+            return 0.0
+
+        wait = RateLimitHandler.__get_bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    @staticmethod
+    def report(url, throttled=False, retry_after=None):
+        """
+        Adapts the rate of the url's host to the outcome of a request.
+
+        :param str url: Specify the requested url
+        :param bool throttled: Specify whether the host throttled the request
+        :param float retry_after: Specify the seconds asked by the host before sending further requests
+        """
+
+        if not RateLimitHandler.__enabled:
+            return
+
+        bucket = RateLimitHandler.__get_bucket(url)
+
+        if retry_after:
+            bucket.block(retry_after)
+
+        if throttled:
+            host = urlparse(url).netloc
+            now = time.monotonic()
+
+            with RateLimitHandler.__lock:
+                if now - RateLimitHandler.__decreased_at.get(host, float('-inf')) < 1:
+                    return
+                RateLimitHandler.__decreased_at[host] = now
+
+            bucket.set_rate(max(RateLimitHandler.__min_rate, bucket.rate * RateLimitHandler.__decrease))
+        else:
+            with RateLimitHandler.__lock:
+                slow_start = urlparse(url).netloc not in RateLimitHandler.__decreased_at
+
+            # Each answered request adds a share of the increase, a second's worth of requests adds it entirely, while
+            # during the slow start each answered request adds a request per second
+            step = 1.0 if slow_start else RateLimitHandler.__increase / bucket.rate
+            bucket.set_rate(min(RateLimitHandler.__max_rate, bucket.rate + step))
+
+    @staticmethod
+    def get_rates():
+        """
+        Retrieves the current rate of each host.
+
+        :return: A dictionary of requests per second keyed by host
+        """
+
+        with RateLimitHandler.__lock:
+            return {host: bucket.rate for host, bucket in RateLimitHandler.__buckets.items()}
+
+    @staticmethod
+    def get_retry_after(response):
+        """
+        Retrieves the seconds asked by the Retry-After header of a response.
+
+        :param requests.Response response: Specify the response
+        :return: The seconds as float, None if the header is missing or malformed
+        """
+
+        value = response.headers.get('Retry-After') if response is not None else None
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(date.timestamp() - time.time(), 0.0)
+
+    @staticmethod
+    def get_retry_delay(tries, response=None, backoff=0.5, max_backoff=60):
+        """
+        Retrieves the seconds to be waited before retrying a request, jittered exponential backoff or Retry-After.
+
+        Half of the backoff is fixed while the other half is random, so that requests which failed together are not
+        retried together.
+
+        :param int tries: Specify the number of retries done so far
+        :param requests.Response response: Specify the response of the failed request (None if it was not answered)
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param float max_backoff: Specify the upper bound of the backoff in seconds
+        :return: The seconds as float, at least the ones asked by the Retry-After header
+        """
+
+        delay = min(max_backoff, backoff * 2 ** tries)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+
+        return max(delay, RateLimitHandler.get_retry_after(response) or 0.0)
+
+    @staticmethod
+    def __get_bucket(url):
+        """
+        Retrieves the token bucket of the url's host, creates it if it does not exist.
+
+        :param str url: Specify the requested url
+        :return: The token bucket
+        """
+
+        host = urlparse(url).netloc
+
+        with RateLimitHandler.__lock:
+            if host not in RateLimitHandler.__buckets:
+                RateLimitHandler.__buckets[host] = TokenBucket(RateLimitHandler.__rate, RateLimitHandler.__burst)
+
+            return RateLimitHandler.__buckets[host]
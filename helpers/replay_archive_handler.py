@@ -0,0 +1,224 @@
+import hashlib
+import json
+import threading
+import time
+import zipfile
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ReplayArchiveHandler:
+    """
+    Set of static methods that aid recording the fetched responses into an archive and replaying them offline.
+
+    The archive is a zip file holding an index of the responses (status, headers and body of each url) and a
+    description of the crawl along with the deflated bodies, identical bodies are only stored once. While replaying,
+    the responses are served through HttpHandler after a simulated latency, hence, crawls are deterministic and do not
+    need the network.
+
+    Attributes
+    ----------
+        RECORD          Mode in which the fetched responses are recorded
+        REPLAY          Mode in which the recorded responses are served
+        __mode          Current mode (neither recording nor replaying if None)
+        __archive       Opened zip file of the archive
+        __index         Recorded status, headers, encoding and body of each url
+        __metadata      Description of the recorded crawl, such as the urls it targeted
+        __bodies        Hashes of the bodies written into the archive being recorded
+        __latency       Seconds waited before serving each replayed response
+        __lock          Guards the archive and the index
+
+    Methods
+    -------
+        record(path, metadata=None):
+            Starts recording the fetched responses into a new archive.
+        replay(path, latency=0.0):
+            Starts serving the responses recorded in an archive.
+        stop():
+            Stops recording or replaying, a recorded archive is only complete once stopped.
+        get_mode():
+            Retrieves the current mode.
+        get_metadata():
+            Retrieves the description of the crawl being recorded or replayed.
+        store(url, response):
+            Records a response, the last response of a url replaces the previous ones.
+        fetch(url):
+            Serves the recorded response of a url after the simulated latency.
+        get_urls():
+            Retrieves the urls held by the archive being recorded or replayed.
+    """
+
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    __mode = None
+    __archive = None
+    __index = {}
+    __metadata = {}
+    __bodies = set()
+    __latency = 0.0
+    __lock = threading.Lock()
+
+    @staticmethod
+    def record(path, metadata=None):
+        """
+        Starts recording the fetched responses into a new archive.
+
+        :param str path: Specify the path of the archive, an existing archive is overwritten
+        :param dict metadata: Specify a JSON serializable description of the crawl, such as the urls it targets
+        """
+
+        ReplayArchiveHandler.stop()
+
+        with ReplayArchiveHandler.__lock:
+            ReplayArchiveHandler.__archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+            ReplayArchiveHandler.__index = {}
+            ReplayArchiveHandler.__metadata = metadata or {}
+            ReplayArchiveHandler.__bodies = set()
+            ReplayArchiveHandler.__mode = ReplayArchiveHandler.RECORD
+
+    @staticmethod
+    def replay(path, latency=0.0):
+        """
+        Starts serving the responses recorded in an archive.
+
+        :param str path: Specify the path of the archive
+        :param float latency: Specify the seconds waited before serving each response, emulates the network round trip
+        """
+
+        if latency < 0:
+            raise ValueError('latency must not be negative')
+
+        ReplayArchiveHandler.stop()
+
+        archive = zipfile.ZipFile(path, 'r')
+        index = json.loads(archive.read('index.json'))
+        metadata = json.loads(archive.read('metadata.json')) if 'metadata.json' in archive.namelist() else {}
+
+        with ReplayArchiveHandler.__lock:
+            ReplayArchiveHandler.__archive = archive
+            ReplayArchiveHandler.__index = index
+            ReplayArchiveHandler.__metadata = metadata
+            ReplayArchiveHandler.__latency = latency
+            ReplayArchiveHandler.__mode = ReplayArchiveHandler.REPLAY
+
+    @staticmethod
+    def stop():
+        """
+        Stops recording or replaying, a recorded archive is only complete once stopped.
+        """
+
+        with ReplayArchiveHandler.__lock:
+            archive = ReplayArchiveHandler.__archive
+            if archive is None:
+                return
+
+            if ReplayArchiveHandler.__mode == ReplayArchiveHandler.RECORD:
+                archive.writestr('index.json', json.dumps(ReplayArchiveHandler.__index))
+                archive.writestr('metadata.json', json.dumps(ReplayArchiveHandler.__metadata))
+
+            archive.close()
+
+            ReplayArchiveHandler.__archive = None
+            ReplayArchiveHandler.__index = {}
+            ReplayArchiveHandler.__metadata = {}
+            ReplayArchiveHandler.__bodies = set()
+            ReplayArchiveHandler.__mode = None
+
+    @staticmethod
+    def get_mode():
+        """
+        Retrieves the current mode.
+
+        :return: RECORD, REPLAY or None
+        """
+
+        return ReplayArchiveHandler.__mode
+
+    @staticmethod
+    def get_metadata():
+        """
+        Retrieves the description of the crawl being recorded or replayed.
+
+        :return: A dictionary (empty if the crawl was not described)
+        """
+
+        return dict(ReplayArchiveHandler.__metadata)
+
+    @staticmethod
+    def store(url, response):
+        """
+        Records a response, the last response of a url replaces the previous ones.
+
+        Retried requests are recorded on every try, hence, the response on which the crawl settled is the one replayed.
+
+        :param str url: Specify the requested url
+        :param requests.Response response: Specify the response
+        """
+
+        content = response.content
+        body = hashlib.sha256(content).hexdigest()
+
+        # The body is already decoded, hence, the headers describing the transfer no longer apply
+        headers = {key: value for key, value in response.headers.items()
+                   if key.lower() not in ['content-encoding', 'content-length', 'transfer-encoding', 'set-cookie']}
+
+        with ReplayArchiveHandler.__lock:
+            if ReplayArchiveHandler.__mode != ReplayArchiveHandler.RECORD:
+                return
+
+            if body not in ReplayArchiveHandler.__bodies:
+                ReplayArchiveHandler.__archive.writestr(f'bodies/{body}', content)
+                ReplayArchiveHandler.__bodies.add(body)
+
+            ReplayArchiveHandler.__index[url] = {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': headers,
+                'encoding': response.encoding,
+                'body': body,
+            }
+
+    @staticmethod
+    def fetch(url):
+        """
+        Serves the recorded response of a url after the simulated latency.
+
+        :param str url: Specify the requested url
+        :return: The recorded response, a 404 response if the url has not been recorded
+        """
+
+        time.sleep(ReplayArchiveHandler.__latency)
+
+        response = requests.Response()
+        response.url = url
+
+        with ReplayArchiveHandler.__lock:
+            entry = ReplayArchiveHandler.__index.get(url)
+
+            if entry is None:
+                response.status_code = 404
+                response.reason = 'Not Recorded'
+                response._content = b''
+                return response
+
+            response._content = ReplayArchiveHandler.__archive.read(f'bodies/{entry["body"]}')
+
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry['encoding']
+
+        return response
+
+    @staticmethod
+    def get_urls():
+        """
+        Retrieves the urls held by the archive being recorded or replayed.
+
+        :return: A list of urls
+        """
+
+        with ReplayArchiveHandler.__lock:
+            return list(ReplayArchiveHandler.__index)
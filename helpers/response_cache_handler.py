@@ -0,0 +1,414 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from helpers.date_time_handler import DateTimeHandler
+
+
+class ResponseCacheHandler:
+    """
+    Set of static methods that aid caching raw HTTP responses on disk.
+
+    Each url is stored as an entry (keyed by the url's hash) that points to a content-addressed body, identical bodies
+    are only stored once.
+
+    Attributes
+    ----------
+        IMMUTABLE           Time-to-live of responses that never change
+        __directory         Directory in which the responses are stored (disabled if None)
+        __max_size          Maximum size of the stored bodies in bytes
+        __policies          List of (url pattern, time-to-live function) pairs, the first matching pattern applies
+        __size              Size of the stored bodies in bytes, computed on first use
+        __lock              Guards the size and the eviction
+
+    Methods
+    -------
+        configure(directory='http_cache', max_size=2 * 1024 ** 3, policies=None):
+            Enables the cache.
+        disable():
+            Disables the cache, stored responses are kept on disk.
+        is_enabled():
+            Checks whether the cache is enabled.
+        get_default_policies():
+            Retrieves the time-to-live policies for the ESPN webpages.
+        get_ttl(url, stored_at=None):
+            Retrieves the time-to-live of a url's response in seconds.
+        fetch(url, send, is_complete=None):
+            Retrieves a response from the cache, sends (or revalidates) the request if it is missing, stale or rejected.
+        clear():
+            Removes every stored response.
+        __load(url):
+            Reads the stored entry of a url.
+        __store(url, response):
+            Stores a response along with its validators.
+        __discard(path):
+            Removes a stored entry.
+        __write_json(path, entry):
+            Writes an entry atomically.
+        __touch(path):
+            Marks an entry as recently used.
+        __to_response(url, entry):
+            Builds a response object out of a stored entry.
+        __evict():
+            Removes the least recently used entries until the stored bodies fit in 90% of the maximum size.
+    """
+
+    IMMUTABLE = None
+
+    __directory = None
+    __max_size = 2 * 1024 ** 3
+    __policies = []
+    __size = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def configure(directory='http_cache', max_size=2 * 1024 ** 3, policies=None):
+        """
+        Enables the cache.
+
+        :param str directory: Specify the directory in which the responses are stored
+        :param int max_size: Specify the maximum size of the stored bodies in bytes
+        :param list[tuple] policies: Specify a list of (url pattern, time-to-live function) pairs, the function receives
+                                     the pattern match and the time in which the response was stored (as a timestamp,
+                                     None if it has not been stored yet), then returns the time-to-live in seconds
+                                     (IMMUTABLE for never)
+        """
+
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError('max_size must be a positive integer')
+
+        os.makedirs(os.path.join(directory, 'entries'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+
+        with ResponseCacheHandler.__lock:
+            ResponseCacheHandler.__directory = directory
+            ResponseCacheHandler.__max_size = max_size
+            ResponseCacheHandler.__policies = [(re.compile(pattern), ttl) for pattern, ttl in
+                                               (ResponseCacheHandler.get_default_policies()
+                                                if policies is None else policies)]
+            ResponseCacheHandler.__size = None
+
+    @staticmethod
+    def disable():
+        """
+        Disables the cache, stored responses are kept on disk.
+        """
+
+        with ResponseCacheHandler.__lock:
+            ResponseCacheHandler.__directory = None
+
+    @staticmethod
+    def is_enabled():
+        """
+        Checks whether the cache is enabled.
+
+        :return: A boolean denoting if responses are being cached
+        """
+
+        return ResponseCacheHandler.__directory is not None
+
+    @staticmethod
+    def get_default_policies():
+        """
+        Retrieves the time-to-live policies for the ESPN webpages.
+
+        Squad webpages stored after the end of their season and fixtures webpages stored after the end of their day
+        are immutable, while the others are only kept for a short while (a webpage stored before the end of its season
+        or day is stale once it ends, hence, it is revalidated and stored again).
+
+        :return: A list of (url pattern, time-to-live function) pairs
+        """
+
+        def season_ttl(match, stored_at):
+            # Seasons are assumed to start in July, hence, a season ends once the following one starts
+            season_end = datetime.datetime(int(match.group(1)) + 1, 7, 1).timestamp()
+            if stored_at is not None and stored_at >= season_end:
+                return ResponseCacheHandler.IMMUTABLE
+            return 6 * 60 * 60
+
+        def day_ttl(match, stored_at):
+            day_end = (datetime.datetime.strptime(match.group(1), '%Y%m%d') + datetime.timedelta(days=1)).timestamp()
+            if stored_at is not None and stored_at >= day_end:
+                return ResponseCacheHandler.IMMUTABLE
+            return 30 * 60
+
+        return [
+            (r'/season/(\d{4})$', season_ttl),
+            (r'/date/(\d{8})$', day_ttl),
+            (r'.*', lambda match, stored_at: 24 * 60 * 60),
+        ]
+
+    @staticmethod
+    def get_ttl(url, stored_at=None):
+        """
+        Retrieves the time-to-live of a url's response in seconds.
+
+        :param str url: Specify the url
+        :param float stored_at: Specify the time in which the response was stored as a timestamp (not stored if None)
+        :return: The time-to-live in seconds, IMMUTABLE if the response never changes
+        """
+
+        for pattern, ttl in ResponseCacheHandler.__policies:
+            match = pattern.search(url)
+            if match:
+                return ttl(match, stored_at)
+
+        return 0
+
+    @staticmethod
+    def fetch(url, send, is_complete=None):
+        """
+        Retrieves a response from the cache, sends (or revalidates) the request if it is missing, stale or rejected.
+
+        Responses rejected by is_complete are not stored, and a stored response which is rejected is discarded before
+        the request is sent again, hence, an error webpage served with a 200 status code is never kept.
+
+        :param str url: Specify the requested url
+        :param callable send: Specify a function which sends the request given a dictionary of additional headers
+        :param callable is_complete: Specify a function which checks whether a response is complete (all are complete
+                                     if None)
+        :return: The response of the request
+        """
+
+        path, entry = ResponseCacheHandler.__load(url)
+
+        if entry is not None:
+            ttl = ResponseCacheHandler.get_ttl(url, entry['stored_at'])
+            if ttl is ResponseCacheHandler.IMMUTABLE or time.time() - entry['stored_at'] < ttl:
+                response = ResponseCacheHandler.__to_response(url, entry)
+                if is_complete is None or is_complete(response):
+                    ResponseCacheHandler.__touch(path)
+                    return response
+
+                ResponseCacheHandler.__discard(path)
+                entry = None
+
+        if entry is None:
+            response = send({})
+            if is_complete is None or is_complete(response):
+                ResponseCacheHandler.__store(url, response)
+            return response
+
+        validators = {}
+        if entry['headers'].get('ETag'):
+            validators['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            validators['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = send(validators)
+
+        if response.status_code == 304:
+            cached = ResponseCacheHandler.__to_response(url, entry)
+            if is_complete is None or is_complete(cached):
+                entry['stored_at'] = time.time()
+                ResponseCacheHandler.__write_json(path, entry)
+                return cached
+
+            # The stored response is rejected, hence, it is discarded and requested again without validators
+            ResponseCacheHandler.__discard(path)
+            response = send({})
+
+        if is_complete is None or is_complete(response):
+            ResponseCacheHandler.__store(url, response)
+        else:
+            ResponseCacheHandler.__discard(path)
+
+        return response
+
+    @staticmethod
+    def clear():
+        """
+        Removes every stored response.
+        """
+
+        with ResponseCacheHandler.__lock:
+            directory = ResponseCacheHandler.__directory
+            if directory is None:
+                return
+
+            for folder in ['entries', 'objects']:
+                for name in os.listdir(os.path.join(directory, folder)):
+                    os.remove(os.path.join(directory, folder, name))
+
+            ResponseCacheHandler.__size = 0
+
+    @staticmethod
+    def __load(url):
+        """
+        Reads the stored entry of a url.
+
+        :param str url: Specify the url
+        :return: The path of the entry and the entry itself (None if the url is not cached)
+        """
+
+        path = os.path.join(ResponseCacheHandler.__directory, 'entries',
+                            hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return path, None
+
+        if entry.get('url') != url or \
+                not os.path.exists(os.path.join(ResponseCacheHandler.__directory, 'objects', entry['body'])):
+            return path, None
+
+        return path, entry
+
+    @staticmethod
+    def __store(url, response):
+        """
+        Stores a response along with its validators.
+
+        :param str url: Specify the requested url
+        :param requests.Response response: Specify the response to be stored, only successful responses are stored
+        """
+
+        if response.status_code != 200:
+            return
+
+        directory = ResponseCacheHandler.__directory
+        content = response.content
+        body = hashlib.sha256(content).hexdigest()
+        body_path = os.path.join(directory, 'objects', body)
+
+        added = 0
+        if not os.path.exists(body_path):
+            temp_path = f'{body_path}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, body_path)
+            added = len(content)
+
+        entry = {
+            'url': url,
+            'status': response.status_code,
+            'headers': {key: response.headers[key] for key in ['Content-Type', 'ETag', 'Last-Modified']
+                        if key in response.headers},
+            'encoding': response.encoding,
+            'body': body,
+            'stored_at': time.time(),
+        }
+        ResponseCacheHandler.__write_json(
+            os.path.join(directory, 'entries', hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json'), entry)
+
+        with ResponseCacheHandler.__lock:
+            if ResponseCacheHandler.__size is None:
+                objects = os.path.join(directory, 'objects')
+                ResponseCacheHandler.__size = sum(os.path.getsize(os.path.join(objects, name))
+                                                  for name in os.listdir(objects))
+            else:
+                ResponseCacheHandler.__size += added
+
+            if ResponseCacheHandler.__size > ResponseCacheHandler.__max_size:
+                ResponseCacheHandler.__evict()
+
+    @staticmethod
+    def __discard(path):
+        """
+        Removes a stored entry.
+
+        Its body may be shared with other entries, hence, it is left on disk until clear is called.
+
+        :param str path: Specify the path of the entry
+        """
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def __write_json(path, entry):
+        """
+        Writes an entry atomically.
+
+        :param str path: Specify the path of the entry
+        :param dict entry: Specify the entry
+        """
+
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def __touch(path):
+        """
+        Marks an entry as recently used.
+
+        :param str path: Specify the path of the entry
+        """
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def __to_response(url, entry):
+        """
+        Builds a response object out of a stored entry.
+
+        :param str url: Specify the requested url
+        :param dict entry: Specify the stored entry
+        :return: The response object
+        """
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry['encoding']
+
+        with open(os.path.join(ResponseCacheHandler.__directory, 'objects', entry['body']), 'rb') as f:
+            response._content = f.read()
+
+        return response
+
+    @staticmethod
+    def __evict():
+        """
+        Removes the least recently used entries until the stored bodies fit in 90% of the maximum size.
+
+        Must be called while holding the lock.
+        """
+
+        directory = ResponseCacheHandler.__directory
+        entries_directory = os.path.join(directory, 'entries')
+        objects_directory = os.path.join(directory, 'objects')
+
+        entries = []
+        for name in os.listdir(entries_directory):
+            path = os.path.join(entries_directory, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entries.append((os.path.getmtime(path), path, json.load(f)['body']))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        entries.sort()
+        references = {}
+        for _, _, body in entries:
+            references[body] = references.get(body, 0) + 1
+
+        target = ResponseCacheHandler.__max_size * 0.9
+        for _, path, body in entries:
+            if ResponseCacheHandler.__size <= target:
+                break
+
+            os.remove(path)
+            references[body] -= 1
+
+            if references[body] == 0:
+                body_path = os.path.join(objects_directory, body)
+                ResponseCacheHandler.__size -= os.path.getsize(body_path)
+                os.remove(body_path)
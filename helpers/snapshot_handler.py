@@ -0,0 +1,300 @@
+import datetime
+import json
+import os
+import re
+import shutil
+import threading
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+class SnapshotHandler:
+    """
+    Set of static methods that aid storing snapshots in a columnar format (Parquet), as well as CSV for import/export.
+
+    A partitioned snapshot is a directory holding a file for each combination of the partition columns' values
+    (e.g. YEAR=2020/LEAGUE=Spanish%20LaLiga/part-0.parquet), along with a _common_metadata file which holds the
+    snapshot's schema and timestamp.
+
+    Parsed snapshot files are kept in memory for the lifetime of the process, a file is parsed again only if its
+    modification time or size has changed.
+
+    Attributes
+    ----------
+        __cache     Parsed snapshot files as {path: ((modification time, size), table)}, tables are immutable
+        __lock      Guards the cache
+
+    Methods
+    -------
+        write(df, path, timestamp=None, partition_cols=None):
+            Writes a snapshot along with the timestamp in which it was collected.
+        read(path, columns=None, filters=None):
+            Reads a snapshot, only the given columns of the partitions and rows matching the filters are retrieved.
+        read_timestamp(path):
+            Reads the timestamp in which a snapshot was collected.
+        read_columns(path):
+            Reads the names of the columns held by a snapshot.
+        clear_cache():
+            Discards every parsed snapshot file kept in memory.
+        __load(path, schema, partition_keys=None):
+            Parses a snapshot file, or retrieves it from the cache if it has not changed since it was parsed.
+        __read_schema(path):
+            Reads the schema of a snapshot.
+        __get_partitioning(schema):
+            Builds the hive partitioning of a partitioned snapshot out of its schema.
+        write_csv(df, path, timestamp=None, index=False):
+            Writes a CSV snapshot preceded by the timestamp in which it was collected.
+        read_csv(path, **kwargs):
+            Reads a CSV snapshot.
+        read_csv_timestamp(path):
+            Reads the timestamp in which a CSV snapshot was collected.
+    """
+
+    __cache = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def write(df, path, timestamp=None, partition_cols=None):
+        """
+        Writes a snapshot along with the timestamp in which it was collected.
+
+        The snapshot is written next to the path first, then it replaces the existing snapshot (if any). The rows keep
+        their order within each partition, while the partitions are ordered by their values.
+
+        :param pd.DataFrame df: Specify the snapshot's data, the index is not stored
+        :param str path: Specify the path of the snapshot
+        :param datetime.datetime timestamp: Specify the time in which the snapshot was collected (now if None)
+        :param list[str] partition_cols: Specify the columns by which the snapshot is partitioned (a single file if
+                                         None)
+        """
+
+        if timestamp is None:
+            timestamp = datetime.datetime.utcnow()
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), b'timestamp': str(timestamp).encode('utf-8')}
+        if partition_cols:
+            metadata[b'partition_cols'] = json.dumps(list(partition_cols)).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+
+        temp_path = f'{path}.tmp'
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        if partition_cols:
+            os.makedirs(temp_path)
+            for values, indices in df.groupby(list(partition_cols), sort=True, observed=True).indices.items():
+                if not isinstance(values, tuple):
+                    values = (values,)
+
+                directory = os.path.join(temp_path, *[f'{col}={quote(str(value), safe="")}'
+                                                      for col, value in zip(partition_cols, values)])
+                os.makedirs(directory)
+                pq.write_table(table.take(indices).drop(list(partition_cols)),
+                               os.path.join(directory, 'part-0.parquet'))
+
+            pq.write_metadata(table.schema, os.path.join(temp_path, '_common_metadata'))
+        else:
+            pq.write_table(table, temp_path)
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path) and partition_cols:
+            os.remove(path)
+        os.replace(temp_path, path)
+
+        with SnapshotHandler.__lock:
+            for key in [x for x in SnapshotHandler.__cache if x == path or x.startswith(path + os.sep)]:
+                del SnapshotHandler.__cache[key]
+
+    @staticmethod
+    def read(path, columns=None, filters=None):
+        """
+        Reads a snapshot, only the given columns of the partitions and rows matching the filters are retrieved.
+
+        Only the partitions matching the filters are parsed (or retrieved from the cache), the returned dataframe is a
+        copy which can be modified freely.
+
+        :param str path: Specify the path of the snapshot
+        :param list[str] columns: Specify the columns to be loaded (all if None)
+        :param list[tuple] filters: Specify a list of (column, operator, value) conditions which must all hold, such as
+                                    ('YEAR', 'in', [2019, 2020]) (all rows if None)
+        :return: A dataframe containing the snapshot
+        """
+
+        schema = SnapshotHandler.__read_schema(path)
+        if columns is None:
+            columns = schema.names
+        expression = pq.filters_to_expression(filters) if filters else None
+
+        if not os.path.isdir(path):
+            table = SnapshotHandler.__load(path, schema)
+        else:
+            dataset = ds.dataset(path, format='parquet', partitioning=SnapshotHandler.__get_partitioning(schema))
+            tables = [SnapshotHandler.__load(x.path, schema, ds.get_partition_keys(x.partition_expression))
+                      for x in dataset.get_fragments(filter=expression)]
+            table = pa.concat_tables(tables) if tables else schema.empty_table()
+
+        table = ds.dataset(table).to_table(columns=list(columns), filter=expression)
+
+        return table.replace_schema_metadata(schema.metadata).to_pandas()
+
+    @staticmethod
+    def read_timestamp(path):
+        """
+        Reads the timestamp in which a snapshot was collected.
+
+        :param str path: Specify the path of the snapshot
+        :return: A datetime object (None if the snapshot has no timestamp)
+        """
+
+        metadata = SnapshotHandler.__read_schema(path).metadata or {}
+
+        if b'timestamp' not in metadata:
+            return None
+
+        return datetime.datetime.fromisoformat(metadata[b'timestamp'].decode('utf-8'))
+
+    @staticmethod
+    def write_csv(df, path, timestamp=None, index=False):
+        """
+        Writes a CSV snapshot preceded by the timestamp in which it was collected.
+
+        :param pd.DataFrame df: Specify the snapshot's data
+        :param str path: Specify the path of the snapshot
+        :param datetime.datetime timestamp: Specify the time in which the snapshot was collected (now if None)
+        :param bool index: Specify whether to write the dataframe's index
+        """
+
+        if timestamp is None:
+            timestamp = datetime.datetime.utcnow()
+
+        f = open(path, "w+")
+        f.write(f'# Timestamp: {timestamp}\n')
+        f.close()
+
+        # noinspection PyTypeChecker
+        df.to_csv(path, index=index, mode='a')
+
+    @staticmethod
+    def read_csv(path, **kwargs):
+        """
+        Reads a CSV snapshot.
+
+        :param str path: Specify the path of the snapshot
+        :param kwargs: Specify additional arguments passed to pd.read_csv
+        :return: A dataframe containing the snapshot
+        """
+
+        return pd.read_csv(path, skiprows=1, **kwargs)
+
+    @staticmethod
+    def read_csv_timestamp(path):
+        """
+        Reads the timestamp in which a CSV snapshot was collected.
+
+        :param str path: Specify the path of the snapshot
+        :return: A datetime object (None if the snapshot has no timestamp)
+        """
+
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline()
+
+        timestamp = re.match(r'^# Timestamp: ([^,]+)', header)
+        if not timestamp:
+            return None
+
+        return datetime.datetime.fromisoformat(timestamp.group(1).strip())
+
+    @staticmethod
+    def read_columns(path):
+        """
+        Reads the names of the columns held by a snapshot.
+
+        :param str path: Specify the path of the snapshot
+        :return: A list of column names, partition columns included
+        """
+
+        return SnapshotHandler.__read_schema(path).names
+
+    @staticmethod
+    def clear_cache():
+        """
+        Discards every parsed snapshot file kept in memory.
+        """
+
+        with SnapshotHandler.__lock:
+            SnapshotHandler.__cache.clear()
+
+    @staticmethod
+    def __load(path, schema, partition_keys=None):
+        """
+        Parses a snapshot file, or retrieves it from the cache if it has not changed since it was parsed.
+
+        :param str path: Specify the path of the file
+        :param pa.Schema schema: Specify the snapshot's schema
+        :param dict partition_keys: Specify the values of the partition columns which are not stored in the file
+        :return: A table containing every column of the file along with the partition columns
+        """
+
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with SnapshotHandler.__lock:
+            cached = SnapshotHandler.__cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        table = pq.read_table(path)
+        for col, value in (partition_keys or {}).items():
+            field_type = schema.field(col).type
+            if pa.types.is_dictionary(field_type):
+                table = table.append_column(col, pa.array([value] * table.num_rows,
+                                                          field_type.value_type).dictionary_encode())
+            else:
+                table = table.append_column(col, pa.array([value] * table.num_rows, field_type))
+
+        with SnapshotHandler.__lock:
+            SnapshotHandler.__cache[path] = (signature, table)
+
+        return table
+
+    @staticmethod
+    def __read_schema(path):
+        """
+        Reads the schema of a snapshot.
+
+        :param str path: Specify the path of the snapshot
+        :return: The schema along with its metadata
+        """
+
+        if os.path.isdir(path):
+            return pq.read_schema(os.path.join(path, '_common_metadata'))
+
+        return pq.read_schema(path)
+
+    @staticmethod
+    def __get_partitioning(schema):
+        """
+        Builds the hive partitioning of a partitioned snapshot out of its schema.
+
+        :param pa.Schema schema: Specify the snapshot's schema
+        :return: The partitioning, directory names hold the values of the partition columns
+        """
+
+        partition_cols = json.loads(schema.metadata[b'partition_cols'].decode('utf-8'))
+
+        fields = []
+        for col in partition_cols:
+            field_type = schema.field(col).type
+            if pa.types.is_dictionary(field_type):
+                field_type = field_type.value_type
+            fields.append(pa.field(col, field_type))
+
+        return ds.partitioning(pa.schema(fields), flavor='hive')
@@ -0,0 +1,83 @@
+import contextlib
+import threading
+import time
+
+
+class StageTimerHandler:
+    """
+    Set of static methods that aid measuring the time spent in each stage of a crawl (fetch, parse, normalize, persist
+    and load).
+
+    The time of a stage is summed across the threads (and parser processes) running it, hence, it may exceed the wall
+    time of a concurrent crawl.
+
+    Attributes
+    ----------
+        __timings   Seconds spent and number of calls of each stage as {stage: [seconds, calls]}
+        __lock      Guards the timings
+
+    Methods
+    -------
+        measure(stage):
+            Measures the time spent in a block of code and adds it to a stage.
+        add(stage, seconds, calls=1):
+            Adds the time spent in a stage.
+        get_timings():
+            Retrieves the seconds spent and number of calls of each stage.
+        reset():
+            Nullifies the timings.
+    """
+
+    __timings = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def measure(stage):
+        """
+        Measures the time spent in a block of code and adds it to a stage.
+
+        :param str stage: Specify the name of the stage
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            StageTimerHandler.add(stage, time.perf_counter() - start)
+
+    @staticmethod
+    def add(stage, seconds, calls=1):
+        """
+        Adds the time spent in a stage.
+
+        :param str stage: Specify the name of the stage
+        :param float seconds: Specify the seconds spent
+        :param int calls: Specify the number of calls which took these seconds
+        """
+
+        with StageTimerHandler.__lock:
+            timing = StageTimerHandler.__timings.setdefault(stage, [0.0, 0])
+            timing[0] += seconds
+            timing[1] += calls
+
+    @staticmethod
+    def get_timings():
+        """
+        Retrieves the seconds spent and number of calls of each stage.
+
+        :return: A dictionary of {'seconds': float, 'calls': int} keyed by stage
+        """
+
+        with StageTimerHandler.__lock:
+            return {stage: {'seconds': seconds, 'calls': calls}
+                    for stage, (seconds, calls) in StageTimerHandler.__timings.items()}
+
+    @staticmethod
+    def reset():
+        """
+        Nullifies the timings.
+        """
+
+        with StageTimerHandler.__lock:
+            StageTimerHandler.__timings = {}
@@ -1,23 +1,87 @@
+import sys
+import threading
+import weakref
+
+
 class Club:
     """
     A container for storing club id as well as club name.
 
+    Clubs are interned: creating a club whose id, name and league are already held returns the existing object. Clubs
+    are compared and hashed by their id, name and league, which must not be modified.
+
     Attributes
     ----------
+        club_id         Id of the club, the same club has the same id in each of its leagues
+        name            Name of the club
+        league          League in which the club plays
+        __interned      Interned clubs keyed by (club id, name, league), dropped once they are no longer referenced
+        __lock          Guards the interned clubs
 
     Methods
     -------
-        __init__(self, club_id, name):
+        __new__(cls, club_id, name, league):
+            Retrieves the interned club, creates it if it does not exist.
+        __init__(self, club_id, name, league):
             Initializes the attributes.
+        __getnewargs__(self):
+            Retrieves the arguments by which an unpickled club is interned.
     """
 
+    __slots__ = ('club_id', 'name', 'league', '__weakref__')
+
+    __interned = weakref.WeakValueDictionary()
+    __lock = threading.Lock()
+
+    def __new__(cls, club_id, name, league):
+        """
+        Retrieves the interned club, creates it if it does not exist.
+
+        :param club_id: Specify the id of the club
+        :param str name: Specify the name of the club
+        :param League league: Specify the league in which the club plays
+        :return: The interned object
+        """
+
+        key = (club_id, name, league)
+
+        with Club.__lock:
+            club = Club.__interned.get(key)
+            if club is None:
+                club = super().__new__(cls)
+                Club.__interned[key] = club
+
+        return club
+
     def __init__(self, club_id, name, league):
         """
         Initializes the attributes.
 
+        :param club_id: Specify the id of the club
+        :param str name: Specify the name of the club
+        :param League league: Specify the league in which the club plays
         :return: The object itself
         """
 
         self.club_id = club_id
-        self.name = name
+        self.name = sys.intern(name)
         self.league = league
+
+    def __getnewargs__(self):
+        """
+        Retrieves the arguments by which an unpickled club is interned.
+
+        :return: A (club id, name, league) tuple
+        """
+
+        return self.club_id, self.name, self.league
+
+    def __eq__(self, other):
+        return isinstance(other, Club) and \
+               (self.club_id, self.name, self.league) == (other.club_id, other.name, other.league)
+
+    def __hash__(self):
+        return hash((self.club_id, self.name, self.league))
+
+    def __repr__(self):
+        return f'Club({self.club_id!r}, {self.name!r}, {self.league!r})'
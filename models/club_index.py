@@ -0,0 +1,143 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class ClubIndex:
+    """
+    An index of the matches played by each club, whether it is club1 or club2, hence, the matches of a club are
+    retrieved in time proportional to their number instead of scanning the whole matches.
+
+    The positions of all clubs are stored back to back (sorted by club, then by position), the positions of a club lie
+    between its offset and the offset of the next club.
+
+    Attributes
+    ----------
+        clubs           Names of the indexed clubs
+        offsets         Offset of the positions of each club, followed by the number of positions
+        positions       Positions of the matches of all clubs
+        __codes         Code (rank in clubs) of each club
+
+    Methods
+    -------
+        __init__(self, clubs, offsets, positions):
+            Initializes the attributes.
+        build(club1, club2):
+            Indexes the positions of the matches by club.
+        load(path, key):
+            Reads an index which has been saved along with the given key.
+        save(self, path, key):
+            Writes the index along with a key which identifies the indexed matches.
+        __len__(self):
+            Retrieves the number of indexed clubs.
+        get_positions(self, club):
+            Retrieves the positions of the matches played by a club.
+    """
+
+    def __init__(self, clubs, offsets, positions):
+        """
+        Initializes the attributes.
+
+        :param list[str] clubs: Specify the names of the indexed clubs
+        :param np.ndarray offsets: Specify the offset of the positions of each club, followed by the number of positions
+        :param np.ndarray positions: Specify the positions of the matches of all clubs
+        :return: The object itself
+        """
+
+        if len(offsets) != len(clubs) + 1:
+            raise ValueError('offsets must hold an offset for each club followed by the number of positions')
+
+        self.clubs = list(clubs)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.positions.setflags(write=False)
+        self.__codes = {club: code for code, club in enumerate(self.clubs)}
+
+    @staticmethod
+    def build(club1, club2):
+        """
+        Indexes the positions of the matches by club.
+
+        :param pd.Series club1: Specify the first club of each match
+        :param pd.Series club2: Specify the second club of each match
+        :return: A ClubIndex object
+        """
+
+        codes, clubs = pd.factorize(np.concatenate([np.asarray(club1, dtype=object), np.asarray(club2, dtype=object)]))
+        rows = np.tile(np.arange(len(club1), dtype=np.int64), 2)
+
+        # Matches with an unknown club (null code -1) are not indexed
+        known = codes >= 0
+        codes, rows = codes[known], rows[known]
+
+        order = np.lexsort((rows, codes))
+        codes, rows = codes[order], rows[order]
+
+        # A club which is both club1 and club2 of a match is indexed once for it
+        unique = np.r_[True, (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])]
+        codes, rows = codes[unique], rows[unique]
+
+        offsets = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(clubs)))]
+
+        return ClubIndex(list(clubs), offsets, rows)
+
+    @staticmethod
+    def load(path, key):
+        """
+        Reads an index which has been saved along with the given key.
+
+        :param str path: Specify the path of the index file
+        :param str key: Specify the key which identifies the indexed matches
+        :return: A ClubIndex object, None if the file does not exist or has been saved along with another key
+        """
+
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path, allow_pickle=False) as f:
+            if str(f['key']) != key:
+                return None
+
+            return ClubIndex(f['clubs'].tolist(), f['offsets'], f['positions'])
+
+    def save(self, path, key):
+        """
+        Writes the index along with a key which identifies the indexed matches.
+
+        The index is written next to the path first, then it replaces the existing file (if any).
+
+        :param str path: Specify the path of the index file
+        :param str key: Specify the key which identifies the indexed matches
+        """
+
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, key=np.array(key), clubs=np.array(self.clubs, dtype=str), offsets=self.offsets,
+                     positions=self.positions)
+
+        os.replace(temp_path, path)
+
+    def __len__(self):
+        """
+        Retrieves the number of indexed clubs.
+
+        :return: The number of clubs
+        """
+
+        return len(self.clubs)
+
+    def get_positions(self, club):
+        """
+        Retrieves the positions of the matches played by a club.
+
+        :param str club: Specify the club
+        :return: A read-only array of positions in ascending order (empty if the club has not played)
+        """
+
+        code = self.__codes.get(club)
+
+        if code is None:
+            return np.array([], dtype=np.int64)
+
+        return self.positions[self.offsets[code]:self.offsets[code + 1]]
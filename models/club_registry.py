@@ -0,0 +1,116 @@
+class ClubRegistry:
+    """
+    A catalogue of clubs indexed by club id, club name and league name, hence, clubs and leagues are resolved in
+    constant time rather than by scanning the clubs.
+
+    The same club appears once per league it plays in, hence, every index retrieves a list of clubs. The indexes hold
+    the positions of the clubs in the catalogue, so clubs are always retrieved in the order of the catalogue.
+
+    Attributes
+    ----------
+        clubs           Clubs of the catalogue
+        leagues         Leagues of the clubs keyed by league name
+        __by_id         Positions of the clubs keyed by club id (as str)
+        __by_name       Positions of the clubs keyed by club name
+        __by_league     Positions of the clubs keyed by league name
+
+    Methods
+    -------
+        __init__(self, clubs):
+            Indexes the clubs.
+        get_by_id(self, club_id):
+            Retrieves the clubs (one per league) of a club id.
+        get_by_name(self, name):
+            Retrieves the clubs (one per league) of a club name.
+        get_by_league(self, league_name):
+            Retrieves the clubs of a league.
+        get_league(self, league_name):
+            Retrieves a league by its name.
+        select(self, league_names=None, club_names=None):
+            Retrieves the clubs playing in any of the leagues and named after any of the club names.
+    """
+
+    def __init__(self, clubs):
+        """
+        Indexes the clubs.
+
+        :param iterable clubs: Specify the clubs
+        :return: The object itself
+        """
+
+        self.clubs = list(clubs)
+        self.leagues = {}
+        self.__by_id = {}
+        self.__by_name = {}
+        self.__by_league = {}
+
+        for position, club in enumerate(self.clubs):
+            self.__by_id.setdefault(str(club.club_id), []).append(position)
+            self.__by_name.setdefault(club.name, []).append(position)
+            self.__by_league.setdefault(club.league.name, []).append(position)
+            self.leagues.setdefault(club.league.name, club.league)
+
+    def get_by_id(self, club_id):
+        """
+        Retrieves the clubs (one per league) of a club id.
+
+        :param club_id: Specify the club id, either as int or str
+        :return: A list of clubs (empty if the id is unknown)
+        """
+
+        return [self.clubs[x] for x in self.__by_id.get(str(club_id), [])]
+
+    def get_by_name(self, name):
+        """
+        Retrieves the clubs (one per league) of a club name.
+
+        :param str name: Specify the club name
+        :return: A list of clubs (empty if the name is unknown)
+        """
+
+        return [self.clubs[x] for x in self.__by_name.get(name, [])]
+
+    def get_by_league(self, league_name):
+        """
+        Retrieves the clubs of a league.
+
+        :param str league_name: Specify the league name
+        :return: A list of clubs (empty if the league is unknown)
+        """
+
+        return [self.clubs[x] for x in self.__by_league.get(league_name, [])]
+
+    def get_league(self, league_name):
+        """
+        Retrieves a league by its name.
+
+        :param str league_name: Specify the league name
+        :return: The league, None if it is unknown
+        """
+
+        return self.leagues.get(league_name)
+
+    def select(self, league_names=None, club_names=None):
+        """
+        Retrieves the clubs playing in any of the leagues and named after any of the club names.
+
+        The positions are drawn from the indexes of the requested names, hence, the cost depends on the number of
+        matching clubs rather than the size of the catalogue.
+
+        :param iterable league_names: Specify the league names (any league if None)
+        :param iterable club_names: Specify the club names (any club if None)
+        :return: A list of clubs, in the order of the catalogue
+        """
+
+        if league_names is None and club_names is None:
+            return list(self.clubs)
+
+        positions = None
+        for names, index in ((league_names, self.__by_league), (club_names, self.__by_name)):
+            if names is None:
+                continue
+
+            matching = {x for name in set(names) for x in index.get(name, [])}
+            positions = matching if positions is None else positions & matching
+
+        return [self.clubs[x] for x in sorted(positions)]
@@ -0,0 +1,237 @@
+import datetime
+import json
+import os
+import threading
+
+
+class CrawlJournal:
+    """
+    An append-only journal of the crawled work units along with their parsed rows, which lets an interrupted crawl
+    resume from its last checkpoint without fetching the recorded work units again.
+
+    The first line of the journal is a header which holds the parameters of the crawl and the time in which it started,
+    a journal which has been written by a crawl with other parameters is discarded rather than resumed. Each following
+    line holds a work unit (a day, a (league, club, season) partition, etc.), its rows and the time in which it was
+    recorded in JSON, datetimes are stored as {"__datetime__": ISO 8601} objects in order to be restored as they were.
+    Lines are written in batches, a line which has been cut short by a crash is discarded when the journal is reopened.
+
+    Attributes
+    ----------
+        path            Path of the journal file
+        parameters      Parameters of the crawl, as stored in the header
+        is_final        Checks whether a work unit could not change anymore by the time it was recorded, the units which
+                        were not final (e.g. the current day or season) are crawled again rather than resumed
+        flush_every     Number of recorded work units which are held in memory before being written to the journal
+        entries         Rows of each recorded work unit
+        pending         Journal lines which have not been written yet
+        lock            Serializes the records of concurrent crawlers
+
+    Methods
+    -------
+        __init__(self, path, parameters=None, is_final=None, flush_every=25):
+            Initializes the attributes, then loads the work units recorded by a previous crawl.
+        __contains__(self, unit):
+            Checks whether a work unit has been recorded.
+        __len__(self):
+            Retrieves the number of recorded work units.
+        get_rows(self, unit):
+            Retrieves the rows of a recorded work unit.
+        record(self, unit, rows):
+            Records the rows of a crawled work unit, the journal is flushed every flush_every work units.
+        flush(self):
+            Writes the pending work units to the journal.
+        remove(self):
+            Deletes the journal once the crawl's result has been stored.
+        __load(self):
+            Loads the work units recorded by a previous crawl with the same parameters, discarding a trailing line which
+            has been cut short as well as the work units which were not final.
+        __to_key(unit):
+            Converts a work unit into a hashable key (lists are turned into tuples).
+        __encode(value):
+            Converts a value which JSON does not support into a JSON object.
+        __decode(obj):
+            Restores a value which has been converted by __encode.
+    """
+
+    def __init__(self, path, parameters=None, is_final=None, flush_every=25):
+        """
+        Initializes the attributes, then loads the work units recorded by a previous crawl.
+
+        :param str path: Specify the path of the journal file
+        :param dict parameters: Specify the parameters of the crawl, they must be JSON serializable
+        :param callable is_final: Specify a function which receives a work unit and the datetime in which it was
+                                  recorded, then checks whether the unit could not change anymore (all are final if
+                                  None)
+        :param int flush_every: Specify the number of recorded work units held in memory before being written
+        :return: The object itself
+        """
+
+        if not isinstance(flush_every, int) or flush_every < 1:
+            raise ValueError('flush_every must be a positive integer')
+
+        self.path = path
+        # Parameters are compared as they are read back from the header (tuples become lists, etc.)
+        self.parameters = json.loads(json.dumps(parameters, default=CrawlJournal.__encode),
+                                     object_hook=CrawlJournal.__decode)
+        self.is_final = is_final
+        self.flush_every = flush_every
+        self.entries = {}
+        self.pending = []
+        self.lock = threading.Lock()
+
+        self.__load()
+
+    def __contains__(self, unit):
+        """
+        Checks whether a work unit has been recorded.
+
+        :param unit: Specify the work unit
+        :return: True if the work unit has been recorded
+        """
+
+        return CrawlJournal.__to_key(unit) in self.entries
+
+    def __len__(self):
+        """
+        Retrieves the number of recorded work units.
+
+        :return: The number of work units
+        """
+
+        return len(self.entries)
+
+    def get_rows(self, unit):
+        """
+        Retrieves the rows of a recorded work unit.
+
+        :param unit: Specify the work unit
+        :return: The rows as recorded
+        """
+
+        return self.entries[CrawlJournal.__to_key(unit)]
+
+    def record(self, unit, rows):
+        """
+        Records the rows of a crawled work unit, the journal is flushed every flush_every work units.
+
+        :param unit: Specify the work unit, it must be JSON serializable (tuples are stored as lists)
+        :param list rows: Specify the parsed rows of the work unit, they must be JSON serializable or datetimes
+        """
+
+        line = json.dumps({'unit': unit, 'rows': rows, 'recorded_at': datetime.datetime.now()},
+                          default=CrawlJournal.__encode)
+
+        with self.lock:
+            self.entries[CrawlJournal.__to_key(unit)] = rows
+            self.pending.append(line)
+
+        if len(self.pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the pending work units to the journal.
+        """
+
+        with self.lock:
+            if not self.pending:
+                return
+
+            if not os.path.exists(self.path):
+                header = {'header': {'parameters': self.parameters, 'started_at': datetime.datetime.now()}}
+                self.pending.insert(0, json.dumps(header, default=CrawlJournal.__encode))
+
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(line + '\n' for line in self.pending))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.pending = []
+
+    def remove(self):
+        """
+        Deletes the journal once the crawl's result has been stored.
+        """
+
+        self.entries = {}
+        self.pending = []
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __load(self):
+        """
+        Loads the work units recorded by a previous crawl with the same parameters, discarding a trailing line which has
+        been cut short as well as the work units which were not final.
+        """
+
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb') as f:
+            content = f.read()
+
+        # Only complete lines are kept, the journal is truncated after the last one so that new lines are not appended
+        # to a partial line
+        end = content.rfind(b'\n') + 1
+        lines = content[:end].splitlines()
+
+        header = json.loads(lines[0], object_hook=CrawlJournal.__decode).get('header') if lines else None
+        if header is None or header.get('parameters') != self.parameters:
+            print(f'Discarding {self.path}, it has not been recorded by a crawl with the same parameters')
+            os.remove(self.path)
+            return
+
+        for line in lines[1:]:
+            entry = json.loads(line, object_hook=CrawlJournal.__decode)
+            if self.is_final is None or self.is_final(entry['unit'], entry['recorded_at']):
+                self.entries[CrawlJournal.__to_key(entry['unit'])] = entry['rows']
+
+        if end != len(content):
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+
+        print(f'Resuming crawl started at {header["started_at"]:%Y-%m-%d %H:%M}, {len(self.entries)} work unit(s) have '
+              f'been recorded in {self.path}')
+
+    @staticmethod
+    def __to_key(unit):
+        """
+        Converts a work unit into a hashable key (lists are turned into tuples).
+
+        :param unit: Specify the work unit
+        :return: The key of the work unit
+        """
+
+        if isinstance(unit, (list, tuple)):
+            return tuple(CrawlJournal.__to_key(x) for x in unit)
+
+        return unit
+
+    @staticmethod
+    def __encode(value):
+        """
+        Converts a value which JSON does not support into a JSON object.
+
+        :param value: Specify the value
+        :return: A dict holding the value
+        """
+
+        if isinstance(value, datetime.datetime):
+            return {'__datetime__': value.isoformat()}
+
+        raise TypeError(f'{type(value).__name__} cannot be recorded in the journal')
+
+    @staticmethod
+    def __decode(obj):
+        """
+        Restores a value which has been converted by __encode.
+
+        :param dict obj: Specify a decoded JSON object
+        :return: The restored value, otherwise, the object itself
+        """
+
+        if '__datetime__' in obj:
+            return datetime.datetime.fromisoformat(obj['__datetime__'])
+
+        return obj
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+
+class HeadToHeadIndex:
+    """
+    An index of the matches played between each pair of clubs, hence, the matches of a rivalry are retrieved by a
+    single lookup instead of scanning the whole matches.
+
+    A pair is unordered: the matches between two clubs are retrieved whichever of them is club1.
+
+    Attributes
+    ----------
+        __codes         Code of each club
+        __pairs         Positions of the matches keyed by the codes of the pair (lowest code first)
+
+    Methods
+    -------
+        __init__(self, club1, club2):
+            Indexes the positions of the matches by pair of clubs.
+        __len__(self):
+            Retrieves the number of indexed pairs.
+        get_positions(self, club_a, club_b):
+            Retrieves the positions of the matches played between two clubs.
+    """
+
+    def __init__(self, club1, club2):
+        """
+        Indexes the positions of the matches by pair of clubs.
+
+        :param pd.Series club1: Specify the first club of each match
+        :param pd.Series club2: Specify the second club of each match
+        :return: The object itself
+        """
+
+        codes, clubs = pd.factorize(np.concatenate([np.asarray(club1, dtype=object), np.asarray(club2, dtype=object)]))
+        codes1, codes2 = codes[:len(club1)], codes[len(club1):]
+
+        # Matches with an unknown club (null code -1) are not indexed
+        positions = np.flatnonzero((codes1 >= 0) & (codes2 >= 0))
+        low = np.minimum(codes1[positions], codes2[positions]).astype(np.int64)
+        high = np.maximum(codes1[positions], codes2[positions]).astype(np.int64)
+        keys = low * len(clubs) + high
+
+        # A stable sort keeps the positions of each pair in ascending order
+        order = np.argsort(keys, kind='stable')
+        keys, positions = keys[order], positions[order]
+        positions.setflags(write=False)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=np.int64)
+
+        self.__codes = {club: code for code, club in enumerate(clubs)}
+        self.__pairs = {(int(keys[x]) // len(clubs), int(keys[x]) % len(clubs)): group
+                        for x, group in zip(starts, np.split(positions, starts[1:]))}
+
+    def __len__(self):
+        """
+        Retrieves the number of indexed pairs.
+
+        :return: The number of pairs
+        """
+
+        return len(self.__pairs)
+
+    def get_positions(self, club_a, club_b):
+        """
+        Retrieves the positions of the matches played between two clubs.
+
+        :param str club_a: Specify a club of the pair
+        :param str club_b: Specify the other club of the pair
+        :return: A read-only array of positions in ascending order (empty if the clubs have not played each other)
+        """
+
+        code_a = self.__codes.get(club_a)
+        code_b = self.__codes.get(club_b)
+
+        if code_a is None or code_b is None:
+            return np.array([], dtype=np.int64)
+
+        return self.__pairs.get((min(code_a, code_b), max(code_a, code_b)), np.array([], dtype=np.int64))
@@ -0,0 +1,107 @@
+import bisect
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies whose buckets grow exponentially, hence, it holds a fixed number of counters however many
+    latencies are added, while quantiles are estimated within a factor of the growth.
+
+    The histogram is not guarded by a lock, its owner is expected to guard it.
+
+    Attributes
+    ----------
+        bounds      Upper bound of each bucket in seconds, the last bucket holds the latencies above the last bound
+        counts      Number of latencies held by each bucket
+        count       Number of added latencies
+        total       Sum of the added latencies in seconds
+        max         Highest added latency in seconds
+
+    Methods
+    -------
+        __init__(self, smallest=0.001, growth=2, buckets=20):
+            Initializes the attributes, the histogram starts empty.
+        add(self, seconds):
+            Adds a latency.
+        quantile(self, q):
+            Estimates a quantile of the added latencies.
+        to_dict(self):
+            Summarizes the histogram as a JSON serializable dictionary.
+    """
+
+    def __init__(self, smallest=0.001, growth=2, buckets=20):
+        """
+        Initializes the attributes, the histogram starts empty.
+
+        :param float smallest: Specify the upper bound of the first bucket in seconds
+        :param float growth: Specify the factor between the upper bounds of consecutive buckets
+        :param int buckets: Specify the number of bounded buckets
+        :return: The object itself
+        """
+
+        if smallest <= 0 or growth <= 1:
+            raise ValueError('smallest must be positive and growth must be greater than 1')
+
+        if not isinstance(buckets, int) or buckets < 1:
+            raise ValueError('buckets must be a positive integer')
+
+        self.bounds = [smallest * growth ** x for x in range(buckets)]
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """
+        Adds a latency.
+
+        :param float seconds: Specify the latency in seconds
+        """
+
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """
+        Estimates a quantile of the added latencies.
+
+        :param float q: Specify the quantile between 0 and 1
+        :return: The upper bound of the bucket holding the quantile (at most the highest latency), None if empty
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError('q must be between 0 and 1')
+
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen > 0:
+                return min(bound, self.max)
+
+        return self.max
+
+    def to_dict(self):
+        """
+        Summarizes the histogram as a JSON serializable dictionary.
+
+        :return: A dictionary of the count, mean, quantiles, highest latency and non-empty buckets
+        """
+
+        buckets = {f'<={bound:g}': count for bound, count in zip(self.bounds, self.counts) if count}
+        if self.counts[-1]:
+            buckets[f'>{self.bounds[-1]:g}'] = self.counts[-1]
+
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'max': self.max if self.count else None,
+            'buckets': buckets,
+        }
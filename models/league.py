@@ -1,22 +1,83 @@
+import sys
+import threading
+import weakref
+
+
 class League:
     """
     A container for storing league url as well as league name.
 
+    Leagues are interned: creating a league whose url and name are already held returns the existing object, hence,
+    the clubs of a league share a single league object. Leagues are compared and hashed by their url and name, which
+    must not be modified.
+
     Attributes
     ----------
+        url             Url of the league (e.g. esp.1)
+        name            Name of the league
+        __interned      Interned leagues keyed by (url, name), a league is dropped once it is no longer referenced
+        __lock          Guards the interned leagues
 
     Methods
     -------
+        __new__(cls, url, name):
+            Retrieves the interned league, creates it if it does not exist.
         __init__(self, url, name):
             Initializes the attributes.
+        __getnewargs__(self):
+            Retrieves the arguments by which an unpickled league is interned.
     """
 
+    __slots__ = ('url', 'name', '__weakref__')
+
+    __interned = weakref.WeakValueDictionary()
+    __lock = threading.Lock()
+
+    def __new__(cls, url, name):
+        """
+        Retrieves the interned league, creates it if it does not exist.
+
+        :param str url: Specify the url of the league
+        :param str name: Specify the name of the league
+        :return: The interned object
+        """
+
+        key = (url, name)
+
+        with League.__lock:
+            league = League.__interned.get(key)
+            if league is None:
+                league = super().__new__(cls)
+                League.__interned[key] = league
+
+        return league
+
     def __init__(self, url, name):
         """
         Initializes the attributes.
 
+        :param str url: Specify the url of the league
+        :param str name: Specify the name of the league
         :return: The object itself
         """
 
-        self.url = url
-        self.name = name
+        self.url = sys.intern(url)
+        self.name = sys.intern(name)
+
+    def __getnewargs__(self):
+        """
+        Retrieves the arguments by which an unpickled league is interned.
+
+        :return: A (url, name) tuple
+        """
+
+        return self.url, self.name
+
+    def __eq__(self, other):
+        return isinstance(other, League) and (self.url, self.name) == (other.url, other.name)
+
+    def __hash__(self):
+        return hash((self.url, self.name))
+
+    def __repr__(self):
+        return f'League({self.url!r}, {self.name!r})'
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+from models.club_index import ClubIndex
+from models.head_to_head_index import HeadToHeadIndex
+
+
+class MatchStore:
+    """
+    A container for holding the matches in memory along with the indexes over their rows. The index of the matches of
+    each club is built along with the store (unless it is given), the remaining indexes are built on their first use.
+
+    The matches are kept sorted by date (matches of the same date keep their order), hence, the matches within a range
+    of dates are a contiguous slice found by binary search, and the positions retrieved by any index are sorted by date
+    as well.
+
+    Attributes
+    ----------
+        matches         Matches held by the store sorted by date, indexed by position
+        club_index      Index of the matches played by each club
+        __dates         Dates of the matches as datetime64
+        __head_to_head  Index of the matches played between each pair of clubs (None until it is used)
+
+    Methods
+    -------
+        __init__(self, matches, club_index=None):
+            Initializes the attributes, sorts the matches by date and builds the index of the matches of each club if
+            it is not given.
+        get_matches(self, start_date=None, end_date=None, columns=None):
+            Retrieves the matches played within a range of dates.
+        get_club_matches(self, club, start_date=None, end_date=None, columns=None):
+            Retrieves the matches played by a club.
+        get_head_to_head_index(self):
+            Retrieves the index of the matches played between each pair of clubs, builds it if it does not exist.
+        get_head_to_head(self, club_a, club_b, start_date=None, end_date=None, columns=None):
+            Retrieves the matches played between two clubs.
+        __get_bounds(dates, start_date=None, end_date=None):
+            Finds the slice of sorted dates which lies within a range of dates.
+        __take(self, positions, start_date=None, end_date=None, columns=None):
+            Retrieves the matches at the given positions which were played within a range of dates.
+    """
+
+    def __init__(self, matches, club_index=None):
+        """
+        Initializes the attributes, sorts the matches by date and builds the index of the matches of each club if it
+        is not given.
+
+        :param pd.DataFrame matches: Specify the matches, must not be modified afterwards
+        :param ClubIndex club_index: Specify the index of the matches of each club, as built out of the matches sorted
+                                     by date (built if None)
+        :return: The object itself
+        """
+
+        if not pd.api.types.is_datetime64_dtype(matches['date']):
+            matches = matches.assign(date=pd.to_datetime(matches['date']))
+
+        # Snapshots are written sorted by date, hence, they are not sorted again
+        if not matches['date'].is_monotonic_increasing:
+            matches = matches.sort_values('date', kind='mergesort')
+
+        self.matches = matches.reset_index(drop=True)
+        self.club_index = club_index if club_index is not None else \
+            ClubIndex.build(self.matches['club1'], self.matches['club2'])
+        self.__dates = self.matches['date'].to_numpy()
+        self.__head_to_head = None
+
+    def get_matches(self, start_date=None, end_date=None, columns=None):
+        """
+        Retrieves the matches played within a range of dates.
+
+        :param datetime.date start_date: Specify the first date of the range (no bound if None)
+        :param datetime.date end_date: Specify the last date of the range (no bound if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe sliced out of the store, it must be copied before being modified
+        """
+
+        start, stop = MatchStore.__get_bounds(self.__dates, start_date, end_date)
+        matches = self.matches.iloc[start:stop]
+
+        return matches if columns is None else matches[list(columns)]
+
+    def get_club_matches(self, club, start_date=None, end_date=None, columns=None):
+        """
+        Retrieves the matches played by a club.
+
+        :param str club: Specify the club, whether it is club1 or club2
+        :param datetime.date start_date: Specify the first date of the range (no bound if None)
+        :param datetime.date end_date: Specify the last date of the range (no bound if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe containing the matches sorted by date
+        """
+
+        return self.__take(self.club_index.get_positions(club), start_date, end_date, columns)
+
+    def get_head_to_head_index(self):
+        """
+        Retrieves the index of the matches played between each pair of clubs, builds it if it does not exist.
+
+        :return: A HeadToHeadIndex object
+        """
+
+        if self.__head_to_head is None:
+            self.__head_to_head = HeadToHeadIndex(self.matches['club1'], self.matches['club2'])
+
+        return self.__head_to_head
+
+    def get_head_to_head(self, club_a, club_b, start_date=None, end_date=None, columns=None):
+        """
+        Retrieves the matches played between two clubs.
+
+        :param str club_a: Specify a club of the pair
+        :param str club_b: Specify the other club of the pair
+        :param datetime.date start_date: Specify the first date of the range (no bound if None)
+        :param datetime.date end_date: Specify the last date of the range (no bound if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe containing the matches sorted by date
+        """
+
+        return self.__take(self.get_head_to_head_index().get_positions(club_a, club_b), start_date, end_date, columns)
+
+    @staticmethod
+    def __get_bounds(dates, start_date=None, end_date=None):
+        """
+        Finds the slice of sorted dates which lies within a range of dates.
+
+        :param np.ndarray dates: Specify the sorted dates as datetime64
+        :param datetime.date start_date: Specify the first date of the range (no bound if None)
+        :param datetime.date end_date: Specify the last date of the range (no bound if None)
+        :return: A (start, stop) pair of positions
+        """
+
+        start = 0 if start_date is None else \
+            int(np.searchsorted(dates, pd.Timestamp(start_date).to_datetime64(), side='left'))
+        stop = len(dates) if end_date is None else \
+            int(np.searchsorted(dates, pd.Timestamp(end_date).to_datetime64(), side='right'))
+
+        return start, max(start, stop)
+
+    def __take(self, positions, start_date=None, end_date=None, columns=None):
+        """
+        Retrieves the matches at the given positions which were played within a range of dates, only these rows are
+        copied.
+
+        :param np.ndarray positions: Specify the positions of the matches in ascending order
+        :param datetime.date start_date: Specify the first date of the range (no bound if None)
+        :param datetime.date end_date: Specify the last date of the range (no bound if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe containing the matches
+        """
+
+        # Ascending positions have ascending dates, hence, the range is found by binary search as well
+        start, stop = MatchStore.__get_bounds(self.__dates[positions], start_date, end_date)
+        positions = positions[start:stop]
+
+        if columns is None:
+            return self.matches.iloc[positions]
+
+        indexer = self.matches.columns.get_indexer(list(columns))
+        if (indexer == -1).any():
+            raise KeyError(f'{[x for x, i in zip(columns, indexer) if i == -1]} not in the matches')
+
+        return self.matches.iloc[positions, indexer]
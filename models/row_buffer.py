@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+
+class RowBuffer:
+    """
+    A container for accumulating scraped rows, which are only turned into a dataframe once at the end.
+
+    Attributes
+    ----------
+        columns     Names of the columns, rows shorter than the columns are padded with nulls
+        rows        Accumulated rows
+
+    Methods
+    -------
+        __init__(self, columns):
+            Initializes the attributes.
+        extend(self, rows):
+            Adds a batch of rows to the buffer.
+        __len__(self):
+            Retrieves the number of accumulated rows.
+        to_frame(self):
+            Builds a single dataframe out of the accumulated rows.
+    """
+
+    def __init__(self, columns):
+        """
+        Initializes the attributes.
+
+        :param list[str] columns: Specify the names of the columns
+        :return: The object itself
+        """
+
+        self.columns = list(columns)
+        self.rows = []
+
+    def extend(self, rows):
+        """
+        Adds a batch of rows to the buffer.
+
+        :param list[list] rows: Specify the rows, each row must not be longer than the columns
+        """
+
+        width = len(self.columns)
+        for row in rows:
+            if len(row) > width:
+                raise ValueError(f'row has {len(row)} values while the buffer has {width} columns')
+            self.rows.append(row)
+
+    def __len__(self):
+        """
+        Retrieves the number of accumulated rows.
+
+        :return: The number of rows
+        """
+
+        return len(self.rows)
+
+    def to_frame(self):
+        """
+        Builds a single dataframe out of the accumulated rows.
+
+        :return: A dataframe containing the rows (an empty dataframe of float columns if there are no rows)
+        """
+
+        width = len(self.columns)
+
+        if not self.rows:
+            return pd.DataFrame(np.empty((0, width)), columns=self.columns)
+
+        rows = [row if len(row) == width else list(row) + [np.nan] * (width - len(row)) for row in self.rows]
+
+        return pd.DataFrame(rows, columns=self.columns)
@@ -0,0 +1,121 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A token bucket which spaces out requests to a given rate while allowing short bursts.
+
+    Tokens are refilled continuously at the rate up to the burst size, each request takes a token. A request which
+    finds the bucket empty reserves the next token and waits for it, hence, concurrent requests are queued in order.
+
+    Attributes
+    ----------
+        rate            Number of tokens refilled per second
+        burst           Maximum number of tokens held by the bucket
+        tokens          Number of tokens currently held (negative while requests are waiting for reserved tokens)
+        updated         Time in which the tokens were last refilled (time.monotonic)
+        blocked_until   Time before which no token is handed out, such as the end of a server's Retry-After
+        lock            Guards the tokens
+
+    Methods
+    -------
+        __init__(self, rate, burst=1):
+            Initializes the attributes, the bucket starts full.
+        reserve(self):
+            Takes a token, then retrieves the seconds to be waited before using it.
+        try_take(self):
+            Takes a token if one is available right away.
+        block(self, seconds):
+            Hands out no token during the given seconds.
+        set_rate(self, rate):
+            Changes the refill rate, the tokens refilled so far are kept.
+        __refill(self, now):
+            Adds the tokens refilled since the last update.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        Initializes the attributes, the bucket starts full.
+
+        :param float rate: Specify the number of tokens refilled per second
+        :param int burst: Specify the maximum number of tokens held by the bucket
+        :return: The object itself
+        """
+
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError('burst must be a positive integer')
+
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token, then retrieves the seconds to be waited before using it.
+
+        :return: The seconds to be waited (0 if a token is available right away)
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self.__refill(now)
+            self.tokens -= 1
+
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            return max(wait, self.blocked_until - now, 0.0)
+
+    def try_take(self):
+        """
+        Takes a token if one is available right away.
+
+        :return: True if a token has been taken
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self.__refill(now)
+
+            if self.tokens < 1 or now < self.blocked_until:
+                return False
+
+            self.tokens -= 1
+            return True
+
+    def block(self, seconds):
+        """
+        Hands out no token during the given seconds.
+
+        :param float seconds: Specify the seconds
+        """
+
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def set_rate(self, rate):
+        """
+        Changes the refill rate, the tokens refilled so far are kept.
+
+        :param float rate: Specify the number of tokens refilled per second
+        """
+
+        with self.lock:
+            self.__refill(time.monotonic())
+            self.rate = float(rate)
+
+    def __refill(self, now):
+        """
+        Adds the tokens refilled since the last update.
+
+        :param float now: Specify the current time (time.monotonic)
+        """
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
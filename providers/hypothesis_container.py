@@ -122,15 +122,17 @@ class HypothesisContainer:
 
         df_2019 = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
                                               start_date=datetime.date(2019, 1, 1),
-                                              end_date=datetime.date(2019, 12, 31)
+                                              end_date=datetime.date(2019, 12, 31),
+                                              columns=['date', 'ATTENDANCE']
                                               )
 
         df_2020 = SportsScraper.scrap_matches(fast_fetch=True,
                                               start_date=datetime.date(2020, 1, 1),
-                                              end_date=datetime.date(2020, 12, 31)
+                                              end_date=datetime.date(2020, 12, 31),
+                                              columns=['date', 'ATTENDANCE']
                                               )
 
-        df = df_2019.append(df_2020)
+        df = pd.concat([df_2019, df_2020])
 
         df = df[df['ATTENDANCE'].notna()]
 
@@ -166,15 +168,17 @@ class HypothesisContainer:
 
         df_2015 = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
                                               start_date=datetime.date(2015, 1, 1),
-                                              end_date=datetime.date(2015, 12, 31)
+                                              end_date=datetime.date(2015, 12, 31),
+                                              columns=['date', 'ATTENDANCE']
                                               )
 
         df_2016 = SportsScraper.scrap_matches(fast_fetch=True,
                                               start_date=datetime.date(2016, 1, 1),
-                                              end_date=datetime.date(2016, 12, 31)
+                                              end_date=datetime.date(2016, 12, 31),
+                                              columns=['date', 'ATTENDANCE']
                                               )
 
-        df = df_2015.append(df_2016)
+        df = pd.concat([df_2015, df_2016])
 
         df = df[df['ATTENDANCE'].notna()]
 
@@ -208,15 +212,18 @@ class HypothesisContainer:
         :return: A list of statistical information
         """
 
-        df = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
-                                         start_date=datetime.date(2002, 10, 1),
-                                         end_date=datetime.date(2022, 5, 22)
-                                         )
-
-        df = df[df['ATTENDANCE'].notna()]
-
-        barcelona = df[(df['club1'] == 'Barcelona') | (df['club2'] == 'Barcelona')]['ATTENDANCE'].tolist()
-        real_madrid = df[(df['club1'] == 'Real Madrid') | (df['club2'] == 'Real Madrid')]['ATTENDANCE'].tolist()
+        attendance = {}
+        for club in ['Barcelona', 'Real Madrid']:
+            df = SportsScraper.scrap_club_matches(club,
+                                                  fast_fetch=fast_fetch,
+                                                  start_date=datetime.date(2002, 10, 1),
+                                                  end_date=datetime.date(2022, 5, 22),
+                                                  columns=['ATTENDANCE']
+                                                  )
+            attendance[club] = df[df['ATTENDANCE'].notna()]['ATTENDANCE'].tolist()
+
+        barcelona = attendance['Barcelona']
+        real_madrid = attendance['Real Madrid']
         barcelona = barcelona[:min(len(barcelona), len(real_madrid))]
         real_madrid = real_madrid[:min(len(barcelona), len(real_madrid))]
         df1 = pd.DataFrame({
@@ -246,7 +253,8 @@ class HypothesisContainer:
 
         df = SportsScraper.scrap_players(season_years=[2020],
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['HT', 'POS']
                                          )
 
         df = df[df['HT'].notna() & (df['HT'] > 100) & df['POS'].notna()]
@@ -283,7 +291,8 @@ class HypothesisContainer:
 
         df = SportsScraper.scrap_players(season_years=[2020],
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['G', 'POS']
                                          )
 
         df = df[df['G'].notna() & df['POS'].notna()]
@@ -319,7 +328,8 @@ class HypothesisContainer:
 
         df = SportsScraper.scrap_players(season_years=[2020],
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs)
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['YC', 'POS'])
 
         df = df[df['YC'].notna() & df['POS'].notna()]
 
@@ -60,18 +60,12 @@ class PlotsProvider:
         :param bool fast_fetch: Retrieves clubs from a saved snapshot instantly
         """
 
-        df = SportsScraper.scrap_matches(fast_fetch=fast_fetch)
+        df = SportsScraper.scrap_head_to_head('Barcelona', 'Real Madrid', fast_fetch=fast_fetch,
+                                              columns=['club1', 'club2', 'outcome'])
 
-        df = df[(df.club1 == 'Barcelona') & (df.club2 == 'Real Madrid') | (
-                (df['club1'] == 'Real Madrid') & (df['club2'] == 'Barcelona'))]
-
-        df = df[~df['SCORE'].str.contains('v')]
-        df['club1_score'] = pd.to_numeric(df['SCORE'].str.split('-').str[0].str.strip())
-        df['club2_score'] = pd.to_numeric(df['SCORE'].str.split('-').str[1].str.strip())
-
-        df['winner'] = df.apply(
-            lambda x: x['club1'] if (x['club1_score'] > x['club2_score']) else x['club2'] if (
-                    x['club1_score'] < x['club2_score']) else None, axis=1)
+        # Draws and unplayed matches have no winner
+        df['winner'] = np.where(df['outcome'] == 'club1', df['club1'].astype(object),
+                                np.where(df['outcome'] == 'club2', df['club2'].astype(object), None))
 
         labels = ['Barcelona', 'Real Madrid']
 
@@ -89,7 +83,8 @@ class PlotsProvider:
 
         df = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
                                          start_date=datetime.date(2017, 1, 1),
-                                         end_date=datetime.date(2017, 12, 31)
+                                         end_date=datetime.date(2017, 12, 31),
+                                         columns=['LOCATION', 'ATTENDANCE']
                                          )
 
         df = df[df['ATTENDANCE'].notna() & df['LOCATION'].notna()]
@@ -114,7 +109,7 @@ class PlotsProvider:
         :param bool fast_fetch: Retrieves clubs from a saved snapshot instantly
         """
 
-        df = SportsScraper.scrap_matches(fast_fetch=fast_fetch)
+        df = SportsScraper.scrap_matches(fast_fetch=fast_fetch, columns=['date', 'LOCATION', 'ATTENDANCE'])
         df = df[df['ATTENDANCE'].notna() & df['LOCATION'].notna()]
         df['date'] = df['date'].astype(str).str.split('-').str[0].str.strip()
         df = df.groupby('date')['ATTENDANCE'].sum()
@@ -136,7 +131,8 @@ class PlotsProvider:
 
         df = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
                                          start_date=datetime.date(2017, 1, 1),
-                                         end_date=datetime.date(2020, 12, 31)
+                                         end_date=datetime.date(2020, 12, 31),
+                                         columns=['date']
                                          )
 
         df['date'] = pd.to_datetime(df['date'], utc=True)
@@ -158,7 +154,8 @@ class PlotsProvider:
 
         df = SportsScraper.scrap_matches(fast_fetch=fast_fetch,
                                          start_date=datetime.date(2005, 1, 1),
-                                         end_date=datetime.date(2021, 12, 31)
+                                         end_date=datetime.date(2021, 12, 31),
+                                         columns=['date', 'LOCATION', 'ATTENDANCE']
                                          )
 
         df = df[df['ATTENDANCE'].notna() & df['LOCATION'].notna()]
@@ -192,7 +189,8 @@ class PlotsProvider:
         f = SportsScraper.scrap_players(season_years=season_years,
                                         leagues=leagues,
                                         fast_fetch=fast_fetch,
-                                        fast_fetch_clubs=fast_fetch_clubs)
+                                        fast_fetch_clubs=fast_fetch_clubs,
+                                        columns=['LEAGUE', 'YEAR', 'NAME', 'G'])
         df1 = pd.DataFrame()
         df1['id'] = f.groupby(['LEAGUE', 'YEAR'])['G'].idxmax()
         df2 = f.merge(df1, how='inner', left_index=True, right_on='id')
@@ -219,7 +217,8 @@ class PlotsProvider:
         df = SportsScraper.scrap_players(season_years=years,
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs)
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'YEAR', 'G'])
         df1 = pd.DataFrame()
         barcelona_goals = df[df['CLUB'] == 'Barcelona'].groupby('YEAR')
         df1['Goals'] = barcelona_goals['G'].sum()
@@ -236,7 +235,8 @@ class PlotsProvider:
         :param bool fast_fetch_clubs: Retrieves clubs from a saved snapshot instantly
         """
 
-        df = SportsScraper.scrap_players(fast_fetch=fast_fetch, fast_fetch_clubs=fast_fetch_clubs)
+        df = SportsScraper.scrap_players(fast_fetch=fast_fetch, fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'AGE', 'G'])
         df1 = pd.DataFrame()
         df1['Age_mean'] = df.groupby('CLUB')['AGE'].mean()
         df1['Goals'] = df.groupby('CLUB')['G'].sum()
@@ -261,6 +261,7 @@ class PlotsProvider:
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
                                          fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['LEAGUE', 'YC', 'RC']
                                          )
         df1 = pd.DataFrame()
         df1['Yellow Card'] = df.groupby('LEAGUE')['YC'].sum()
@@ -287,7 +288,8 @@ class PlotsProvider:
         df = SportsScraper.scrap_players(season_years=season_years,
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'NAT']
                                          )
 
         fig, ax = plt.subplots(figsize=(10, 9))
@@ -315,7 +317,8 @@ class PlotsProvider:
         """
 
         df = SportsScraper.scrap_players(fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'AGE', 'G', 'A']
                                          )
 
         df = df.groupby(df['CLUB']).mean()
@@ -360,7 +363,8 @@ class PlotsProvider:
         df = SportsScraper.scrap_players(season_years=season_years,
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'G']
                                          )
         df = df.groupby('CLUB').sum().sort_values('G')
 
@@ -387,7 +391,8 @@ class PlotsProvider:
         df = SportsScraper.scrap_players(season_years=season_years,
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'G', 'A']
                                          )
         df = df.groupby('CLUB').sum()
 
@@ -416,7 +421,8 @@ class PlotsProvider:
         df = SportsScraper.scrap_players(season_years=season_years,
                                          leagues=leagues,
                                          fast_fetch=fast_fetch,
-                                         fast_fetch_clubs=fast_fetch_clubs
+                                         fast_fetch_clubs=fast_fetch_clubs,
+                                         columns=['CLUB', 'G']
                                          )
 
         df['CLUB'] = df['CLUB'] \
@@ -1,14 +1,28 @@
+import collections
+import concurrent.futures
 import datetime
+import os
+import time
 
 import pandas as pd
 import numpy as np
 import bs4
-import re
-import requests
+from helpers.async_fetch_handler import AsyncFetchHandler
 from helpers.date_time_handler import DateTimeHandler
-from helpers.progress_handler import ProgressHandler
+from helpers.html_parser_handler import HtmlParserHandler
+from helpers.http_handler import HttpHandler
+from helpers.metrics_handler import MetricsHandler
+from helpers.normalization_handler import NormalizationHandler
+from helpers.parse_pool_handler import ParsePoolHandler
+from helpers.snapshot_handler import SnapshotHandler
+from helpers.stage_timer_handler import StageTimerHandler
 from models.club import Club
+from models.club_index import ClubIndex
+from models.club_registry import ClubRegistry
+from models.crawl_journal import CrawlJournal
 from models.league import League
+from models.match_store import MatchStore
+from models.row_buffer import RowBuffer
 
 
 class SportsScraper:
@@ -17,8 +31,14 @@ class SportsScraper:
 
     Attributes
     ----------
+        LEAGUES_URL    Webpage which lists the leagues
+        CLUBS_URL      API endpoint which lists the clubs of a league
+        SQUAD_URL      Webpage which lists the players of a club in a season
+        FIXTURES_URL   Webpage which lists the matches of a day
         __leagues      Acts as a cache for storing league url/name
         __clubs        Acts as a cache for storing club   ids/names
+        __match_store  Acts as a cache for storing the matches snapshot along with its indexes, as a (snapshot
+                       signature, match store) pair
 
     Methods
     -------
@@ -35,28 +55,90 @@ class SportsScraper:
             Calls http://site.api.espn.com/apis/site/v2/sports/soccer/{league}/teams iteratively to fetch all clubs ids.
         get_clubs(leagues, tolerate_too_many_requests=False):
             Calls __get_clubs if __clubs is None, otherwise, it retrieves __clubs immediately.
+        clear_cache():
+            Forgets the leagues and clubs held in memory, they are fetched again on the next call.
 
-        __get_cached_players():
-            Retrieves the player's snapshot.
-        cache_players():
+        __get_cached_players(columns=None, filters=None):
+            Retrieves the player's snapshot, imports it from cached_players.csv if it has not been converted yet.
+        cache_players(season_years=None, leagues=None, incremental=False, concurrency=None):
             Collects a snapshot of the players for faster fetch in the future.
-        scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, fast_fetch=False)
+        __import_players_csv():
+            Converts cached_players.csv into the columnar players snapshot.
+        __write_players_snapshot(players, timestamp=None):
+            Writes the columnar players snapshot with its final dtypes, partitioned by season and league.
+        scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, fast_fetch=False,
+                      concurrency=None, columns=None)
             Scraps data containing information about club's players.
-        __scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False):
+        __scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, concurrency=None):
             Scraps data containing information about club's players.
-
-        __get_cached_matches():
-            Retrieves the match's snapshot.
-        cache_matches():
+        __get_player_work_units(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False):
+            Lists the (season year, club) pairs whose squads are to be scraped.
+        __get_player_partition(work_unit):
+            Retrieves the (league, club, season) partition which a work unit fills in the players snapshot.
+        __is_final_partition(partition, recorded_at):
+            Checks whether the squad of a partition could not change anymore by the time it was recorded.
+        __scrap_player_work_units(work_units, concurrency=None, journal=None, fetched_partitions=None):
+            Scraps the squads of the given (season year, club) pairs.
+        iter_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, concurrency=None):
+            Scraps data containing information about club's players, yielding the players of each club-season.
+        __scrap_squads(work_units, concurrency=None, journal=None, fetched_partitions=None):
+            Fetches and parses the squad of each (season year, club) pair (in the parse pool if configured), skipping
+            the squads held by the journal.
+        __build_players_frame(squads):
+            Builds the normalized players dataframe out of the rows of the given squads.
+        __fetch_squad_pages(work_units, concurrency=None):
+            Fetches the squad webpage of each (season year, club) pair.
+
+        __get_cached_matches(columns=None, filters=None):
+            Retrieves the match's snapshot, imports it from cached_matches.csv if it has not been converted yet.
+        cache_matches(start_date=datetime.date(2002, 10, 1), end_date=None, incremental=False, workers=None):
             Collects a snapshot of the matches for faster fetch in the future.
-        scrap_matches(start_date=None, end_date=None, fast_fetch=False):
+        __import_matches_csv():
+            Converts cached_matches.csv into the columnar matches snapshot.
+        __write_matches_snapshot(matches, timestamp=None):
+            Writes the columnar matches snapshot with its final dtypes, partitioned by year.
+        import_csv_snapshots():
+            Converts cached_matches.csv and cached_players.csv (whichever exists) into the columnar snapshots.
+        export_csv_snapshots():
+            Exports the columnar snapshots (whichever exists) into cached_matches.csv and cached_players.csv.
+        scrap_matches(start_date=None, end_date=None, fast_fetch=False, workers=None, columns=None):
             Scraps data containing information about the results of the matches.
-        __scrap_matches(start_date=datetime.date.today() - datetime.timedelta(days=7), end_date=datetime.date.today()):
+        scrap_club_matches(club, start_date=None, end_date=None, fast_fetch=False, workers=None, columns=None):
+            Scraps data containing information about the results of the matches played by a club.
+        scrap_head_to_head(club_a, club_b, start_date=None, end_date=None, fast_fetch=False, workers=None,
+                           columns=None):
+            Scraps data containing information about the results of the matches played between two clubs.
+        __get_match_store():
+            Retrieves the matches snapshot held in memory, loads it if it is not held or has changed since.
+        __scrap_matches(start_date=datetime.date.today() - datetime.timedelta(days=7), end_date=datetime.date.today(),
+                        request_tries=8, workers=None, shard_size=30, backoff=0.5, journal=None):
             Scraps data containing information about the results of the matches.
+        __scrap_matches_days(days_between, request_tries=8, workers=None, shard_size=30, backoff=0.5, journal=None):
+            Scraps data containing information about the results of the matches played in the given days.
+        iter_matches(start_date=None, end_date=None, workers=None):
+            Scraps data containing information about the results of the matches, yielding the matches of each day.
+        __build_matches_frame(days_data):
+            Builds the matches dataframe out of the rows of the given days, the elapsed matches precede the fixtures.
+        __crawl_matches_days_in_parallel(days, request_tries=8, workers=8, shard_size=30, backoff=0.5, journal=None):
+            Splits the days into shards which are crawled by a pool of workers, each worker retries its own days.
+        __is_final_day(day, recorded_at):
+            Checks whether the matches of a day could not change anymore by the time they were recorded.
+        __crawl_matches_day(day, request_tries=8, backoff=0.5, journal=None):
+            Fetches the fixtures webpage of a day, retrying with a jittered exponential backoff whenever it fails, then
+            parses it (in the parse pool if configured).
+
+        __remove_unused_categories(df):
+            Removes the categories which no longer appear in a filtered snapshot.
     """
 
+    LEAGUES_URL = 'https://www.espn.com/soccer/teams'
+    CLUBS_URL = 'http://site.api.espn.com/apis/site/v2/sports/soccer/{league_url}/teams'
+    SQUAD_URL = 'https://www.espn.com/soccer/team/squad/_/id/{club_id}/league/{league_url}/season/{season_year}'
+    FIXTURES_URL = 'https://www.espn.in/football/fixtures/_/date/{day}'
+
     __leagues = None
     __clubs = None
+    __match_store = None
 
     @staticmethod
     def __scrap_leagues():
@@ -68,9 +150,7 @@ class SportsScraper:
 
         leagues = []
 
-        # Partially prevents scraping detection
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-        res = requests.get('https://www.espn.com/soccer/teams', headers=headers)
+        res = HttpHandler.get_with_retries(SportsScraper.LEAGUES_URL)
         soup = bs4.BeautifulSoup(res.text, 'html.parser')
         ddl = soup.find('select', attrs={'class': 'dropdown__select'})
 
@@ -104,13 +184,12 @@ class SportsScraper:
         Retrieves the club's snapshot.
         """
 
-        clubs = []
-        df = pd.read_csv('cached_clubs.csv', index_col='club_id', skiprows=1)
+        df = SnapshotHandler.read_csv('cached_clubs.csv', index_col='club_id')
 
-        for index, row in df.iterrows():
-            clubs.append(Club(index, row['club_name'], League(row['league_url'], row['league_name'])))
-
-        return clubs
+        # Leagues are interned, hence, the clubs of a league share a single league object
+        return [Club(club_id, club_name, League(league_url, league_name))
+                for club_id, club_name, league_url, league_name in
+                zip(df.index.tolist(), df['club_name'], df['league_url'], df['league_name'])]
 
     @staticmethod
     def cache_clubs():
@@ -130,19 +209,17 @@ class SportsScraper:
 
         df.set_index('club_id', inplace=True)
 
-        f = open('cached_clubs.csv', "w+")
-        f.write(f'# Timestamp: {datetime.datetime.utcnow()}\n')
-        f.close()
-
-        # noinspection PyTypeChecker
-        df.to_csv('cached_clubs.csv', mode='a')
+        SnapshotHandler.write_csv(df, 'cached_clubs.csv', index=True)
 
     @staticmethod
     def __get_clubs(tolerate_too_many_requests=False, fast_fetch=False):
         """
         Calls http://site.api.espn.com/apis/site/v2/sports/soccer/{league}/teams iteratively to fetch all clubs ids.
 
-        :param bool tolerate_too_many_requests: Specify to whether throw an exception if the status code is not 200
+        Throttled or failed requests are retried with a jittered exponential backoff before a league is given up.
+
+        :param bool tolerate_too_many_requests: Specify to whether skip a league (rather than throw an exception) if its
+                                                status code is still not 200 once the retries are exhausted
         :param bool fast_fetch: Retrieves clubs from a saved snapshot instantly
         :return: A list of clubs object
         """
@@ -153,20 +230,23 @@ class SportsScraper:
         scraped_leagues = SportsScraper.scrap_leagues()
         clubs = []
 
-        processed = 0
-        for league in scraped_leagues:
-            print(ProgressHandler.show_progress(processed, len(scraped_leagues)))
-            processed += 1
-            # Partially prevents scraping detection
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-            response = requests.get(f'http://site.api.espn.com/apis/site/v2/sports/soccer/{league.url}/teams',
-                                    headers=headers)
-            if response.status_code != 200 and tolerate_too_many_requests:
-                continue
-            for club in response.json()['sports'][0]['leagues'][0]['teams']:
-                clubs.append(Club(club['team']['id'], club['team']['name'], league))
-
-        ProgressHandler.reset_progress()
+        MetricsHandler.start(len(scraped_leagues), 'leagues')
+        try:
+            for league in scraped_leagues:
+                start = time.perf_counter()
+                response = HttpHandler.get_with_retries(SportsScraper.CLUBS_URL.format(league_url=league.url))
+                if response.status_code != 200:
+                    MetricsHandler.complete(seconds=time.perf_counter() - start)
+                    if not tolerate_too_many_requests:
+                        response.raise_for_status()
+                    print(f'Skipping {league.name}, its clubs could not be fetched '
+                          f'(status code {response.status_code})')
+                    continue
+                for club in response.json()['sports'][0]['leagues'][0]['teams']:
+                    clubs.append(Club(club['team']['id'], club['team']['name'], league))
+                MetricsHandler.complete(seconds=time.perf_counter() - start)
+        finally:
+            MetricsHandler.finish()
 
         return clubs
 
@@ -187,31 +267,147 @@ class SportsScraper:
         return SportsScraper.__clubs.copy()
 
     @staticmethod
-    def __get_cached_players():
+    def clear_cache():
+        """
+        Forgets the leagues, clubs and matches held in memory, they are fetched again on the next call.
+        """
+
+        SportsScraper.__leagues = None
+        SportsScraper.__clubs = None
+        SportsScraper.__match_store = None
+
+    @staticmethod
+    def __get_cached_players(columns=None, filters=None):
         """
-        Retrieves the player's snapshot.
+        Retrieves the player's snapshot, imports it from cached_players.csv if it has not been converted yet.
+
+        :param list[str] columns: Specify the columns to be loaded (all if None)
+        :param list[tuple] filters: Specify the (column, operator, value) conditions pushed down to the snapshot, only
+                                    the matching partitions are read
+        :return: A dataframe containing club players
         """
 
-        players = pd.read_csv('cached_players.csv', skiprows=1)
+        if not os.path.exists('cached_players.parquet'):
+            SportsScraper.__import_players_csv()
+        elif not os.path.isdir('cached_players.parquet'):
+            # Unpartitioned snapshot, rewrite it partitioned
+            SportsScraper.__write_players_snapshot(SnapshotHandler.read('cached_players.parquet'),
+                                                   SnapshotHandler.read_timestamp('cached_players.parquet'))
 
-        return players
+        with StageTimerHandler.measure('load'):
+            return SnapshotHandler.read('cached_players.parquet', columns, filters)
 
     @staticmethod
-    def cache_players():
+    def cache_players(season_years=None, leagues=None, incremental=False, concurrency=None):
         """
         Collects a snapshot of the players for faster fetch in the future.
+
+        The (league, club, season) partitions held by the snapshot are recorded in cached_players_partitions.csv. The
+        scraped squads are checkpointed in cached_players.journal, hence, an interrupted collection resumes where it
+        stopped once it is invoked again with the same parameters, the journal is deleted once the snapshot is stored.
+        Squads of a season which had not ended when they were checkpointed are scraped again.
+
+        :param list[int] season_years: Collect the data from the provided year(s), 2000 to 2021 if None (2000 to the
+                                       current season when incremental)
+        :param list[str] leagues: Specify the desired league(s)
+        :param bool incremental: Only scraps the partitions missing from the existing snapshot as well as the current
+                                 season, then upserts them into the snapshot
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
+        """
+
+        current_season = DateTimeHandler.get_current_season()
+        if incremental and ((season_years is None) or (len(season_years) == 0)):
+            season_years = list(range(2000, current_season + 1))
+
+        work_units = SportsScraper.__get_player_work_units(season_years, leagues, fast_fetch_clubs=True)
+        journal = CrawlJournal('cached_players.journal',
+                               {'season_years': None if season_years is None else [int(x) for x in season_years],
+                                'leagues': None if leagues is None else list(leagues),
+                                'incremental': incremental},
+                               SportsScraper.__is_final_partition)
+
+        # Only the partitions whose squad webpage has been fetched are held, the failed ones are scraped again later
+        fetched_partitions = set()
+
+        if not incremental or not (os.path.exists('cached_players.parquet') or os.path.exists('cached_players.csv')):
+            players = SportsScraper.__scrap_player_work_units(work_units, concurrency, journal, fetched_partitions)
+            partitions = pd.DataFrame([x for x in map(SportsScraper.__get_player_partition, work_units)
+                                       if x in fetched_partitions],
+                                      columns=['LEAGUE', 'CLUB', 'YEAR'])
+
+            SportsScraper.__write_players_snapshot(players)
+            SnapshotHandler.write_csv(partitions, 'cached_players_partitions.csv')
+            journal.remove()
+            return
+
+        snapshot = SportsScraper.__get_cached_players()
+
+        if os.path.exists('cached_players_partitions.csv'):
+            partitions = SnapshotHandler.read_csv('cached_players_partitions.csv')
+        else:
+            partitions = snapshot[['LEAGUE', 'CLUB', 'YEAR']].drop_duplicates().astype({'LEAGUE': str, 'CLUB': str})
+
+        held_partitions = set(partitions.itertuples(index=False, name=None))
+        work_units = [x for x in work_units
+                      if x[0] == current_season or SportsScraper.__get_player_partition(x) not in held_partitions]
+
+        print(f'Scraping {len(work_units)} missing or current partition(s)...')
+
+        if not work_units:
+            return
+
+        players = SportsScraper.__scrap_player_work_units(work_units, concurrency, journal,
+                                                          fetched_partitions).reset_index()
+        scraped_partitions = pd.DataFrame([x for x in map(SportsScraper.__get_player_partition, work_units)
+                                           if x in fetched_partitions],
+                                          columns=['LEAGUE', 'CLUB', 'YEAR'])
+
+        scraped_keys = pd.MultiIndex.from_frame(scraped_partitions)
+        snapshot_keys = pd.MultiIndex.from_frame(snapshot[['LEAGUE', 'CLUB', 'YEAR']].astype({'LEAGUE': str,
+                                                                                            'CLUB': str}))
+        snapshot = snapshot[~snapshot_keys.isin(scraped_keys)]
+        players = pd.concat([snapshot.astype({'LEAGUE': str, 'CLUB': str, 'NAT': object, 'POS': object}), players],
+                            ignore_index=True)
+        partitions = pd.concat([partitions, scraped_partitions], ignore_index=True).drop_duplicates()
+
+        SportsScraper.__write_players_snapshot(players)
+        SnapshotHandler.write_csv(partitions, 'cached_players_partitions.csv')
+        journal.remove()
+
+    @staticmethod
+    def __import_players_csv():
+        """
+        Converts cached_players.csv into the columnar players snapshot.
         """
-        players = SportsScraper.scrap_players(fast_fetch_clubs=True)
 
-        f = open('cached_clubs.csv', "w+")
-        f.write(f'# Timestamp: {datetime.datetime.utcnow()}\n')
-        f.close()
+        players = SnapshotHandler.read_csv('cached_players.csv')
 
-        # noinspection PyTypeChecker
-        players.to_csv('cached_players.csv', mode='a')
+        SportsScraper.__write_players_snapshot(players, SnapshotHandler.read_csv_timestamp('cached_players.csv'))
 
     @staticmethod
-    def scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, fast_fetch=False):
+    def __write_players_snapshot(players, timestamp=None):
+        """
+        Writes the columnar players snapshot with its final dtypes, partitioned by season and league.
+
+        :param pd.DataFrame players: Specify the players, either indexed by (LEAGUE, CLUB, YEAR, NAME) or flat
+        :param datetime.datetime timestamp: Specify the time in which the snapshot was collected (now if None)
+        """
+
+        if 'LEAGUE' not in players.columns:
+            players = players.reset_index()
+
+        players = players.astype({'YEAR': int, 'NAME': object})
+        for col in ['LEAGUE', 'CLUB', 'POS', 'NAT']:
+            players[col] = players[col].astype('category')
+        for col in players.columns.drop(['LEAGUE', 'CLUB', 'YEAR', 'NAME', 'POS', 'NAT']):
+            players[col] = players[col].astype(float)
+
+        with StageTimerHandler.measure('persist'):
+            SnapshotHandler.write(players, 'cached_players.parquet', timestamp, partition_cols=['YEAR', 'LEAGUE'])
+
+    @staticmethod
+    def scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, fast_fetch=False,
+                      concurrency=None, columns=None):
         """
         Scraps data containing information about club's players.
 
@@ -220,24 +416,28 @@ class SportsScraper:
         :param list[str] clubs: Specify the desired club(s)
         :param bool fast_fetch_clubs: Retrieves clubs from a saved snapshot instantly
         :param bool fast_fetch: Retrieves players from a saved snapshot instantly
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
+        :param list[str] columns: Specify the columns loaded from the snapshot (all if None), only used by fast_fetch
         :return: A dataframe containing club players
         """
 
         if fast_fetch:
-            df = SportsScraper.__get_cached_players()
+            filters = []
             if season_years is not None:
-                df = df[df.YEAR.isin(season_years)]
+                filters.append(('YEAR', 'in', list(season_years)))
             if leagues is not None:
-                df = df[df.LEAGUE.isin(leagues)]
+                filters.append(('LEAGUE', 'in', list(leagues)))
             if clubs is not None:
-                df = df[df.CLUB.isin(clubs)]
-            return df
+                filters.append(('CLUB', 'in', list(clubs)))
+
+            df = SportsScraper.__get_cached_players(columns, filters)
+            return SportsScraper.__remove_unused_categories(df)
 
         else:
-            return SportsScraper.__scrap_players(season_years, leagues, clubs, fast_fetch_clubs)
+            return SportsScraper.__scrap_players(season_years, leagues, clubs, fast_fetch_clubs, concurrency)
 
     @staticmethod
-    def __scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False):
+    def __scrap_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, concurrency=None):
         """
         Scraps data containing information about club's players.
 
@@ -245,285 +445,761 @@ class SportsScraper:
         :param list[str] leagues: Specify the desired league(s)
         :param list[str] clubs: Specify the desired club(s)
         :param bool fast_fetch_clubs: Retrieves clubs from a saved snapshot instantly
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
         :return: A dataframe containing club players
         """
 
+        work_units = SportsScraper.__get_player_work_units(season_years, leagues, clubs, fast_fetch_clubs)
+
+        return SportsScraper.__scrap_player_work_units(work_units, concurrency)
+
+    @staticmethod
+    def __get_player_work_units(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False):
+        """
+        Lists the (season year, club) pairs whose squads are to be scraped.
+
+        :param list[int] season_years: Collect the data from the provided year(s)
+        :param list[str] leagues: Specify the desired league(s)
+        :param list[str] clubs: Specify the desired club(s)
+        :param bool fast_fetch_clubs: Retrieves clubs from a saved snapshot instantly
+        :return: A list of (season year, club) pairs
+        """
+
         if (season_years is None) or (len(season_years) == 0):
             season_years = np.arange(2000, 2022)
 
+        if not all(isinstance(x, (int, np.integer)) for x in season_years):
+            raise ValueError('season_year must be a list of integer')
+        if clubs is not None and not all(isinstance(x, str) for x in clubs):
+            raise ValueError('clubs must be a list of string')
+        if leagues is not None and not all(isinstance(x, str) for x in leagues):
+            raise ValueError('leagues must be a list of string')
+
         scraped_leagues = SportsScraper.scrap_leagues()
         if (leagues is not None) and (len(leagues) != 0):
-            scraped_leagues = list(filter(lambda x: x.name in leagues, scraped_leagues))
+            league_names = set(leagues)
+            scraped_leagues = [x for x in scraped_leagues if x.name in league_names]
 
         if fast_fetch_clubs:
             scraped_clubs = SportsScraper.__get_cached_clubs()
         else:
             scraped_clubs = SportsScraper.get_clubs()
 
+        league_names = None
+        club_names = None
+        if (leagues is not None) and (len(leagues) != 0):
+            league_names = {x.name for x in scraped_leagues}
         if (clubs is not None) and (len(clubs) != 0):
-            scraped_clubs = list(
-                filter(lambda x: x.name in clubs and x.league.name in [x.name for x in scraped_leagues], scraped_clubs))
+            league_names = {x.name for x in scraped_leagues}
+            club_names = clubs
 
-        if not all(isinstance(x, np.int32) or isinstance(x, int) for x in season_years):
-            raise ValueError('season_year must be a list of integer')
-        if clubs is not None and not all(isinstance(x, str) for x in clubs):
-            raise ValueError('clubs must be a list of string')
-        if leagues is not None and not all(isinstance(x, str) for x in leagues):
-            raise ValueError('leagues must be a list of string')
+        scraped_clubs = ClubRegistry(scraped_clubs).select(league_names, club_names)
+
+        return [(int(season_year), club) for season_year in season_years for club in scraped_clubs]
+
+    @staticmethod
+    def __get_player_partition(work_unit):
+        """
+        Retrieves the (league, club, season) partition which a work unit fills in the players snapshot.
+
+        :param tuple work_unit: Specify the (season year, club) pair
+        :return: A (league name, club name, season year) tuple
+        """
+
+        season_year, club = work_unit
+
+        return club.league.name, club.name, season_year
+
+    @staticmethod
+    def __is_final_partition(partition, recorded_at):
+        """
+        Checks whether the squad of a (league, club, season) partition could not change anymore by the time it was
+        recorded, that is, whether its season had ended.
+
+        :param tuple partition: Specify the (league name, club name, season year) partition
+        :param datetime.datetime recorded_at: Specify the time in which the squad was recorded
+        :return: True if the season had ended
+        """
+
+        # Seasons are assumed to start in July, hence, a season ends once the following one starts
+        return recorded_at >= datetime.datetime(int(partition[2]) + 1, 7, 1)
+
+    @staticmethod
+    def __scrap_player_work_units(work_units, concurrency=None, journal=None, fetched_partitions=None):
+        """
+        Scraps the squads of the given (season year, club) pairs.
+
+        :param list[tuple] work_units: Specify the (season year, club) pairs to be scraped
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
+        :param CrawlJournal journal: Specify the journal which records the scraped squads, the squads it holds are not
+                                     fetched again (no journal if None)
+        :param set fetched_partitions: Specify a set to which the partitions whose squad webpage has been fetched are
+                                       added (not collected if None)
+        :return: A dataframe containing club players
+        """
+
+        squads = SportsScraper.__scrap_squads(work_units, concurrency, journal, fetched_partitions)
+
+        try:
+            return SportsScraper.__build_players_frame(squads)
+        finally:
+            MetricsHandler.finish()
 
-        players_df_goalkeeper = pd.DataFrame()
-
-        players_df_player = pd.DataFrame()
-
-        processed = 0
-        for season_year in season_years:
-            for club in scraped_clubs:
-                print(ProgressHandler.show_progress(processed,
-                                                    len(season_years) * len(scraped_clubs)))
-                processed += 1
-                # Partially prevents scraping detection
-                headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-                res = requests.get(
-                    f'https://www.espn.com/soccer/team/squad/_/'
-                    f'id/{club.club_id}/'
-                    f'league/{club.league.url}/'
-                    f'season/{season_year}',
-                    headers=headers)
-
-                soup = bs4.BeautifulSoup(res.text, 'html.parser')
-                tables = soup.find_all('table', attrs={'class': 'Table'})
-
-                if not tables or len(tables) != 2:
+    @staticmethod
+    def iter_players(season_years=None, leagues=None, clubs=None, fast_fetch_clubs=False, concurrency=None):
+        """
+        Scraps data containing information about club's players, yielding the players of each club-season as soon as
+        its squad webpage is parsed.
+
+        Only a bounded number of squad webpages is held at a time, hence, the consumer can write the batches to disk,
+        aggregate them or stop early without holding the whole result. Numeric columns are floats so that every batch
+        has the same dtypes, while club-seasons without players are skipped.
+
+        :param list[int] season_years: Collect the data from the provided year(s)
+        :param list[str] leagues: Specify the desired league(s)
+        :param list[str] clubs: Specify the desired club(s)
+        :param bool fast_fetch_clubs: Retrieves clubs from a saved snapshot instantly
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
+        :return: A generator of dataframes containing club players, indexed as the result of scrap_players
+        """
+
+        work_units = SportsScraper.__get_player_work_units(season_years, leagues, clubs, fast_fetch_clubs)
+
+        try:
+            for squad in SportsScraper.__scrap_squads(work_units, concurrency):
+                df = SportsScraper.__build_players_frame([squad])
+                if not df.empty:
+                    numeric_columns = [x for x in df.columns if x not in NormalizationHandler.PLAYERS_TEXT_COLUMNS]
+                    yield df.astype(dict.fromkeys(numeric_columns, float))
+        finally:
+            MetricsHandler.finish()
+
+    @staticmethod
+    def __scrap_squads(work_units, concurrency=None, journal=None, fetched_partitions=None):
+        """
+        Fetches and parses the squad of each (season year, club) pair (in the parse pool if configured), the squads held
+        by the journal are not fetched again.
+
+        Only a window of squad webpages is fetched ahead of the one being parsed, hence, the webpages are not all held
+        at once.
+
+        :param list[tuple] work_units: Specify the (season year, club) pairs
+        :param int concurrency: Specify the number of squad webpages fetched at the same time (sequential if None)
+        :param CrawlJournal journal: Specify the journal which records the squads (no journal if None)
+        :param set fetched_partitions: Specify a set to which the partitions whose squad webpage has been fetched (or is
+                                       held by the journal) are added (not collected if None)
+        :return: A generator of two lists containing the rows (0: Goalkeepers, 1: Players), ordered as the work units
+        """
+
+        MetricsHandler.start(len(work_units), 'squads')
+        try:
+            partitions = [SportsScraper.__get_player_partition(x) for x in work_units]
+            recorded = [journal is not None and x in journal for x in partitions]
+
+            fetched_units = [x for x, is_recorded in zip(work_units, recorded) if not is_recorded]
+            pages = SportsScraper.__fetch_squad_pages(fetched_units, concurrency)
+            status_codes = collections.deque()
+            fetch_seconds = collections.deque()
+
+            def unparsed_pages():
+                for (season_year, club), (res, seconds) in zip(fetched_units, pages):
+                    status_codes.append(res.status_code)
+                    fetch_seconds.append(seconds)
+                    yield res.text, season_year, club.league.name, club.name
+
+            # Webpages are parsed by the parse pool (if configured) while the following ones are being fetched
+            squads = ParsePoolHandler.parse_all(HtmlParserHandler.parse_squad_page, unparsed_pages(), timed=True)
+
+            for partition, is_recorded in zip(partitions, recorded):
+                if is_recorded:
+                    MetricsHandler.complete()
+                    if fetched_partitions is not None:
+                        fetched_partitions.add(partition)
+                    yield journal.get_rows(partition)
                     continue
 
-                for x in np.arange(0, 2):
-                    data = []
-                    rows = tables[x].find_all('tr')
-                    for row in rows:
-                        cols = row.find_all('td')
-                        cols = [ele.text.strip() for ele in cols]  # Strips elements
-                        if cols:  # If column is not empty
-                            buff = [club.league.name, club.name, str(season_year)] + \
-                                   [ele for ele in cols if ele]  # If element is not empty
-                            number_list = re.findall(r'\d+$', buff[3])
-                            if number_list:  # Checks if there is a number for the player
-                                buff.insert(4, number_list[0])  # Extract player's number
-                                buff[3] = re.findall(r'^([^0-9]*)', buff[3])[0]  # Remove player's name number
-                            else:
-                                buff.insert(4, np.nan)
-                            data.append(buff)
-
-                    if x == 0:
-                        players_df_goalkeeper = players_df_goalkeeper.append(data)
-                    else:
-                        players_df_player = players_df_player.append(data)
-
-        if players_df_goalkeeper.empty:
-            players_df_goalkeeper = pd.DataFrame(np.empty((0, 19)))
-
-        if players_df_player.empty:
-            players_df_player = pd.DataFrame(np.empty((0, 20)))
-
-        players_df_goalkeeper.columns = ['YEAR', 'LEAGUE', 'CLUB', 'NAME', 'NUM', 'POS', 'AGE', 'HT', 'WT', 'NAT',
-                                         'APP', 'SUB',
-                                         'SV', 'GA', 'A',
-                                         'FC', 'FA', 'YC', 'RC']
-        players_df_player.columns = ['YEAR', 'LEAGUE', 'CLUB', 'NAME', 'NUM', 'POS', 'AGE', 'HT', 'WT', 'NAT', 'APP',
-                                     'SUB',
-                                     'G', 'A', 'SH', 'ST',
-                                     'FC', 'FA', 'YC', 'RC']
-
-        df = players_df_goalkeeper.append(players_df_player)
-        df = df.replace(r'^\s*$', np.nan, regex=True) \
-            .replace('--', np.nan) \
-            .reset_index(drop=True)
-
-        df['WT'] = df['WT'].apply(lambda x: x if (pd.isnull(x)) else int(x.split(" ")[0]) / 2.205)
-        df['HT'] = df['HT'].apply(
-            lambda x: x
-            if (pd.isnull(x)) else
-            int(x.split("'")[0]) * 30.48 +
-            int(x.split("'")[1].split("\"")[0]) * 2.54
-        )
-
-        cols = df.columns.drop(['LEAGUE', 'CLUB', 'NAME', 'POS', 'NAT'])
-        df[cols] = df[cols].apply(pd.to_numeric)
-
-        df.set_index(['LEAGUE', 'CLUB', 'YEAR', 'NAME'], inplace=True)
-
-        ProgressHandler.reset_progress()
+                # A squad takes the time spent fetching its webpage plus the time spent parsing it
+                squad, parse_seconds = next(squads)
+                status_code = status_codes.popleft()
+                MetricsHandler.complete(seconds=fetch_seconds.popleft() + parse_seconds)
+
+                # Error webpages are not recorded, hence, they are fetched again once the crawl is resumed
+                if status_code == 200:
+                    if journal is not None:
+                        journal.record(partition, squad)
+                    if fetched_partitions is not None:
+                        fetched_partitions.add(partition)
+
+                yield squad
+        finally:
+            if journal is not None:
+                journal.flush()
+
+    @staticmethod
+    def __build_players_frame(squads):
+        """
+        Builds the normalized players dataframe out of the rows of the given squads.
+
+        :param iterable squads: Specify the squads, each one is a list of two lists containing the rows
+                                (0: Goalkeepers, 1: Players)
+        :return: A dataframe containing club players
+        """
+
+        players_goalkeeper = RowBuffer(['YEAR', 'LEAGUE', 'CLUB', 'NAME', 'NUM', 'POS', 'AGE', 'HT', 'WT', 'NAT',
+                                        'APP', 'SUB',
+                                        'SV', 'GA', 'A',
+                                        'FC', 'FA', 'YC', 'RC'])
+        players_player = RowBuffer(['YEAR', 'LEAGUE', 'CLUB', 'NAME', 'NUM', 'POS', 'AGE', 'HT', 'WT', 'NAT', 'APP',
+                                    'SUB',
+                                    'G', 'A', 'SH', 'ST',
+                                    'FC', 'FA', 'YC', 'RC'])
+
+        for goalkeepers, players in squads:
+            players_goalkeeper.extend(goalkeepers)
+            players_player.extend(players)
+
+        with StageTimerHandler.measure('normalize'):
+            df = pd.concat([players_goalkeeper.to_frame(), players_player.to_frame()])
+            df = NormalizationHandler.normalize_players(df)
+
+            df.set_index(['LEAGUE', 'CLUB', 'YEAR', 'NAME'], inplace=True)
+
         return df
 
     @staticmethod
-    def __get_cached_matches():
+    def __fetch_squad_pages(work_units, concurrency=None):
         """
-        Retrieves the match's snapshot.
+        Fetches the squad webpage of each (season year, club) pair.
+
+        :param list[tuple] work_units: Specify the (season year, club) pairs to be fetched
+        :param int concurrency: Specify the number of webpages fetched at the same time (sequential if None)
+        :return: A generator of (response, seconds taken to fetch it) pairs, ordered as the work units
         """
 
-        matches = pd.read_csv('cached_matches.csv', skiprows=1, dtype={'date': object,
-                                                                       'club1': str,
-                                                                       'SCORE': str,
-                                                                       'club2': str,
-                                                                       'DURATION': str,
-                                                                       'LOCATION': str,
-                                                                       'ATTENDANCE': str,
-                                                                       'TIME': str,
-                                                                       'TV': np.float})
+        urls = [SportsScraper.SQUAD_URL.format(club_id=club.club_id, league_url=club.league.url,
+                                               season_year=season_year)
+                for season_year, club in work_units]
 
-        matches['ATTENDANCE'] = pd.to_numeric(matches['ATTENDANCE'].str.replace(',', ''), downcast='integer')
-        matches['date'] = pd.to_datetime(matches['date']).dt.date
+        if concurrency is not None:
+            print(f'Fetching {len(urls)} squad pages, {concurrency} at a time...')
+            return AsyncFetchHandler.fetch_all(urls, concurrency=concurrency, timed=True)
 
-        return matches
+        def timed_pages():
+            for url in urls:
+                start = time.perf_counter()
+                res = HttpHandler.get_with_retries(url)
+                yield res, time.perf_counter() - start
+
+        return timed_pages()
 
     @staticmethod
-    def cache_matches():
+    def __get_cached_matches(columns=None, filters=None):
+        """
+        Retrieves the match's snapshot, imports it from cached_matches.csv if it has not been converted yet.
+
+        :param list[str] columns: Specify the columns to be loaded (all if None)
+        :param list[tuple] filters: Specify the (column, operator, value) conditions pushed down to the snapshot, only
+                                    the matching partitions are read
+        :return: A dataframe containing match results
+        """
+
+        if not os.path.exists('cached_matches.parquet'):
+            SportsScraper.__import_matches_csv()
+        else:
+            held_columns = SnapshotHandler.read_columns('cached_matches.parquet')
+            is_outdated = not all(x in held_columns for x in NormalizationHandler.MATCHES_RESULT_COLUMNS)
+
+            if not os.path.isdir('cached_matches.parquet') or is_outdated:
+                # Unpartitioned snapshot or snapshot without the result, rewrite it partitioned along with the result
+                matches = NormalizationHandler.normalize_matches(SnapshotHandler.read('cached_matches.parquet'))
+                SportsScraper.__write_matches_snapshot(matches,
+                                                       SnapshotHandler.read_timestamp('cached_matches.parquet'))
+
+        with StageTimerHandler.measure('load'):
+            df = SnapshotHandler.read('cached_matches.parquet', columns, filters)
+
+        # The YEAR column only serves as the partition key
+        if columns is None or 'YEAR' not in columns:
+            df = df.drop(columns='YEAR', errors='ignore')
+
+        return df
+
+    @staticmethod
+    def cache_matches(start_date=datetime.date(2002, 10, 1), end_date=None, incremental=False, workers=None):
         """
         Collects a snapshot of the matches for faster fetch in the future.
+
+        The crawled days are checkpointed in cached_matches.journal, hence, an interrupted collection resumes where it
+        stopped once it is invoked again with the same parameters, the journal is deleted once the snapshot is stored.
+        Days which had not ended when they were checkpointed are crawled again.
+
+        :param datetime.date start_date: Specify the start date of the snapshot
+        :param datetime.date end_date: Specify the end date of the snapshot (2022-05-29 if None, today if incremental)
+        :param bool incremental: Only crawls the days missing from the existing snapshot as well as the days since the
+                                 snapshot was taken, then merges them into the snapshot
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
         """
 
-        matches = SportsScraper.scrap_matches(start_date=datetime.date(2002, 10, 1),
-                                              end_date=datetime.date(2022, 5, 29))
+        if end_date is None:
+            end_date = datetime.date.today() if incremental else datetime.date(2022, 5, 29)
 
-        f = open('cached_matches.csv', "w+")
-        f.write(f'# Timestamp: {datetime.datetime.utcnow()}\n')
-        f.close()
+        journal = CrawlJournal('cached_matches.journal',
+                               {'start_date': start_date.isoformat(), 'end_date': end_date.isoformat(),
+                                'incremental': incremental},
+                               SportsScraper.__is_final_day)
 
-        # noinspection PyTypeChecker
-        matches.to_csv('cached_matches.csv', index=False, mode='a')
+        if not incremental or not (os.path.exists('cached_matches.parquet') or os.path.exists('cached_matches.csv')):
+            matches = SportsScraper.__scrap_matches(start_date, end_date, workers=workers, journal=journal)
+            SportsScraper.__write_matches_snapshot(matches)
+            journal.remove()
+            return
+
+        snapshot = SportsScraper.__get_cached_matches()
+        timestamp = SnapshotHandler.read_timestamp('cached_matches.parquet')
+
+        # Days on or after the snapshot's timestamp may have contained unfinished matches, hence, they are crawled again
+        stale_day = timestamp.strftime('%Y%m%d') if timestamp is not None else '00000000'
+        held_days = set(snapshot['date'].dt.strftime('%Y%m%d'))
+        days = [day for day in DateTimeHandler.get_dates_between(start_date, end_date)
+                if day not in held_days or day >= stale_day]
+
+        print(f'Crawling {len(days)} missing or stale day(s)...')
+
+        if not days:
+            return
+
+        matches = SportsScraper.__scrap_matches_days(days, workers=workers, journal=journal)
+
+        snapshot = snapshot[~snapshot['date'].isin(pd.to_datetime(days, format='%Y%m%d'))]
+        matches = pd.concat([snapshot.astype({'club1': object, 'club2': object}), matches], ignore_index=True)
+        matches['date'] = pd.to_datetime(matches['date'])
+        matches = matches.sort_values('date', kind='mergesort').reset_index(drop=True)
+
+        SportsScraper.__write_matches_snapshot(matches)
+        journal.remove()
 
     @staticmethod
-    def scrap_matches(start_date=None, end_date=None, fast_fetch=False):
+    def __import_matches_csv():
+        """
+        Converts cached_matches.csv into the columnar matches snapshot.
+        """
+
+        matches = NormalizationHandler.normalize_matches(SnapshotHandler.read_csv('cached_matches.csv', dtype=str))
+
+        SportsScraper.__write_matches_snapshot(matches, SnapshotHandler.read_csv_timestamp('cached_matches.csv'))
+
+    @staticmethod
+    def __write_matches_snapshot(matches, timestamp=None):
+        """
+        Writes the columnar matches snapshot with its final dtypes, partitioned by year.
+
+        :param pd.DataFrame matches: Specify the normalized matches (see NormalizationHandler.normalize_matches)
+        :param datetime.datetime timestamp: Specify the time in which the snapshot was collected (now if None)
+        """
+
+        matches = matches.copy()
+
+        # Matches are stored sorted by date, hence, they are loaded into the match store as they are
+        matches['date'] = pd.to_datetime(matches['date'])
+        matches = matches.sort_values('date', kind='mergesort').reset_index(drop=True)
+        matches['YEAR'] = matches['date'].dt.year
+        matches['ATTENDANCE'] = NormalizationHandler.attendance_to_integers(matches['ATTENDANCE'])
+        for col in ['club1_score', 'club2_score']:
+            matches[col] = matches[col].astype('Int64')
+        matches['outcome'] = matches['outcome'].astype(pd.CategoricalDtype(NormalizationHandler.OUTCOMES))
+        for col in ['club1', 'club2']:
+            matches[col] = matches[col].astype('category')
+        for col in ['SCORE', 'DURATION', 'LOCATION', 'TIME', 'TV']:
+            matches[col] = matches[col].astype(object).where(matches[col].notna(), None)
+
+        with StageTimerHandler.measure('persist'):
+            SnapshotHandler.write(matches, 'cached_matches.parquet', timestamp, partition_cols=['YEAR'])
+
+        # The index of the matches of each club is built again out of the new snapshot once it is loaded
+        if os.path.exists('cached_matches.clubs.npz'):
+            os.remove('cached_matches.clubs.npz')
+
+    @staticmethod
+    def import_csv_snapshots():
+        """
+        Converts cached_matches.csv and cached_players.csv (whichever exists) into the columnar snapshots.
+        """
+
+        if os.path.exists('cached_matches.csv'):
+            SportsScraper.__import_matches_csv()
+
+        if os.path.exists('cached_players.csv'):
+            SportsScraper.__import_players_csv()
+
+    @staticmethod
+    def export_csv_snapshots():
+        """
+        Exports the columnar snapshots (whichever exists) into cached_matches.csv and cached_players.csv.
+        """
+
+        if os.path.exists('cached_matches.parquet'):
+            matches = SportsScraper.__get_cached_matches()
+            SnapshotHandler.write_csv(matches, 'cached_matches.csv',
+                                      SnapshotHandler.read_timestamp('cached_matches.parquet'))
+
+        if os.path.exists('cached_players.parquet'):
+            players = SportsScraper.__get_cached_players().set_index(['LEAGUE', 'CLUB', 'YEAR', 'NAME'])
+            SnapshotHandler.write_csv(players, 'cached_players.csv',
+                                      SnapshotHandler.read_timestamp('cached_players.parquet'), index=True)
+
+    @staticmethod
+    def scrap_matches(start_date=None, end_date=None, fast_fetch=False, workers=None, columns=None):
         """
         Scraps data containing information about the results of the matches.
 
         :param datetime.date start_date: Specify the start date of the search
         :param datetime.date end_date: Specify the end date of the search
         :param bool fast_fetch: Retrieves matches from a saved snapshot instantly
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :param list[str] columns: Specify the columns loaded from the snapshot (all if None), only used by fast_fetch
         :return: An array of two dataframe containing match results (0: Elapsed, 1: Fixtures)
         """
 
-        if fast_fetch:
-            df = SportsScraper.__get_cached_matches()
+        if fast_fetch and (columns is None or 'YEAR' not in columns):
+            # The matches held in memory are sorted by date, the range is sliced out of them by binary search
+            df = SportsScraper.__get_match_store().get_matches(start_date, end_date, columns)
+            return SportsScraper.__remove_unused_categories(df.reset_index(drop=True))
+
+        elif fast_fetch:
+            # The partition key is only held by the snapshot, the YEAR conditions prune the partitions, while the date
+            # conditions filter the rows within them
+            filters = []
             if start_date is not None:
-                df = df[df.date >= start_date]
+                filters += [('YEAR', '>=', start_date.year), ('date', '>=', pd.Timestamp(start_date))]
             if end_date is not None:
-                df = df[df.date <= end_date]
-            return df
+                filters += [('YEAR', '<=', end_date.year), ('date', '<=', pd.Timestamp(end_date))]
+
+            df = SportsScraper.__get_cached_matches(columns, filters)
+            return SportsScraper.__remove_unused_categories(df)
 
         else:
-            return SportsScraper.__scrap_matches(start_date, end_date)
+            return SportsScraper.__scrap_matches(start_date, end_date, workers=workers)
+
+    @staticmethod
+    def scrap_club_matches(club, start_date=None, end_date=None, fast_fetch=False, workers=None, columns=None):
+        """
+        Scraps data containing information about the results of the matches played by a club.
+
+        The snapshot is held in memory along with an index of the matches of each club, hence, with fast_fetch the
+        matches are retrieved in time proportional to their number instead of scanning the snapshot.
+
+        :param str club: Specify the club
+        :param datetime.date start_date: Specify the start date of the search
+        :param datetime.date end_date: Specify the end date of the search
+        :param bool fast_fetch: Retrieves matches from a saved snapshot instantly
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe containing the results of the matches, whether the club is club1 or club2
+        """
+
+        if fast_fetch:
+            store = SportsScraper.__get_match_store()
+        else:
+            store = MatchStore(SportsScraper.__scrap_matches(start_date, end_date, workers=workers))
+
+        df = store.get_club_matches(club, start_date, end_date, columns)
+
+        return SportsScraper.__remove_unused_categories(df.reset_index(drop=True))
+
+    @staticmethod
+    def scrap_head_to_head(club_a, club_b, start_date=None, end_date=None, fast_fetch=False, workers=None,
+                           columns=None):
+        """
+        Scraps data containing information about the results of the matches played between two clubs.
+
+        The snapshot is held in memory along with an index of the matches of each pair of clubs, hence, with fast_fetch
+        the matches are retrieved by a lookup instead of scanning the snapshot.
+
+        :param str club_a: Specify a club of the pair
+        :param str club_b: Specify the other club of the pair
+        :param datetime.date start_date: Specify the start date of the search
+        :param datetime.date end_date: Specify the end date of the search
+        :param bool fast_fetch: Retrieves matches from a saved snapshot instantly
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :param list[str] columns: Specify the columns to be retrieved (all if None)
+        :return: A dataframe containing the results of the matches, whichever of the clubs is club1
+        """
+
+        if fast_fetch:
+            store = SportsScraper.__get_match_store()
+        else:
+            store = MatchStore(SportsScraper.__scrap_matches(start_date, end_date, workers=workers))
+
+        df = store.get_head_to_head(club_a, club_b, start_date, end_date, columns)
+
+        return SportsScraper.__remove_unused_categories(df.reset_index(drop=True))
+
+    @staticmethod
+    def __get_match_store():
+        """
+        Retrieves the matches snapshot held in memory, loads it if it is not held or has changed since.
+
+        The index of the matches of each club is read from cached_matches.clubs.npz, it is built and saved there if it
+        is missing or has been built out of another snapshot.
+
+        :return: A MatchStore object
+        """
+
+        def get_signature():
+            stat = os.stat('cached_matches.parquet')
+            return stat.st_ino, stat.st_mtime_ns
+
+        held = SportsScraper.__match_store
+        if held is not None and os.path.exists('cached_matches.parquet') and held[0] == get_signature():
+            return held[1]
+
+        # Loading imports or upgrades the snapshot if needed, hence, the signature is taken afterwards
+        matches = SportsScraper.__get_cached_matches()
+
+        # The snapshot's timestamp changes whenever it is written, the positions are those of the matches sorted by date
+        key = f'{SnapshotHandler.read_timestamp("cached_matches.parquet")}/{len(matches)}/date'
+        club_index = ClubIndex.load('cached_matches.clubs.npz', key)
+        store = MatchStore(matches, club_index)
+        if club_index is None:
+            store.club_index.save('cached_matches.clubs.npz', key)
+
+        SportsScraper.__match_store = (get_signature(), store)
+
+        return store
 
     @staticmethod
     def __scrap_matches(start_date=datetime.date.today() - datetime.timedelta(days=7),
                         end_date=datetime.date.today(),
-                        request_tries=8):
+                        request_tries=8,
+                        workers=None,
+                        shard_size=30,
+                        backoff=0.5,
+                        journal=None):
         """
         Scraps data containing information about the results of the matches.
 
         :param datetime.date start_date: Specify the start date of the search
         :param datetime.date end_date: Specify the end date of the search
         :param int request_tries: Determine to number of tries for each webpage request whenever it fails
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :param int shard_size: Specify the number of consecutive days handed to a worker at once
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param CrawlJournal journal: Specify the journal which records the crawled days, the days it holds are not
+                                     crawled again (no journal if None)
         :return: An array of two dataframe containing match results (0: Elapsed, 1: Fixtures)
         """
 
         if start_date > end_date:
             raise ValueError('start_date cannot be less than end_date')
 
-        elapsed_matches_df = pd.DataFrame()
-        fixtures_list_df = pd.DataFrame()
+        days_between = DateTimeHandler.get_dates_between(start_date, end_date)
 
-        processed = 0
+        return SportsScraper.__scrap_matches_days(days_between, request_tries, workers, shard_size, backoff, journal)
+
+    @staticmethod
+    def __scrap_matches_days(days_between, request_tries=8, workers=None, shard_size=30, backoff=0.5, journal=None):
+        """
+        Scraps data containing information about the results of the matches played in the given days.
+
+        :param list[str] days_between: Specify the days to be crawled in %Y%m%d format
+        :param int request_tries: Determine to number of tries for each webpage request whenever it fails
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :param int shard_size: Specify the number of consecutive days handed to a worker at once
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param CrawlJournal journal: Specify the journal which records the crawled days, the days it holds are not
+                                     crawled again (no journal if None)
+        :return: An array of two dataframe containing match results (0: Elapsed, 1: Fixtures)
+        """
+
+        missing_days = [day for day in days_between if journal is None or day not in journal]
+        missing_days_set = set(missing_days)
+
+        MetricsHandler.start(len(days_between), 'days')
+        MetricsHandler.complete(len(days_between) - len(missing_days))
+
+        if workers is None:
+            crawled_data = (SportsScraper.__crawl_matches_day(day, request_tries, backoff, journal)
+                            for day in missing_days)
+        else:
+            crawled_data = SportsScraper.__crawl_matches_days_in_parallel(missing_days, request_tries, workers,
+                                                                          shard_size, backoff, journal)
+
+        def merge_with_journal():
+            try:
+                for day in days_between:
+                    yield next(crawled_data) if day in missing_days_set else journal.get_rows(day)
+            finally:
+                if journal is not None:
+                    journal.flush()
+
+        try:
+            return SportsScraper.__build_matches_frame(merge_with_journal())
+        finally:
+            MetricsHandler.finish()
+
+    @staticmethod
+    def iter_matches(start_date=None, end_date=None, workers=None):
+        """
+        Scraps data containing information about the results of the matches, yielding the matches of each day as soon
+        as its fixtures webpage is parsed.
+
+        Only a bounded number of days is crawled ahead of the consumer, hence, the consumer can write the batches to
+        disk, aggregate them or stop early without holding the whole result. Days without matches are skipped.
+
+        :param datetime.date start_date: Specify the start date of the search (a week ago if None)
+        :param datetime.date end_date: Specify the end date of the search (today if None)
+        :param int workers: Specify the number of workers crawling the days in parallel (sequential if None)
+        :return: A generator of dataframes containing the match results of a day (elapsed ones first)
+        """
+
+        if start_date is None:
+            start_date = datetime.date.today() - datetime.timedelta(days=7)
+        if end_date is None:
+            end_date = datetime.date.today()
+
+        if start_date > end_date:
+            raise ValueError('start_date cannot be less than end_date')
 
         days_between = DateTimeHandler.get_dates_between(start_date, end_date)
 
-        for singleDay in days_between:
-            data = []
-            print(ProgressHandler.show_progress(processed, len(days_between)))
-            processed += 1
-            # Partially prevents scraping detection
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-            res = requests.get(
-                f'https://www.espn.in/football/fixtures/_/'
-                f'date/{singleDay}',
-                headers=headers)
-            soup = bs4.BeautifulSoup(res.text, 'html.parser')
-            tables = soup.find_all('tbody')
-
-            tries = 0
-            print(singleDay)
-            while soup.find('h1', {'class': 'Error404__Title'}) is not None and tries < request_tries:
-                print(f'try {tries + 1}')
-                tries += 1
-                headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-                res = requests.get(
-                    f'https://www.espn.in/football/fixtures/_/'
-                    f'date/{singleDay}',
-                    headers=headers)
-                soup = bs4.BeautifulSoup(res.text, 'html.parser')
-                tables = soup.find_all('tbody')
-
-            if tries == request_tries:
-                print('giving up...')
-
-            if not tables:
-                continue
-
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cols = row.find_all('td')
-                    if cols:  # If column is not empty
-                        arr = [DateTimeHandler.year_month_day_to_date(singleDay)]
-                        for col in np.arange(0, len(cols)):
-                            if cols[col].find('small'):
-                                continue
-                            if col == 0:
-                                club1 = cols[col].find('span').text
-                                result = cols[col].find_all('a')[-1].text
-                                arr.append(club1)
-                                arr.append(result)
-                            elif col == 1:
-                                club2 = cols[col].find_all('span')[-1].text
-                                arr.append(club2)
-                            elif col == 2:
-                                if cols[col].get('data-date'):
-                                    date = datetime.datetime.strptime(cols[col].get('data-date'), '%Y-%m-%dT%H:%MZ')
-                                    arr.append('{:d}:{:02d}'.format(date.hour, date.minute))
-                                else:
-                                    arr.append(cols[col].find('a').text)
-                            else:
-                                arr.append(cols[col].text)
-                        data.append(arr)
-
-            data = list(filter(lambda x: len(x) != 1, data))
-
-            elapsed_matches_list = list(filter(lambda x: x[4] != 'LIVE' or ':' not in x[4], data))
-            fixtures_list = list(filter(lambda x: x[4] == 'LIVE' or ':' in x[4], data))
-
-            elapsed_matches_df = elapsed_matches_df.append(elapsed_matches_list)
-            fixtures_list_df = fixtures_list_df.append(fixtures_list)
-
-        if elapsed_matches_df.empty:
-            elapsed_matches_df = pd.DataFrame(np.empty((0, 7)))
-        if fixtures_list_df.empty:
-            fixtures_list_df = pd.DataFrame(np.empty((0, 6)))
-
-        elapsed_matches_df.columns = ['date', 'club1', 'SCORE', 'club2', 'DURATION', 'LOCATION', 'ATTENDANCE']
-        fixtures_list_df.columns = ['date', 'club1', 'SCORE', 'club2', 'TIME', 'TV']
-
-        df = elapsed_matches_df.append(fixtures_list_df)
-
-        df = df.replace(r'^\s*$', np.nan, regex=True) \
-            .replace('--', np.nan) \
-            .fillna(value=np.nan) \
-            .dropna(thresh=3) \
-            .reset_index(drop=True)
-
-        df = df.replace(r'^\s*$', np.nan, regex=True) \
-            .replace('--', np.nan) \
-            .fillna(value=np.nan) \
-            .dropna(thresh=3) \
-            .reset_index(drop=True)
-
-        ProgressHandler.reset_progress()
+        MetricsHandler.start(len(days_between), 'days')
+
+        if workers is None:
+            days_data = (SportsScraper.__crawl_matches_day(day) for day in days_between)
+        else:
+            days_data = SportsScraper.__crawl_matches_days_in_parallel(days_between, workers=workers)
+
+        try:
+            for data in days_data:
+                df = SportsScraper.__build_matches_frame([data])
+                if not df.empty:
+                    yield df
+        finally:
+            days_data.close()
+            MetricsHandler.finish()
+
+    @staticmethod
+    def __build_matches_frame(days_data):
+        """
+        Builds the matches dataframe out of the rows of the given days, the elapsed matches precede the fixtures.
+
+        :param iterable days_data: Specify the match rows of each day (None for the days which could not be fetched)
+        :return: A dataframe containing match results
+        """
+
+        elapsed_columns = ['date', 'club1', 'SCORE', 'club2', 'DURATION', 'LOCATION', 'ATTENDANCE']
+        fixtures_columns = ['date', 'club1', 'SCORE', 'club2', 'TIME', 'TV']
+        matches = RowBuffer(elapsed_columns)
+
+        for data in days_data:
+            if data is not None:  # None if the day's webpage could not be fetched
+                matches.extend(data)
+
+        with StageTimerHandler.measure('normalize'):
+            # The rows of all days are split at once on their fifth value (the duration or the kick-off time)
+            df = matches.to_frame()
+            status = df['DURATION'].astype(str)
+            is_live = status == 'LIVE'
+            has_time = status.str.contains(':', regex=False)
+
+            elapsed_matches = df[~is_live | ~has_time]
+            fixtures_list = df[is_live | has_time].iloc[:, :len(fixtures_columns)]
+            fixtures_list.columns = fixtures_columns
+
+            df = NormalizationHandler.normalize_matches(pd.concat([elapsed_matches, fixtures_list]))
+
+        return df
+
+    @staticmethod
+    def __crawl_matches_days_in_parallel(days, request_tries=8, workers=8, shard_size=30, backoff=0.5, journal=None):
+        """
+        Splits the days into shards which are crawled by a pool of workers, each worker retries its own days.
+
+        :param list[str] days: Specify the days to be crawled in %Y%m%d format
+        :param int request_tries: Determine to number of tries for each webpage request whenever it fails
+        :param int workers: Specify the number of workers crawling the shards in parallel
+        :param int shard_size: Specify the number of consecutive days handed to a worker at once
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param CrawlJournal journal: Specify the journal which records each day as soon as it is crawled (no journal if
+                                     None)
+        :return: A generator of the match rows of each day, ordered by date
+        """
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('workers must be a positive integer')
+
+        shards = DateTimeHandler.split_into_shards(days, shard_size)
+
+        def crawl_shard(shard):
+            return [SportsScraper.__crawl_matches_day(day, request_tries, backoff, journal) for day in shard]
+
+        # Shards are yielded in date order, while a window of shards is crawled ahead of the one being consumed
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for processed in range(len(shards)):
+                    while len(pending) < 2 * workers and processed + len(pending) < len(shards):
+                        pending.append(executor.submit(crawl_shard, shards[processed + len(pending)]))
+
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def __is_final_day(day, recorded_at):
+        """
+        Checks whether the matches of a day could not change anymore by the time they were recorded, that is, whether
+        the day had ended.
+
+        :param str day: Specify the day in %Y%m%d format
+        :param datetime.datetime recorded_at: Specify the time in which the matches were recorded
+        :return: True if the day had ended
+        """
+
+        return recorded_at >= datetime.datetime.strptime(day, '%Y%m%d') + datetime.timedelta(days=1)
+
+    @staticmethod
+    def __crawl_matches_day(day, request_tries=8, backoff=0.5, journal=None):
+        """
+        Fetches the fixtures webpage of a day, retrying with a jittered exponential backoff whenever it fails, then
+        parses it (in the parse pool if configured).
+
+        :param str day: Specify the day in %Y%m%d format
+        :param int request_tries: Determine to number of tries for each webpage request whenever it fails
+        :param float backoff: Specify the seconds waited before the first retry, doubled on each further retry
+        :param CrawlJournal journal: Specify the journal which records the day once it is crawled (no journal if None)
+        :return: A list of the day's match rows, None if the webpage could not be fetched
+        """
+
+        start = time.perf_counter()
+
+        # ESPN serves its error webpage instead of the fixtures whenever it is overwhelmed
+        res = HttpHandler.get_with_retries(SportsScraper.FIXTURES_URL.format(day=day), request_tries, backoff,
+                                           is_complete=lambda x: not HtmlParserHandler.is_error_page(x.text))
+        data = ParsePoolHandler.parse(HtmlParserHandler.parse_fixtures_page, res.text, day)
+
+        MetricsHandler.complete(seconds=time.perf_counter() - start)
+
+        if data is None:
+            print(f'Giving up on {day}...')
+        elif journal is not None:
+            # Days whose webpage could not be fetched are not recorded, hence, they are crawled again on resume
+            journal.record(day, data)
+
+        return data
+
+    @staticmethod
+    def __remove_unused_categories(df):
+        """
+        Removes the categories which no longer appear in a filtered snapshot.
+
+        :param pd.DataFrame df: Specify the filtered snapshot
+        :return: The dataframe without the unused categories
+        """
+
+        df = df.copy()
+        for col in df.select_dtypes('category').columns:
+            df[col] = df[col].cat.remove_unused_categories()
+
         return df